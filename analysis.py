@@ -0,0 +1,239 @@
+"""
+Exact probability calculations for the game of blackjack as played by class Game.
+Cards are described by their value: an ace is 1 and every ten and face card is 10.
+A composition is a tuple of 10 numbers, the amount of cards left of every value, where composition[value - 1] belongs to value.
+"""
+from functools import lru_cache
+
+DEALER_STANDS_ON = 17  # The dealer stands on any 17, soft or hard (see Game.dealer_draws)
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, 'bust')  # What the numbers returned by dealer_outcomes belong to
+BUST = 5  # The place of a bust in DEALER_OUTCOMES
+PERFECT_PLAY_DEPTH = 1  # The cards Game.hit_stand_evs follows exactly before finishing the hand with upcard_table
+
+
+def hand_value(hardTotal, hasAce):
+    """
+    Gives the value of a hand, counting one ace as 11 when that does not go over 21
+
+    :param hardTotal: The value of the hand with every ace counted as 1
+    :param hasAce: True if there is at least one ace in the hand
+    :return: The value of the hand
+    """
+    if hasAce and hardTotal <= 11:
+        return hardTotal + 10
+    return hardTotal
+
+
+@lru_cache(maxsize=2 ** 17)
+def dealer_draw(hardTotal, hasAce, composition):
+    """
+    Works out the chance of every final dealer total when the dealer keeps drawing from the given composition.
+    Every card the dealer can draw is followed recursively, the results are cached so the same hand is never worked out twice.
+    A dealer that runs out of cards before reaching 17 is counted as bust, this only happens with almost empty compositions.
+
+    :param hardTotal: The dealer's current total with every ace counted as 1
+    :param hasAce: True if the dealer has an ace
+    :param composition: The cards left to draw from
+    :return: A tuple with the chance of every outcome in DEALER_OUTCOMES
+    """
+    value = hand_value(hardTotal, hasAce)
+    outcomes = [0.0] * 6
+    if value > 21:
+        outcomes[BUST] = 1.0
+        return tuple(outcomes)
+    if value >= DEALER_STANDS_ON:
+        outcomes[value - DEALER_STANDS_ON] = 1.0
+        return tuple(outcomes)
+
+    remaining = sum(composition)
+    if remaining == 0:
+        outcomes[BUST] = 1.0
+        return tuple(outcomes)
+    for index, count in enumerate(composition):
+        if count:
+            nextComposition = composition[:index] + (count - 1,) + composition[index + 1:]
+            chance = count / remaining
+            for outcome, p in enumerate(dealer_draw(hardTotal + index + 1, hasAce or index == 0, nextComposition)):
+                outcomes[outcome] += chance * p
+    return tuple(outcomes)
+
+
+@lru_cache(maxsize=4096)
+def dealer_outcomes(upcard, composition, peeked=False):
+    """
+    Gives the chance of every final dealer total for the given upcard, the dealer's hidden card is drawn from the composition.
+    Game.first_check ends the round when the dealer has blackjack, so once the players are playing it is known the dealer doesn't have it.
+    With peeked set to True the hidden card is therefore never the card that would have made blackjack.
+
+    :param upcard: The value of the dealer's visible card (1 for an ace)
+    :param composition: The cards that have not been seen, including the dealer's hidden card
+    :param peeked: True if the dealer is known not to have blackjack
+    :return: A tuple with the chance of every outcome in DEALER_OUTCOMES
+    """
+    if not peeked or upcard not in (1, 10):
+        return dealer_draw(upcard, upcard == 1, composition)
+
+    blocked = 9 if upcard == 1 else 0  # An ace can't have a ten under it and a ten can't have an ace under it
+    remaining = sum(composition) - composition[blocked]
+    if remaining == 0:
+        return dealer_draw(upcard, upcard == 1, composition)
+    outcomes = [0.0] * 6
+    for index, count in enumerate(composition):
+        if count and index != blocked:
+            nextComposition = composition[:index] + (count - 1,) + composition[index + 1:]
+            chance = count / remaining
+            for outcome, p in enumerate(dealer_draw(upcard + index + 1, upcard == 1 or index == 0, nextComposition)):
+                outcomes[outcome] += chance * p
+    return tuple(outcomes)
+
+
+def full_composition(decks):
+    """
+    Gives the composition of a full card-shoe
+
+    :param decks: The amount of decks in the card-shoe
+    :return: The composition of the card-shoe
+    """
+    return (4 * decks,) * 9 + (16 * decks,)
+
+
+def remove_cards(composition, *values):
+    """
+    Takes cards out of a composition
+
+    :param composition: The composition to take the cards from
+    :param values: The values of the cards to take out
+    :return: The new composition
+    """
+    counts = list(composition)
+    for value in values:
+        counts[value - 1] -= 1
+    return tuple(counts)
+
+
+def stand_ev(playerValue, dealer):
+    """
+    Gives the expected value of standing, in bets won or lost.
+    The player wins their bet when the dealer busts or ends lower and loses it otherwise,
+    a tie is lost as well (see Game.showdown).
+
+    :param playerValue: The value of the player's hand
+    :param dealer: The chance of every outcome in DEALER_OUTCOMES
+    :return: The expected value of standing
+    """
+    if playerValue > 21:
+        return -1.0
+    win = dealer[BUST]
+    for outcome in range(min(max(playerValue - DEALER_STANDS_ON, 0), BUST)):
+        win += dealer[outcome]
+    return 2 * win - 1
+
+
+@lru_cache(maxsize=2 ** 16)
+def hand_evs(hardTotal, hasAce, upcard, composition, peeked=True, depth=None):
+    """
+    Gives the exact expected value of standing and of hitting for a player's hand.
+    After hitting the player keeps playing the best way possible, so every card they can draw is followed recursively,
+    each time with the card taken out of the composition the dealer draws from as well.
+    The hand is only described by its hard total and whether it holds an ace, the cards in it have already been taken out of the composition,
+    so every hand with the same total and composition shares one cached result.
+
+    :param hardTotal: The player's total with every ace counted as 1
+    :param hasAce: True if the player has an ace
+    :param upcard: The value of the dealer's visible card (1 for an ace)
+    :param composition: The cards that have not been seen, including the dealer's hidden card
+    :param peeked: True if the dealer is known not to have blackjack
+    :param depth: The amount of cards followed exactly, after that the hand is finished with upcard_table.
+    None follows every card exactly, which takes about a third of a second for a fresh six deck composition.
+    :return: A tuple with the expected value of standing and of hitting
+    """
+    if depth == 0:
+        return upcard_table(upcard, composition, peeked)[(hardTotal, hasAce)]
+    value = hand_value(hardTotal, hasAce)
+    stand = stand_ev(value, dealer_outcomes(upcard, composition, peeked))
+    if value > 21:
+        return stand, -1.0
+
+    remaining = sum(composition)
+    if remaining == 0:
+        return stand, stand
+    hit = 0.0
+    for index, count in enumerate(composition):
+        if count:
+            chance = count / remaining
+            newTotal = hardTotal + index + 1
+            if newTotal > 21:
+                hit -= chance
+            else:
+                nextComposition = composition[:index] + (count - 1,) + composition[index + 1:]
+                hit += chance * max(hand_evs(newTotal, hasAce or index == 0, upcard, nextComposition, peeked,
+                                             None if depth is None else depth - 1))
+    return stand, hit
+
+
+def should_hit(hardTotal, hasAce, upcard, composition, peeked=True):
+    """
+    Checks if hitting is worth more than standing (see hand_evs)
+
+    :param hardTotal: The player's total with every ace counted as 1
+    :param hasAce: True if the player has an ace
+    :param upcard: The value of the dealer's visible card (1 for an ace)
+    :param composition: The cards that have not been seen, including the dealer's hidden card
+    :param peeked: True if the dealer is known not to have blackjack
+    :return: True if the player should hit, False if they should stand
+    """
+    stand, hit = hand_evs(hardTotal, hasAce, upcard, composition, peeked)
+    return hit > stand
+
+
+@lru_cache(maxsize=4096)
+def upcard_table(upcard, composition, peeked=True):
+    """
+    Works out the expected value of standing and hitting for every hand total against one dealer upcard.
+    This is an approximation: a row of the table is a hand total, not a set of cards,
+    so neither the cards in the hand nor the cards the player draws are taken out of the composition.
+    The dealer's chances are therefore worked out once and every entry is a single step from the entries above it,
+    which takes well under a millisecond. The results are cached by upcard and composition.
+
+    :param upcard: The value of the dealer's visible card (1 for an ace)
+    :param composition: The cards that have not been seen, including the dealer's hidden card
+    :param peeked: True if the dealer is known not to have blackjack
+    :return: Dictionary from (hardTotal, hasAce) to a tuple with the expected value of standing and of hitting
+    """
+    remaining = sum(composition)
+    dealer = dealer_outcomes(upcard, composition, peeked)
+    chances = [count / remaining for count in composition] if remaining else [0.0] * 10
+    table = {}
+    best = {}
+    for hardTotal in range(21, 1, -1):
+        for hasAce in (True, False):
+            stand = stand_ev(hand_value(hardTotal, hasAce), dealer)
+            hit = 0.0 if remaining else stand
+            for index, chance in enumerate(chances):
+                newTotal = hardTotal + index + 1
+                if newTotal > 21:
+                    hit -= chance
+                else:
+                    hit += chance * best[(newTotal, hasAce or index == 0)]
+            best[(hardTotal, hasAce)] = max(stand, hit)
+            table[(hardTotal, hasAce)] = (stand, hit)
+    return table
+
+
+def strategy_table(composition, peeked=True):
+    """
+    Works out the expected value of standing and hitting for every hand total against every dealer upcard for one state of the card-shoe.
+    The values are approximate, see upcard_table: the cards in the hand and the cards the player draws are not taken out of
+    the composition, which is what makes a whole table take milliseconds. Use hand_evs for the exact values of a specific hand.
+
+    :param composition: The cards that have not been seen
+    :param peeked: True if the dealer is known not to have blackjack
+    :return: Dictionary from (hardTotal, hasAce, upcard) to a tuple with the expected value of standing and of hitting
+    """
+    table = {}
+    for upcard in range(1, 11):
+        if composition[upcard - 1] == 0:
+            continue
+        for (hardTotal, hasAce), evs in upcard_table(upcard, remove_cards(composition, upcard), peeked).items():
+            table[(hardTotal, hasAce, upcard)] = evs
+    return table
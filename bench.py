@@ -0,0 +1,279 @@
+"""
+Benchmarks of the hot paths of the game: building card-shoes, drawing, the card-count queries, hand values, whole rounds
+and the decisions of the AI.
+Every benchmark is run a few times and the fastest run is kept, the results can be saved as JSON
+and compared against an earlier saved run to find the benchmarks that got slower.
+
+Run it from the command line:
+    python bench.py --save results.json
+    python bench.py --compare results.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import types
+
+from run import AIPlayer, AutoStrategy, CardShoe, Game, Person, SilentOutput
+import stats
+
+DECK_SIZES = (1, 2, 4, 6, 8, 15)  # The amounts of decks the card-shoe benchmarks are run with
+PENETRATIONS = (0, 25, 50, 75)  # The percentages of the card-shoe dealt before the count queries are timed
+SEATS = (1, 5)  # The amounts of players the round benchmarks are run with, 5 being the most the game allows
+AI_AMOUNTS = (3, 500)  # The amounts of AI the decision benchmarks are run with, a full table and a large table
+THRESHOLD = 0.10  # How much slower a benchmark may get before compare calls it a regression
+SEED = 0  # The seed of every card-shoe and game, so every run times the same cards
+
+
+def bench_shoe_build(decks):
+    """
+    :param decks: The amount of decks
+    :return: A function building and shuffling a card-shoe, and the amount of card-shoes it builds
+    """
+    cardShoe = CardShoe(randomStream=random.Random(SEED))
+
+    def run():
+        cardShoe.blank_shoe()
+        cardShoe.create_shoe(decks)
+    return run, 1
+
+
+def bench_draw(decks):
+    """
+    :param decks: The amount of decks
+    :return: A function drawing a whole card-shoe two cards at a time, and the amount of cards it draws
+    """
+    cardShoe = CardShoe(randomStream=random.Random(SEED))
+    cardShoe.create_shoe(decks)
+    codes = bytes(cardShoe.shoeCodes)
+
+    def run():
+        cardShoe.blank_shoe()
+        cardShoe.add_cards(codes)
+        for _ in range(len(codes) // 2):
+            cardShoe.draw(2)
+    return run, len(codes) // 2 * 2
+
+
+def bench_count_queries(penetration):
+    """
+    :param penetration: The percentage of the card-shoe that is dealt before the queries
+    :return: A function asking every card-count and the true count a thousand times, and the amount of queries it makes
+    """
+    cardShoe = CardShoe(randomStream=random.Random(SEED))
+    cardShoe.create_shoe(6)
+    cardShoe.draw(cardShoe.len_cardshoe() * penetration // 100)
+
+    def run():
+        for _ in range(1000):
+            cardShoe.current_HiLo_count()
+            cardShoe.current_Halves_count()
+            cardShoe.current_Zen_count()
+            stats.true_count_bucket(cardShoe)
+    return run, 4000
+
+
+def bench_hand_value(cards):
+    """
+    :param cards: The amount of cards in every hand
+    :return: A function working out the value of a thousand hands, and the amount of hands
+    """
+    cardShoe = CardShoe(randomStream=random.Random(SEED))
+    cardShoe.create_shoe(100)
+    people = []
+    for _ in range(1000):
+        person = Person(0, False, 1)
+        person.hand.add_cards(cardShoe.draw(cards))
+        people.append(person)
+
+    def run():
+        for person in people:
+            person.check_count()
+    return run, len(people)
+
+
+def bench_rounds(seats, withAI):
+    """
+    :param seats: The amount of players
+    :param withAI: True if the table is filled up with AI as well
+    :return: A function playing a hundred headless rounds, and the amount of rounds
+    """
+    game = Game(AutoStrategy(), SilentOutput(), seed=SEED)
+    game.setup(2, seats, 10 ** 12, 6)
+    if withAI:
+        game.fill_with_ai()
+        while game.listOfAI:
+            game.ai_joins(0)
+
+    def run():
+        for _ in range(100):
+            game.round()
+    return run, 100
+
+
+def per_ai_decisions(AIs, cardShoe):
+    """
+    Makes the bet, move and leave decisions one AI at a time from plain attributes, the way AIPlayer made them before AISeats.
+    This is the baseline bench_ai_decisions compares the passes over the arrays of AISeats with.
+
+    :param AIs: Objects with the attributes accuracy, risk, unit, leaveCounter, leaveCondition and person, the AI's Person
+    :param cardShoe: The card-shoe used to determine the true count
+    :return: The lists of bets, stand flags and leave flags
+    """
+    bets = []
+    standing = []
+    leaving = []
+    for AI in AIs:
+        decksRemaining = cardShoe.len_cardshoe() / 52
+        if cardShoe.current_HiLo_count() >= 0:
+            calculation = cardShoe.currentCardCount + AI.accuracy
+        else:
+            calculation = cardShoe.currentCardCount - AI.accuracy
+        bets.append(AI.unit if calculation <= 0 else int(decksRemaining / calculation * AI.unit))
+        standing.append(int(AI.person.check_count() >= AI.risk + 17))
+        leaving.append(AI.leaveCounter >= AI.leaveCondition)
+    return bets, standing, leaving
+
+
+def bench_ai_decisions(amount, batched):
+    """
+    :param amount: The amount of AI at the table
+    :param batched: True to decide with the passes over the arrays of AISeats, False to decide one AI at a time
+    :return: A function making the bet, move and leave decisions of every AI a hundred times, and the amount of decisions
+    """
+    game = Game(AutoStrategy(), SilentOutput(), seed=SEED)
+    game.setup(2, 0, 10 ** 12, amount // 26 + 1)  # Enough decks to deal every AI two cards
+    randomStream = random.Random(SEED)
+    AIs = [AIPlayer("Guest " + str(index + 1), randomStream.randint(-5, 20), randomStream.randint(-5, 3),
+                    randomStream.choice((1, 5, 10, 25, 50)), randomStream.randint(3, 10), seats=game.aiSeats)
+           for index in range(amount)]
+    cardShoe = game.cardShoe
+    for AI in AIs:
+        AI.hand.add_cards(cardShoe.draw(2))
+    aiSeats = game.aiSeats
+    seats = game.seats_of(AIs)
+    plain = [types.SimpleNamespace(accuracy=AI.accuracy, risk=AI.risk, unit=AI.unit, leaveCounter=AI.leaveCounter,
+                                   leaveCondition=AI.leaveCondition, person=AI) for AI in AIs]
+    decisions = (aiSeats.bet_sizes(seats, cardShoe), aiSeats.stand_flags(seats), aiSeats.leave_flags(seats))
+    if per_ai_decisions(plain, cardShoe) != decisions:
+        raise AssertionError("the batched decisions differ from the decisions made one AI at a time")
+
+    def run_batched():
+        for _ in range(100):
+            aiSeats.bet_sizes(seats, cardShoe)
+            aiSeats.stand_flags(seats)
+            aiSeats.leave_flags(seats)
+
+    def run_per_ai():
+        for _ in range(100):
+            per_ai_decisions(plain, cardShoe)
+    return (run_batched if batched else run_per_ai), 100 * 3 * amount
+
+
+def benchmarks():
+    """
+    Gives every benchmark of the suite
+
+    :return: A list of (name, function making the benchmark, arguments)
+    """
+    suite = []
+    for decks in DECK_SIZES:
+        suite.append(("shoe_build_" + str(decks) + "_decks", bench_shoe_build, (decks,)))
+    for decks in (1, 6):
+        suite.append(("draw_" + str(decks) + "_decks", bench_draw, (decks,)))
+    for penetration in PENETRATIONS:
+        suite.append(("count_queries_" + str(penetration) + "_percent", bench_count_queries, (penetration,)))
+    for cards in (2, 3, 5):
+        suite.append(("hand_value_" + str(cards) + "_cards", bench_hand_value, (cards,)))
+    for seats in SEATS:
+        suite.append(("rounds_" + str(seats) + "_seats", bench_rounds, (seats, False)))
+    suite.append(("rounds_full_table", bench_rounds, (max(SEATS), True)))
+    for amount in AI_AMOUNTS:
+        suite.append(("ai_decisions_" + str(amount) + "_batched", bench_ai_decisions, (amount, True)))
+        suite.append(("ai_decisions_" + str(amount) + "_per_ai", bench_ai_decisions, (amount, False)))
+    return suite
+
+
+def run_benchmarks(repeats=5, only=None):
+    """
+    Runs the benchmarks, each one repeats times, keeping the fastest time
+
+    :param repeats: The amount of times every benchmark is run
+    :param only: Only run the benchmarks with this text in their name, every benchmark when not given
+    :return: Dictionary from benchmark name to a dictionary with the fastest time per operation in seconds and operations per second
+    """
+    results = {}
+    for name, maker, arguments in benchmarks():
+        if only is not None and only not in name:
+            continue
+        function, operations = maker(*arguments)
+        best = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            seconds = time.perf_counter() - start
+            if best is None or seconds < best:
+                best = seconds
+        results[name] = {"seconds": best / operations, "perSecond": operations / best}
+    return results
+
+
+def compare(baseline, results, threshold=THRESHOLD):
+    """
+    Compares results against a baseline
+
+    :param baseline: The results of an earlier run
+    :param results: The results of this run
+    :param threshold: How much slower a benchmark may get before it counts as a regression, 0.1 being 10 percent
+    :return: A list of (name, ratio, regressed) for every benchmark in both, ratio being the new time divided by the baseline's
+    """
+    comparison = []
+    for name, result in results.items():
+        if name in baseline:
+            ratio = result["seconds"] / baseline[name]["seconds"]
+            comparison.append((name, ratio, ratio > 1 + threshold))
+    return comparison
+
+
+def main(arguments=None):
+    """
+    Runs the benchmark suite from the command line
+
+    :param arguments: The command line arguments, sys.argv when not given
+    :return: The exit code, 1 if a benchmark regressed against the baseline
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks of the blackjack hot paths")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare the results against this earlier saved JSON file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown before a regression, 0.1 is 10%%")
+    parser.add_argument("--repeats", type=int, default=5, help="times every benchmark is run, the fastest counts")
+    parser.add_argument("--only", help="only run benchmarks with this text in their name")
+    options = parser.parse_args(arguments)
+
+    results = run_benchmarks(options.repeats, options.only)
+    for name, result in results.items():
+        print(format(name, "<28") + format(result["perSecond"], ">14,.0f") + " per second")
+
+    if options.save:
+        with open(options.save, "w", encoding="utf-8") as file:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(), "results": results},
+                      file, indent=2)
+
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = 0
+        print("-" * 45)
+        for name, ratio, regressed in compare(baseline, results, options.threshold):
+            print(format(name, "<28") + format(ratio, ">8.2f") + "x" + ("  REGRESSION" if regressed else ""))
+            regressions += regressed
+        if regressions:
+            print(str(regressions) + " benchmark(s) got slower than the baseline.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
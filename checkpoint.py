@@ -0,0 +1,339 @@
+"""
+Checkpoints of a whole game, so a long simulation or session can be picked up again after the process stops.
+
+A checkpoint is taken between two rounds and holds everything the next rounds depend on: the card-shoe with its order,
+draw index, discard tally and running counts, every player and AI with their money, pot and statistics,
+the arrays of the game's AISeats and the state of the game's random number streams.
+It is a compact binary encoding built with struct, a checkpoint of a six deck game with every AI is a few kilobytes
+and takes well under a millisecond to make, so it can be taken every few rounds.
+"""
+import os
+import struct
+from array import array
+
+from run import AIPlayer, Game, Person, SeatHandState
+
+HEADER = b'BJSNAP02'  # The first 8 bytes of every checkpoint
+CHECKPOINT_EVERY = 100  # The amount of rounds between two checkpoints taken by run
+GAME = struct.Struct('<B???IbHI')  # typeOfCount, gameTrue, showCount, showDecks, roundsPlayed, betBucket, startingDecks, maxAI
+SHOE = struct.Struct('<?IIQ13I13Q')  # keepDiscard, length, drawIndex, countedCards, rankCounts, discardTally
+RANDOM = struct.Struct('<B625I?d')  # version, Mersenne Twister state, whether a gauss value is kept, the gauss value
+PERSON = struct.Struct('<iqq')  # number, money, pot, the number is signed as AI numbers are negative
+STATS = struct.Struct('<QQQQQddqqqqH')  # hands, wins, losses, pushes, blackjacks, mean, squares, net, peak, trough,
+# maxDrawdown and the amount of count buckets
+BUCKET = struct.Struct('<bQq')  # bucket, hands, net
+COUNT = struct.Struct('<I')  # The amount of items that follow, or the length of a name, number or array
+SEAT_ARRAYS = ('accuracy', 'risk', 'unit', 'leaveCounter', 'leaveCondition', 'perfectPlay', 'tablePlay', 'hardTotal',
+               'aces')
+
+
+class CheckpointWriter:
+    """
+    Collects the encoded parts of a checkpoint
+
+    :attribute buffer: The bytes of the checkpoint so far
+    """
+
+    def __init__(self):
+        """
+        Initializes a checkpoint holding only the header
+        """
+        self.buffer = bytearray(HEADER)
+
+    def pack(self, layout, *values):
+        """
+        :param layout: The struct.Struct to pack the values with
+        :param values: The values
+        """
+        self.buffer += layout.pack(*values)
+
+    def raw(self, data):
+        """
+        Adds bytes of any length, preceded by their length
+
+        :param data: The bytes
+        """
+        self.buffer += COUNT.pack(len(data))
+        self.buffer += data
+
+    def number(self, value):
+        """
+        Adds a whole number of any size, such as a seed or the packed running counts of a card-shoe
+
+        :param value: The number
+        """
+        self.raw(value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True))
+
+    def stream(self, randomStream):
+        """
+        :param randomStream: The random.Random whose state is added
+        """
+        version, state, gauss = randomStream.getstate()
+        self.pack(RANDOM, version, *state, gauss is not None, gauss or 0.0)
+
+    def stats(self, handStats):
+        """
+        :param handStats: The stats.HandStats to add
+        """
+        self.pack(STATS, handStats.hands, handStats.wins, handStats.losses, handStats.pushes, handStats.blackjacks,
+                  handStats.mean, handStats.squares, handStats.net, handStats.peak, handStats.trough,
+                  handStats.maxDrawdown, len(handStats.countBuckets))
+        for bucket, (hands, net) in handStats.countBuckets.items():
+            self.pack(BUCKET, bucket, hands, net)
+
+    def players(self, players):
+        """
+        :param players: The list of players (of class Person) to add
+        """
+        self.pack(COUNT, len(players))
+        for player in players:
+            self.pack(PERSON, player.number, player.money, player.pot)
+            self.stats(player.stats)
+
+    def ai(self, AIs):
+        """
+        :param AIs: The list of AI to add, their attributes in the game's AISeats are added separately
+        """
+        self.pack(COUNT, len(AIs))
+        for AI in AIs:
+            self.pack(PERSON, AI.number, AI.money, AI.pot)
+            self.raw(AI.name.encode())
+            self.pack(COUNT, AI.seat)
+            self.stats(AI.stats)
+
+
+class CheckpointReader:
+    """
+    Reads the parts of a checkpoint in the order they were written
+
+    :attribute view: A memoryview on the checkpoint
+    :attribute offset: Where the next part starts
+    """
+
+    def __init__(self, data):
+        """
+        Initializes a reader at the start of the checkpoint
+
+        :param data: The bytes of the checkpoint
+        """
+        self.view = memoryview(data)
+        if bytes(self.view[:len(HEADER)]) != HEADER:
+            raise ValueError("not a blackjack checkpoint")
+        self.offset = len(HEADER)
+
+    def unpack(self, layout):
+        """
+        :param layout: The struct.Struct the values were packed with
+        :return: A tuple of the values
+        """
+        values = layout.unpack_from(self.view, self.offset)
+        self.offset += layout.size
+        return values
+
+    def raw(self):
+        """
+        :return: Bytes added with CheckpointWriter.raw
+        """
+        length, = self.unpack(COUNT)
+        data = bytes(self.view[self.offset:self.offset + length])
+        self.offset += length
+        return data
+
+    def number(self):
+        """
+        :return: A whole number added with CheckpointWriter.number
+        """
+        return int.from_bytes(self.raw(), 'little', signed=True)
+
+    def stream(self, randomStream):
+        """
+        :param randomStream: The random.Random the state is restored into
+        """
+        values = self.unpack(RANDOM)
+        randomStream.setstate((values[0], values[1:626], values[627] if values[626] else None))
+
+    def stats(self, handStats):
+        """
+        :param handStats: The stats.HandStats the statistics are restored into
+        """
+        (handStats.hands, handStats.wins, handStats.losses, handStats.pushes, handStats.blackjacks, handStats.mean,
+         handStats.squares, handStats.net, handStats.peak, handStats.trough, handStats.maxDrawdown,
+         buckets) = self.unpack(STATS)
+        handStats.countBuckets = {}
+        for _ in range(buckets):
+            bucket, hands, net = self.unpack(BUCKET)
+            handStats.countBuckets[bucket] = [hands, net]
+
+    def players(self):
+        """
+        :return: The list of players added with CheckpointWriter.players
+        """
+        players = []
+        for _ in range(self.unpack(COUNT)[0]):
+            number, money, pot = self.unpack(PERSON)
+            player = Person(money, False, number)
+            player.pot = pot
+            self.stats(player.stats)
+            players.append(player)
+        return players
+
+    def ai(self, seats):
+        """
+        :param seats: The restored AISeats of the game
+        :return: The list of AI added with CheckpointWriter.ai
+        """
+        AIs = []
+        for _ in range(self.unpack(COUNT)[0]):
+            number, money, pot = self.unpack(PERSON)
+            name = self.raw().decode()
+            seat, = self.unpack(COUNT)
+            AI = seated_ai(name, seats, seat)
+            AI.number = number
+            AI.money = money
+            AI.pot = pot
+            self.stats(AI.stats)
+            AIs.append(AI)
+        return AIs
+
+
+def seated_ai(name, seats, seat):
+    """
+    Makes an AI whose attributes are already stored in an AISeats, without giving it a new place in the arrays
+
+    :param name: The name of the AI
+    :param seats: The AISeats holding the AI's attributes
+    :param seat: The AI's place in the arrays
+    :return: The AIPlayer
+    """
+    AI = AIPlayer.__new__(AIPlayer)
+    Person.__init__(AI, 0, False, 0)
+    AI.name = name
+    AI.seats = seats
+    AI.seat = seat
+    AI.hand.handState = SeatHandState(seats, seat)
+    return AI
+
+
+def snapshot(game):
+    """
+    Encodes the state of a game between two rounds
+
+    :param game: The Game
+    :return: The bytes of the checkpoint
+    """
+    seats = game.aiSeats
+    for AI in game.artificialPlayers + game.artificialPlayersDiscard + game.listOfAI:
+        if AI.seats is not seats:
+            raise ValueError(AI.name + " is not stored in the AISeats of the game, seat them with Game.seats_of first")
+    writer = CheckpointWriter()
+    writer.number(game.seed)
+    writer.pack(GAME, game.typeOfCount, game.gameTrue, game.showCount, game.showDecks, game.roundsPlayed, game.betBucket,
+                game.startingDecks, game.maxAI)
+    writer.stream(game.randomStream)
+
+    cardShoe = game.cardShoe
+    writer.pack(SHOE, cardShoe.keepDiscard, len(cardShoe.shoeCodes), cardShoe.drawIndex, cardShoe.countedCards,
+                *cardShoe.rankCounts, *cardShoe.discardTally)
+    writer.buffer += cardShoe.shoeCodes
+    writer.raw("\n".join(system.name for system in cardShoe.countTable.systems).encode())
+    writer.number(cardShoe.packedCount)
+    writer.stream(cardShoe.randomStream)
+
+    writer.pack(COUNT, len(seats))
+    for name in SEAT_ARRAYS:
+        writer.raw(getattr(seats, name).tobytes())
+    writer.players(game.listPlayers)
+    writer.ai(game.artificialPlayers)
+    writer.ai(game.artificialPlayersDiscard)
+    writer.ai(game.listOfAI)
+    return bytes(writer.buffer)
+
+
+def restore(data, strategy=None, output=None, eventSink=None, shoePool=None):
+    """
+    Makes the game a checkpoint was taken of, ready to play the next round.
+    The strategy, output, event sink and pool are not part of a checkpoint and are given again like to Game.
+
+    :param data: The bytes of the checkpoint
+    :param strategy: The object answering the players decisions
+    :param output: The object the game is written to
+    :param eventSink: The sink the events of the game are emitted to
+    :param shoePool: The pool new card-shoes are taken from
+    :return: The restored Game
+    """
+    reader = CheckpointReader(data)
+    game = Game(strategy, output, eventSink, shoePool, reader.number())
+    (game.typeOfCount, game.gameTrue, game.showCount, game.showDecks, game.roundsPlayed, game.betBucket,
+     game.startingDecks, game.maxAI) = reader.unpack(GAME)
+    reader.stream(game.randomStream)
+
+    cardShoe = game.cardShoe
+    cardShoe.blank_shoe()  # Takes the count table of the registry as it is now and resets the hand state
+    values = reader.unpack(SHOE)
+    cardShoe.keepDiscard, length, cardShoe.drawIndex, cardShoe.countedCards = values[:4]
+    cardShoe.rankCounts = list(values[4:17])
+    cardShoe.discardTally = list(values[17:30])
+    cardShoe.shoeCodes = bytearray(reader.view[reader.offset:reader.offset + length])
+    reader.offset += length
+    systems = reader.raw().decode().split("\n")
+    registered = [system.name for system in cardShoe.countTable.systems]
+    if systems != registered:
+        raise ValueError("the checkpoint was taken with the count systems " + ", ".join(systems) + " registered, not " +
+                         ", ".join(registered))
+    cardShoe.packedCount = reader.number()
+    reader.stream(cardShoe.randomStream)
+
+    seats = game.aiSeats
+    amount, = reader.unpack(COUNT)
+    for name in SEAT_ARRAYS:
+        restored = array(getattr(seats, name).typecode)
+        restored.frombytes(reader.raw())
+        if len(restored) != amount:
+            raise ValueError("the checkpoint was taken on a machine with other sizes of numbers")
+        setattr(seats, name, restored)
+    game.listPlayers = reader.players()
+    game.artificialPlayers = reader.ai(seats)
+    game.artificialPlayersDiscard = reader.ai(seats)
+    game.listOfAI = reader.ai(seats)
+    game.load_tables()
+    return game
+
+
+def save(game, path):
+    """
+    Writes a checkpoint of the game to a file.
+    The checkpoint is written next to the file first and then put in its place, so a crash never leaves half a checkpoint.
+
+    :param game: The Game
+    :param path: The path of the checkpoint file
+    """
+    temporary = path + ".tmp"
+    with open(temporary, 'wb') as file:
+        file.write(snapshot(game))
+    os.replace(temporary, path)
+
+
+def load(path, strategy=None, output=None, eventSink=None, shoePool=None):
+    """
+    Restores the game from a checkpoint file (see restore)
+
+    :param path: The path of the checkpoint file
+    :return: The restored Game
+    """
+    with open(path, 'rb') as file:
+        return restore(file.read(), strategy, output, eventSink, shoePool)
+
+
+def run(game, path, every=CHECKPOINT_EVERY):
+    """
+    Plays rounds like Game.run, writing a checkpoint every given amount of rounds and when the game ends
+
+    :param game: The Game, set up or restored
+    :param path: The path of the checkpoint file
+    :param every: The amount of rounds between two checkpoints
+    """
+    while game.gameTrue:
+        game.round()
+        if game.roundsPlayed % every == 0:
+            save(game, path)
+    save(game, path)
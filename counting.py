@@ -0,0 +1,159 @@
+"""
+The registry of card-counting systems.
+A count system is declared by its tag for every rank, every registered system is compiled into a single lookup table
+in which the tags of all systems for a card are packed side by side into one integer, FIELD_BITS bits per system.
+Adding up these integers for the drawn cards updates the running counts of every system at once (see CardShoe.draw),
+so counting with ten systems costs about the same as counting with one.
+
+A system is known by its number, the place it was registered in, which is what Game.typeOfCount holds:
+0 for Zen Count, 1 for Halves and 2 for Hi-Lo like ask_count_type always gave, the other systems after that.
+"""
+
+FIELD_BITS = 32  # The bits every system gets in a packed count, enough for millions of cards between two resets
+FIELD_MASK = (1 << FIELD_BITS) - 1
+BIAS = 1 << 8  # Added to every tag in the packed table so no field ever goes below zero and borrows from the next one
+
+
+class CountSystem:
+    """
+    A card-counting system, the tag it gives to the cards of every rank
+
+    :attribute name: The name of the system
+    :attribute tags: The tag of every rank, from the two up to and including the ace
+    :attribute scale: What the tags are multiplied by to make them whole numbers, 2 for systems that use halves
+    :attribute scaledTags: The tags multiplied by the attribute scale
+    :attribute number: The number of the system in the registry, None until it is registered
+    """
+
+    def __init__(self, name, tags, scale=1):
+        """
+        Initializes a count system
+
+        :param name: The name of the system
+        :param tags: The tag of every rank, 13 numbers from the two up to and including the ace
+        :param scale: What the tags are multiplied by to make them whole numbers
+        """
+        if len(tags) != 13:
+            raise ValueError("a count system needs a tag for all 13 ranks")
+        scaledTags = tuple(int(round(tag * scale)) for tag in tags)
+        if any(scaled != tag * scale for scaled, tag in zip(scaledTags, tags)):
+            raise ValueError(name + " has tags that are not whole numbers after multiplying by " + str(scale))
+        if any(abs(scaled) >= BIAS for scaled in scaledTags):
+            raise ValueError(name + " has tags that are too large")
+        self.name = name
+        self.tags = tuple(tags)
+        self.scale = scale
+        self.scaledTags = scaledTags
+        self.number = None
+
+    def tag(self, rank):
+        """
+        :param rank: The rank of a card (2 up to and including 14 for the ace)
+        :return: The tag of the card in this system
+        """
+        return self.tags[rank - 2]
+
+    def is_balanced(self):
+        """
+        :return: True if a full deck counts up to zero, so the running count has to be divided by the decks left for a true count
+        """
+        return sum(self.scaledTags) == 0
+
+
+class CountTable:
+    """
+    The lookup table of the systems that were registered when it was compiled
+
+    :attribute systems: The compiled systems, by number
+    :attribute packedByCode: The packed tags of every card code, every tag raised by BIAS
+    """
+
+    def __init__(self, systems):
+        """
+        Compiles the table
+
+        :param systems: The systems to compile, by number
+        """
+        self.systems = tuple(systems)
+        self.packedByCode = tuple(sum((system.scaledTags[code >> 2] + BIAS) << (FIELD_BITS * number)
+                                      for number, system in enumerate(self.systems)) for code in range(52))
+
+    def value(self, packed, cards, number):
+        """
+        Unpacks the running count of a single system
+
+        :param packed: The sum of the packed tags of the counted cards
+        :param cards: The amount of counted cards
+        :param number: The number of the system
+        :return: The running count of the system, a float only when it is not a whole number
+        """
+        scaled = ((packed >> (FIELD_BITS * number)) & FIELD_MASK) - cards * BIAS
+        scale = self.systems[number].scale
+        if scale == 1 or scaled % scale == 0:
+            return scaled // scale
+        return scaled / scale
+
+    def values(self, packed, cards):
+        """
+        Unpacks the running count of every system
+
+        :param packed: The sum of the packed tags of the counted cards
+        :param cards: The amount of counted cards
+        :return: Dictionary from the name of every system to its running count
+        """
+        return {system.name: self.value(packed, cards, number) for number, system in enumerate(self.systems)}
+
+
+SYSTEMS = []  # Every registered system, by number
+compiledTable = None  # The CountTable of the registered systems, compiled again when a system is registered
+
+
+def register(system):
+    """
+    Adds a count system to the registry.
+    Card-shoes pick up the new system the next time they are emptied, seeing as their running counts are packed with the old table.
+
+    :param system: The CountSystem to add
+    :return: The number of the system
+    """
+    global compiledTable
+    if any(registered.name == system.name for registered in SYSTEMS):
+        raise ValueError("there is already a count system called " + system.name)
+    system.number = len(SYSTEMS)
+    SYSTEMS.append(system)
+    compiledTable = None
+    return system.number
+
+
+def compiled():
+    """
+    :return: The CountTable of every registered system
+    """
+    global compiledTable
+    if compiledTable is None:
+        compiledTable = CountTable(SYSTEMS)
+    return compiledTable
+
+
+def system_named(name):
+    """
+    :param name: The name of a registered system, in any case
+    :return: The system with that name
+    """
+    for system in SYSTEMS:
+        if system.name.upper() == name.upper():
+            return system
+    raise KeyError(name)
+
+
+# The built in systems, tags from the two up to and including the ace. The first three keep the numbers ask_count_type gives.
+ZEN_COUNT = CountSystem("Zen Count", (1, 1, 2, 2, 2, 1, 0, 0, -2, -2, -2, -2, -1))
+HALVES = CountSystem("Halves", (0.5, 1, 1, 1.5, 1, 0.5, 0, -0.5, -1, -1, -1, -1, -1), scale=2)  # Also known as Wong Halves
+HI_LO = CountSystem("Hi-Lo", (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1))
+KO = CountSystem("KO", (1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1))
+OMEGA_II = CountSystem("Omega II", (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0))
+HI_OPT_I = CountSystem("Hi-Opt I", (0, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, 0))
+HI_OPT_II = CountSystem("Hi-Opt II", (1, 1, 2, 2, 1, 1, 0, 0, -2, -2, -2, -2, 0))
+ACE_FIVE = CountSystem("Ace-Five", (0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, -1))
+for builtIn in (ZEN_COUNT, HALVES, HI_LO, KO, OMEGA_II, HI_OPT_I, HI_OPT_II, ACE_FIVE):
+    register(builtIn)
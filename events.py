@@ -0,0 +1,176 @@
+"""
+The structured record of everything that happens in a game of blackjack.
+Class Game emits an Event for every card dealt, bet, decision and payout to an event sink,
+the sinks underneath either throw them away, keep the latest ones in memory or write them to a file in large chunks.
+"""
+import json
+from collections import deque, namedtuple
+
+ROUND_START = "round_start"  # A new round starts, value is the amount of players at the table
+RESHUFFLE = "reshuffle"  # A new card-shoe is made, value is the amount of decks and data the order of the cards
+BET_PLACED = "bet_placed"  # A seat bets, value is the bet
+CARD_DEALT = "card_dealt"  # A seat gets a card, value is the card code
+HIT = "hit"  # A seat hits
+STAND = "stand"  # A seat stands, value is the value of its hand
+BUST = "bust"  # A seat goes bust, value is the value of its hand
+PAYOUT = "payout"  # A seat's hand is settled, value is the amount won (negative when lost, 0 for a push)
+AI_JOIN = "ai_join"  # An AI joins the table, value is its place in the list of AI not at the table
+AI_LEAVE = "ai_leave"  # An AI leaves the table
+GAME_SETUP = "game_setup"  # The game is set up, value is the starting money and data the setup (see SETUP_FORMAT)
+PLAYER_LEAVE = "player_leave"  # A player leaves the table
+AI_ROSTER = "ai_roster"  # AI are added to the list of AI not at the table, value is the amount of them seated at once
+# and data their settings as JSON (see Game.fill_with_roster)
+
+# Every kind of event, new kinds are only ever added at the end seeing as the binary history stores the place in this tuple
+EVENT_KINDS = (ROUND_START, RESHUFFLE, BET_PLACED, CARD_DEALT, HIT, STAND, BUST, PAYOUT, AI_JOIN, AI_LEAVE,
+               GAME_SETUP, PLAYER_LEAVE, AI_ROSTER)
+SETUP_FORMAT = '<BBH'  # struct format of the data of GAME_SETUP: the type of card-counting, the amount of decks and of players
+
+# A single thing that happened. seat is the player number, 0 for the dealer and negative for AI (see Game.fill_with_ai)
+Event = namedtuple('Event', ['kind', 'round', 'seat', 'value', 'data'])
+
+
+class NullSink:
+    """
+    Event sink that throws every event away, the default of class Game
+
+    :attribute enabled: Always False, so the game can skip work that only serves the events
+    """
+
+    enabled = False
+
+    def emit(self, kind, round, seat, value=0, data=None):
+        """
+        Does nothing with the event
+
+        :param kind: One of EVENT_KINDS
+        :param round: The round the event happened in
+        :param seat: The seat the event belongs to
+        :param value: The number belonging to the event (see EVENT_KINDS)
+        :param data: Extra data belonging to the event, only used by RESHUFFLE, GAME_SETUP and AI_ROSTER
+        """
+
+    def flush(self):
+        """
+        Nothing to write
+        """
+
+    def close(self):
+        """
+        Nothing to close
+        """
+
+
+class RingBufferSink(NullSink):
+    """
+    Event sink that keeps the latest events in memory, older events are dropped once the buffer is full
+
+    :attribute buffer: The kept events, oldest first
+    """
+
+    enabled = True
+
+    def __init__(self, capacity=100000):
+        """
+        Initializes an empty ring buffer
+
+        :param capacity: The amount of events that are kept
+        """
+        self.buffer = deque(maxlen=capacity)
+
+    def emit(self, kind, round, seat, value=0, data=None):
+        """
+        Keeps the event, dropping the oldest one when the buffer is full
+        """
+        self.buffer.append(Event(kind, round, seat, value, data))
+
+    def events(self, kind=None):
+        """
+        Gives the kept events
+
+        :param kind: Only give events of this kind, every event when not given
+        :return: A list of events, oldest first
+        """
+        if kind is None:
+            return list(self.buffer)
+        return [event for event in self.buffer if event.kind == kind]
+
+
+class JsonlSink(NullSink):
+    """
+    Event sink that writes every event as a line of JSON to a file.
+    The lines are collected in memory and written in a single write once bufferSize characters are waiting,
+    so a long run makes a few large writes instead of one per event.
+
+    :attribute file: The file the events are written to
+    :attribute bufferSize: The amount of characters collected before they are written
+    """
+
+    enabled = True
+
+    def __init__(self, file, bufferSize=1 << 20):
+        """
+        Initializes a sink writing to the given file
+
+        :param file: A path, or a file opened for writing text
+        :param bufferSize: The amount of characters collected before they are written
+        """
+        if isinstance(file, str):
+            self.file = open(file, 'w', encoding='utf-8')
+            self.ownsFile = True
+        else:
+            self.file = file
+            self.ownsFile = False
+        self.bufferSize = bufferSize
+        self.lines = []
+        self.waiting = 0
+
+    def emit(self, kind, round, seat, value=0, data=None):
+        """
+        Adds the event to the lines waiting to be written, writing them when there are enough
+        """
+        if data is None:
+            line = '{"event": "%s", "round": %d, "seat": %d, "value": %s}\n' % (kind, round, seat, json.dumps(value))
+        else:
+            line = '{"event": "%s", "round": %d, "seat": %d, "value": %s, "data": "%s"}\n' % (
+                kind, round, seat, json.dumps(value), bytes(data).hex())
+        self.lines.append(line)
+        self.waiting += len(line)
+        if self.waiting >= self.bufferSize:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes every waiting line to the file at once
+        """
+        if self.lines:
+            self.file.write(''.join(self.lines))
+            self.lines.clear()
+            self.waiting = 0
+        self.file.flush()
+
+    def close(self):
+        """
+        Writes the waiting lines and closes the file if this sink opened it
+        """
+        self.flush()
+        if self.ownsFile:
+            self.file.close()
+
+
+def read_jsonl(path):
+    """
+    Reads back the events written by a JsonlSink
+
+    :param path: The path of the file
+    :return: A list of events, with the data of RESHUFFLE, GAME_SETUP and AI_ROSTER events as bytes
+    """
+    result = []
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            record = json.loads(line)
+            data = record.get('data')
+            if data is not None:
+                data = bytes.fromhex(data)
+            result.append(Event(record['event'], record['round'], record['seat'], record['value'], data))
+    return result
@@ -0,0 +1,300 @@
+"""
+A compact binary hand history, so long runs can be kept in full and replayed exactly.
+
+A history file starts with a 16 byte header followed by records of 20 bytes each (see RECORD):
+the kind of event (its place in events.EVENT_KINDS), the seat, the round and the value of the event.
+When the highest bit of the kind is set the record is followed by the event's data, a 4 byte length and the data itself,
+padded with zeros to a multiple of 20 bytes. Only reshuffles (the order of the whole card-shoe), the game setup
+and the rosters of AI (their settings, so a replay can seat the same AI) carry data.
+"""
+import io
+import json
+import mmap
+import struct
+
+import events
+from run import Game, SilentOutput
+
+HEADER = b'BJHIST01' + bytes(8)  # The first 16 bytes of every history file
+RECORD = struct.Struct('<B3xiIq')  # kind, padding, seat, round, value, the seat is signed as AI seats are negative
+LENGTH = struct.Struct('<I')  # The length of the data following a record
+HAS_DATA = 0x80  # Set in the kind of a record that is followed by data
+KIND_CODES = {kind: code for code, kind in enumerate(events.EVENT_KINDS)}
+
+
+class HistorySink(events.NullSink):
+    """
+    Event sink that writes every event as a binary record, the records are collected and written in large chunks
+
+    :attribute file: The binary file the records are written to
+    :attribute bufferSize: The amount of bytes collected before they are written
+    """
+
+    enabled = True
+
+    def __init__(self, file, bufferSize=1 << 20):
+        """
+        Initializes a sink writing to the given file, starting with the header
+
+        :param file: A path, or a file opened for writing bytes
+        :param bufferSize: The amount of bytes collected before they are written
+        """
+        if isinstance(file, str):
+            self.file = open(file, 'wb')
+            self.ownsFile = True
+        else:
+            self.file = file
+            self.ownsFile = False
+        self.bufferSize = bufferSize
+        self.buffer = bytearray(HEADER)
+
+    def emit(self, kind, round, seat, value=0, data=None):
+        """
+        Adds the event as a record to the bytes waiting to be written, writing them when there are enough
+        """
+        if data is None:
+            self.buffer += RECORD.pack(KIND_CODES[kind], seat, round, value)
+        else:
+            self.buffer += RECORD.pack(KIND_CODES[kind] | HAS_DATA, seat, round, value)
+            self.buffer += LENGTH.pack(len(data))
+            self.buffer += data
+            self.buffer += bytes(-(LENGTH.size + len(data)) % RECORD.size)
+        if len(self.buffer) >= self.bufferSize:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes every waiting byte to the file at once
+        """
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+        self.file.flush()
+
+    def close(self):
+        """
+        Writes the waiting bytes and closes the file if this sink opened it
+        """
+        self.flush()
+        if self.ownsFile:
+            self.file.close()
+
+
+class HistoryReader:
+    """
+    Reads a history file by memory-mapping it, records are read straight from the mapped file as they are iterated.
+    No view on the mapped file is kept between two records, so the reader can be closed while an iteration is unfinished.
+
+    :attribute mapped: The memory-mapped file
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps the history file
+
+        :param path: The path of the history file
+        """
+        with open(path, 'rb') as file:
+            self.mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mapped[:len(HEADER)] != HEADER:
+            self.mapped.close()
+            raise ValueError(path + " is not a blackjack history file")
+
+    def __iter__(self):
+        """
+        Goes through every record in the file
+
+        :return: An iterator of events.Event
+        """
+        mapped = self.mapped
+        offset = len(HEADER)
+        while offset < len(mapped):
+            code, seat, round, value = RECORD.unpack_from(mapped, offset)
+            offset += RECORD.size
+            data = None
+            if code & HAS_DATA:
+                length, = LENGTH.unpack_from(mapped, offset)
+                data = mapped[offset + LENGTH.size:offset + LENGTH.size + length]
+                offset += LENGTH.size + length + (-(LENGTH.size + length) % RECORD.size)
+            yield events.Event(events.EVENT_KINDS[code & ~HAS_DATA], round, seat, value, data)
+
+    def close(self):
+        """
+        Unmaps the file
+        """
+        self.mapped.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplayStrategy:
+    """
+    Answers the players' decisions with the ones recorded in a history, round by round
+
+    :attribute bets: Dictionary from (round, seat) to the recorded bet
+    :attribute moves: Dictionary from (round, seat) to the list of recorded moves, 0 for a hit and 1 for a stand
+    :attribute leaving: Set of (round, seat) of the players that left the table
+    :attribute lastRound: The last round that was recorded
+    """
+
+    def __init__(self, records):
+        """
+        Collects the decisions from the recorded events
+
+        :param records: The recorded events
+        """
+        self.bets = {}
+        self.moves = {}
+        self.leaving = set()
+        self.lastRound = 0
+        for event in records:
+            if event.kind == events.ROUND_START:
+                self.lastRound = event.round
+            elif event.seat > 0:
+                if event.kind == events.BET_PLACED:
+                    self.bets[(event.round, event.seat)] = event.value
+                elif event.kind == events.HIT:
+                    self.moves.setdefault((event.round, event.seat), []).append(0)
+                elif event.kind == events.STAND:
+                    self.moves.setdefault((event.round, event.seat), []).append(1)
+                elif event.kind == events.PLAYER_LEAVE:
+                    self.leaving.add((event.round, event.seat))
+        for moves in self.moves.values():
+            moves.reverse()  # So the next move can be popped off the end
+
+    def bet_amount(self, game, player):
+        """
+        :return: The recorded bet, None if the player did not bet
+        """
+        return self.bets.get((game.roundsPlayed, player.number))
+
+    def next_move(self, game, player):
+        """
+        :return: The recorded move, a stand when nothing more was recorded
+        """
+        moves = self.moves.get((game.roundsPlayed, player.number))
+        if moves:
+            return moves.pop()
+        return 1
+
+    def anyone_leaving(self, game):
+        """
+        :return: 1 if any of the players left the table this round, 0 if not
+        """
+        return int(any(player.number for player in game.listPlayers
+                       if (game.roundsPlayed, player.number) in self.leaving))
+
+    def wants_to_leave(self, game, player):
+        """
+        :return: 1 if the player left the table this round, 0 if not
+        """
+        return int((game.roundsPlayed, player.number) in self.leaving)
+
+    def stop_game(self, game):
+        """
+        :return: 1 once the last recorded round has been played, 0 otherwise
+        """
+        return int(game.roundsPlayed >= self.lastRound)
+
+    def keep_decks(self, game):
+        """
+        :return: Always 1, the recorded card-shoes decide the amount of decks
+        """
+        return 1
+
+    def num_decks(self, game):
+        """
+        :return: The amount of decks of the current card-shoe
+        """
+        return game.startingDecks
+
+
+class ReplayGame(Game):
+    """
+    A game that plays with the card-shoes and AI from a history instead of shuffling and picking them at random
+
+    :attribute recordedShoes: The card orders of the recorded card-shoes that have not been used yet
+    :attribute recordedRosters: The recorded rosters as (the amount of AI seated at once, the list of their settings)
+    :attribute recordedJoins: Dictionary from the round an AI joined in at random to its place in the list of AI
+    """
+
+    def __init__(self, records, output=None, eventSink=None):
+        """
+        Initializes a game that replays the given events
+
+        :param records: The recorded events
+        :param output: The object the game is written to, nothing is written when not given
+        :param eventSink: The sink the events of the replay are emitted to
+        """
+        super(ReplayGame, self).__init__(ReplayStrategy(records), output if output is not None else SilentOutput(),
+                                         eventSink)
+        self.recordedShoes = [bytes(event.data) for event in records if event.kind == events.RESHUFFLE]
+        self.recordedShoes.reverse()  # So the next card-shoe can be popped off the end
+        self.recordedRosters = []
+        self.recordedJoins = {}
+        seated = 0  # The joins of AI a roster seated at once, those are not joins at random
+        for event in records:
+            if event.kind == events.AI_ROSTER:
+                self.recordedRosters.append((event.value, json.loads(bytes(event.data))))
+                seated += event.value
+            elif event.kind == events.AI_JOIN:
+                if seated:
+                    seated -= 1
+                else:
+                    self.recordedJoins[event.round] = event.value
+
+    def fill_recorded(self):
+        """
+        Adds the AI of every recorded roster to the game, seating them when they were seated at once
+        """
+        for seated, roster in self.recordedRosters:
+            self.fill_with_roster(roster, seated > 0)
+
+    def new_shoe(self):
+        """
+        Replaces the card-shoe with the next recorded one
+        """
+        codes = self.recordedShoes.pop()
+        self.startingDecks = len(codes) // 52
+        self.cardShoe.load_shoe(codes)
+        self.emit_reshuffle()
+
+    def random_ai(self):
+        """
+        Lets an AI join the table only when one joined in the recorded round
+        """
+        num = self.recordedJoins.get(self.roundsPlayed)
+        if num is None:
+            self.output.write("No one new joins the table.")
+        else:
+            AI = self.ai_joins(num)
+            self.output.write(AI.name + " has joined the table.")
+
+
+def replay(path, output=None):
+    """
+    Plays a recorded game again and checks that it gives exactly the same history, byte for byte
+
+    :param path: The path of the history file
+    :param output: The object the replayed game is written to, nothing is written when not given
+    :return: True if the replay matches the recording
+    """
+    with HistoryReader(path) as reader:
+        records = list(reader)
+    setup = next(event for event in records if event.kind == events.GAME_SETUP)
+    typeOfCount, startingDecks, numPlayers = struct.unpack(events.SETUP_FORMAT, setup.data)
+
+    replayed = io.BytesIO()
+    sink = HistorySink(replayed)
+    game = ReplayGame(records, output, sink)
+    game.setup(typeOfCount, numPlayers, setup.value, startingDecks)
+    game.fill_recorded()
+    game.run()
+    sink.flush()
+
+    with open(path, 'rb') as file:
+        return file.read() == replayed.getvalue()
@@ -0,0 +1,254 @@
+"""
+The command line entry point of the game, so a game, a simulation or the benchmarks can be started without answering prompts.
+
+Every setting can be given in a JSON config file, as a flag, or left to its default, flags win over the config file:
+    python launcher.py play --config table.json --seats 2
+    python launcher.py play --auto --rounds 500 --seed 7 --quiet
+    python launcher.py simulate --shoes 10000 --decks 8 --count KO
+    python launcher.py bench --repeats 3
+Without a subcommand the game starts the way it always has, asking the settings at the terminal like python run.py does.
+This module is the entry point of the subcommands, run.py does not import it, so running either never loads run.py twice.
+
+A config file is a JSON object with any of the keys of DEFAULTS, for example:
+    {"decks": 6, "seats": 2, "money": 5000, "count": "Halves", "showCount": true,
+     "roster": [{"name": "Bronn", "accuracy": 5, "risk": -1, "unit": 25, "leaveCondition": 4}]}
+The modules the subcommands need (the simulation's process pool, the benchmarks and checkpoints) are only imported
+by the subcommand using them, so starting a game stays as quick as before.
+"""
+import argparse
+import json
+import sys
+
+import counting
+from run import AutoStrategy, ConsoleOutput, ConsoleStrategy, Game, SilentOutput
+
+DEFAULTS = {
+    "decks": 6,  # The amount of decks in the card-shoe
+    "seats": 1,  # The amount of players
+    "money": 1000,  # The money every player starts out with
+    "count": "Hi-Lo",  # The name of the count system (see the module counting)
+    "showCount": False,  # True to show the card-count before every round
+    "showDecks": False,  # True to show the decks remaining before every round
+    "ai": True,  # True to let AI join the table
+    "roster": None,  # A list of AI settings used instead of the pre-mades (see Game.fill_with_roster)
+    "largeTable": 0,  # The amount of generated AI seated at once (see Game.fill_large_table)
+    "seed": None,  # The master seed, a fresh seed when not given
+    "betSize": 2,  # The bet of every player when the game plays itself or is simulated, even so a blackjack pays 3:2
+    # (simulation.DEFAULT_BET, not imported here so the launcher only loads the simulation when simulating)
+    "standOn": 17,  # The hand value at which players stand when the game plays itself or is simulated
+    "rounds": None,  # The amount of rounds a game playing itself plays, None to play until everyone is broke
+    "shoes": 1000,  # The amount of card-shoes a simulation plays
+    "workers": None,  # The amount of processes a simulation uses, the amount of cores when not given
+    "compareSystems": False,  # True to bucket every simulated hand by every count system
+}
+WHOLE_NUMBERS = ("decks", "seats", "money", "betSize", "shoes")  # Settings that have to be at least 1
+
+
+def load_config(path):
+    """
+    Reads a config file
+
+    :param path: The path of the JSON config file
+    :return: Dictionary of the settings in the file
+    """
+    with open(path, encoding="utf-8") as file:
+        config = json.load(file)
+    if not isinstance(config, dict):
+        raise ValueError(path + " does not hold a JSON object")
+    unknown = sorted(set(config) - set(DEFAULTS))
+    if unknown:
+        raise ValueError(path + " has unknown settings: " + ", ".join(unknown))
+    return config
+
+
+def settings_of(options):
+    """
+    Combines the defaults, the config file and the flags into the settings of a run
+
+    :param options: The parsed command line arguments
+    :return: Dictionary with every setting of DEFAULTS
+    """
+    settings = dict(DEFAULTS)
+    if options.config:
+        settings.update(load_config(options.config))
+    for name in DEFAULTS:
+        value = getattr(options, name, None)
+        if value is not None:
+            settings[name] = value
+    for name in WHOLE_NUMBERS:
+        if settings[name] < 1:
+            raise ValueError(name + " has to be at least 1")
+    try:
+        settings["typeOfCount"] = counting.system_named(settings["count"]).number
+    except KeyError:
+        raise ValueError("there is no count system called " + settings["count"]) from None
+    return settings
+
+
+def fill_table(game, settings):
+    """
+    Gives the game its AI as the settings say
+
+    :param game: The Game, already set up
+    :param settings: The settings of the run
+    """
+    if settings["ai"]:
+        if settings["roster"] is not None:
+            game.fill_with_roster(settings["roster"])
+        else:
+            game.fill_with_ai()
+    if settings["largeTable"]:
+        game.fill_large_table(settings["largeTable"])
+
+
+def play(settings, options):
+    """
+    Plays a game at the terminal, or lets it play itself with --auto, set up from the settings instead of prompts
+
+    :param settings: The settings of the run
+    :param options: The parsed command line arguments
+    :return: The exit code
+    """
+    if options.auto:
+        strategy = AutoStrategy(settings["betSize"], settings["standOn"], settings["rounds"])
+    else:
+        strategy = ConsoleStrategy()
+    output = SilentOutput() if options.quiet else ConsoleOutput()
+
+    if options.resume:
+        import checkpoint
+        game = checkpoint.load(options.resume, strategy, output)
+        game.gameTrue = len(game.listPlayers) > 0  # The checkpoint may have been written when the game stopped
+    else:
+        game = Game(strategy, output, seed=settings["seed"])
+        game.setup(settings["typeOfCount"], settings["seats"], settings["money"], settings["decks"],
+                   settings["showCount"], settings["showDecks"])
+        fill_table(game, settings)
+
+    if options.checkpoint:
+        import checkpoint
+        checkpoint.run(game, options.checkpoint, options.every)
+    else:
+        game.run()
+    if options.quiet:
+        print("Played " + str(game.roundsPlayed) + " rounds with seed " + str(game.seed))
+        for player in game.listPlayers:
+            print("Player " + str(player.number) + ": " + str(player.money))
+    return 0
+
+
+def simulate(settings, options):
+    """
+    Runs a headless simulation with the settings and prints its results
+
+    :param settings: The settings of the run
+    :param options: The parsed command line arguments
+    :return: The exit code
+    """
+    import simulation
+    seed = settings["seed"] if settings["seed"] is not None else 0
+    config = simulation.SimulationConfig(settings["decks"], settings["seats"], settings["betSize"], settings["standOn"],
+                                         settings["typeOfCount"], settings["ai"], seed, settings["compareSystems"],
+                                         settings["roster"])
+    result = simulation.simulate(config, settings["shoes"], settings["workers"])
+    print("Seed: " + str(result.seed))
+    print("Card-shoes: " + str(result.shoesPlayed) + ", rounds: " + str(result.roundsPlayed) + ", hands: " +
+          str(result.handsPlayed))
+    print("Expected value per hand: " + format(result.ev(), '+.4f') + " units")
+    print("Hands per second: " + format(result.hands_per_second(), ',.0f'))
+    for line in result.stats.summary():
+        print(line)
+    if options.buckets or settings["compareSystems"]:
+        print_buckets("Hi-Lo", result.countBuckets)
+    if settings["compareSystems"]:
+        for system in counting.SYSTEMS:
+            if system.name in result.systemBuckets:
+                print_buckets(system.name, result.systemBuckets[system.name])
+    return 0
+
+
+def print_buckets(name, countBuckets):
+    """
+    Prints the amount of hands and the expected value per hand of every true count bucket of a count system
+
+    :param name: The name of the count system
+    :param countBuckets: Dictionary from true count bucket to [hands, netUnits]
+    """
+    print("-" * 45)
+    print(name + ":")
+    print(format("true count", ">10") + format("hands", ">12") + format("EV", ">10"))
+    for bucket, (hands, netUnits) in sorted(countBuckets.items()):
+        print(format(bucket, '>+10d') + format(hands, '>12,d') + format(netUnits / hands, '>+10.4f'))
+
+
+def parser_of():
+    """
+    :return: The argparse.ArgumentParser of the launcher
+    """
+    parser = argparse.ArgumentParser(description="Play, simulate or benchmark card-counting blackjack")
+    commands = parser.add_subparsers(dest="command")
+
+    table = argparse.ArgumentParser(add_help=False)
+    table.add_argument("--config", help="JSON file with the settings, flags override it")
+    table.add_argument("--decks", type=int, help="amount of decks in the card-shoe")
+    table.add_argument("--seats", type=int, help="amount of players")
+    table.add_argument("--count", help="count system, by name (Hi-Lo, Halves, Zen Count, KO, ...)")
+    table.add_argument("--seed", type=int, help="master seed of the shuffles and AI")
+    table.add_argument("--no-ai", dest="ai", action="store_const", const=False, help="play without AI")
+    table.add_argument("--bet-size", dest="betSize", type=int, help="bet of every player when nobody is asked")
+    table.add_argument("--stand-on", dest="standOn", type=int, help="hand value players stand on when nobody is asked")
+
+    play_parser = commands.add_parser("play", parents=[table], help="play a game set up without prompts")
+    play_parser.add_argument("--money", type=int, help="money every player starts out with")
+    play_parser.add_argument("--show-count", dest="showCount", action="store_const", const=True,
+                             help="show the card-count before every round")
+    play_parser.add_argument("--show-decks", dest="showDecks", action="store_const", const=True,
+                             help="show the decks remaining before every round")
+    play_parser.add_argument("--large-table", dest="largeTable", type=int, help="seat this many generated AI at once")
+    play_parser.add_argument("--auto", action="store_true", help="let the game play itself instead of asking")
+    play_parser.add_argument("--rounds", type=int, help="rounds the game plays with --auto")
+    play_parser.add_argument("--quiet", action="store_true", help="only print the final balances")
+    play_parser.add_argument("--checkpoint", help="write a checkpoint of the game to this file while playing")
+    play_parser.add_argument("--every", type=int, default=100, help="rounds between two checkpoints")
+    play_parser.add_argument("--resume", help="carry on with the game in this checkpoint instead of a new one")
+
+    simulate_parser = commands.add_parser("simulate", parents=[table], help="simulate many card-shoes headless")
+    simulate_parser.add_argument("--shoes", type=int, help="amount of card-shoes to play")
+    simulate_parser.add_argument("--workers", type=int, help="amount of processes, the amount of cores when not given")
+    simulate_parser.add_argument("--compare-systems", dest="compareSystems", action="store_const", const=True,
+                                 help="bucket every hand by every count system")
+    simulate_parser.add_argument("--buckets", action="store_true", help="also print the EV per true count")
+
+    commands.add_parser("bench", add_help=False, help="run the benchmarks, every argument goes to bench.py")
+    return parser
+
+
+def main(arguments=None):
+    """
+    Runs the launcher from the command line
+
+    :param arguments: The command line arguments, sys.argv when not given
+    :return: The exit code
+    """
+    parser = parser_of()
+    options, extra = parser.parse_known_args(arguments)
+    if options.command == "bench":
+        import bench
+        return bench.main(extra)
+    if extra:
+        parser.error("unrecognized arguments: " + " ".join(extra))
+    if options.command is None:
+        Game().start_game()
+        return 0
+
+    try:
+        settings = settings_of(options)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if options.command == "play":
+        return play(settings, options)
+    return simulate(settings, options)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,29 +1,91 @@
+import hashlib
+import json
+import os
 import random
+import struct
+import sys
+from array import array
+from functools import lru_cache
+
+import analysis
+import counting
+import events
+import stats
+import tables
+
+SUITS = ('♠', '♦', '♥', '♣')  # The four card-suits, a card's code stores the index of its suit in this tuple
+FULL_DECK_CODES = bytes(range(52))  # The codes of all 52 cards of a standard deck
+DISCARD_TRIM = 52  # A card-shoe that doesn't keep its discard drops the drawn cards once this many have been drawn
+MAX_PLAYERS = 5  # The most players ask_num_players lets sit at the table
+MAX_AI = 3  # The most AI random_ai lets join the table, a large table (see Game.fill_large_table) lifts this
+NEVER_LEAVES = 2 ** 31 - 1  # The leave condition of the AI of a large table, their leave counter never reaches it
+
+
+def card_code(rank, suit):
+    """
+    Gives the code a card-shoe uses to store a card, a number between 0 and 51.
+    The code is four times the card's rank (counted from the two) plus the index of its suit in SUITS,
+    so the rank of a code is code // 4 + 2 and its suit SUITS[code % 4].
+
+    :param rank: The rank of the card
+    :param suit: The suit of the card
+    :return: The code of the card
+    """
+    return (rank - 2) * 4 + SUITS.index(suit)
+
+
+def new_seed():
+    """
+    Picks a fresh seed from the operating system, without touching any random number stream of the game
+
+    :return: A 64-bit seed
+    """
+    return int.from_bytes(os.urandom(8), 'little')
+
+
+def derive_seed(seed, *keys):
+    """
+    Derives the seed of a child random number stream by hashing the parent seed with the keys naming the child.
+    The same seed and keys always give the same child, and children with different keys are independent of each other,
+    so every table, card-shoe or worker can get its own stream from a single master seed.
+
+    :param seed: The seed of the parent stream
+    :param keys: The names or numbers of the child, such as "shoe" or the number of a card-shoe in a simulation
+    :return: A 64-bit seed
+    """
+    digest = hashlib.sha256(repr((seed,) + keys).encode()).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+
+# The tables underneath are indexed by a card's rank (2 up to and including 14 for the ace), the first two places are unused
+RANK_VALUES = (0, 0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)  # Hand value of every rank, an ace starts out as 11
+HILO_COUNTS = (0, 0) + counting.HI_LO.tags  # Hi-Lo card-count value of every rank
+HALVES_COUNTS = (0, 0) + counting.HALVES.tags  # Halves card-count value of every rank
+ZEN_COUNTS = (0, 0) + counting.ZEN_COUNT.tags  # Zen Count card-count value of every rank
 
 
 def create_deck():
     """
-    Creates a 52 card deck card, each of which is an instance of class Card, and returns it as a list
+    Returns a 52 card deck, each of which is an instance of class Card, as a list.
+    The cards are the ones in CARD_FACES, there is only ever one instance of every card so no new cards are made.
 
-    :return: A standard deck of cards (52 cards consisting of a combination of 13 ranks and 4 suits)1
+    :return: A standard deck of cards (52 cards consisting of a combination of 13 ranks and 4 suits)
     """
-    deck = []
-    card_suit = {'♠', '♦', '♥', '♣'}
-    card_rank = {2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14}
-    for i in card_rank:
-        for j in card_suit:
-            deck.append(Card(i, j))
-    return deck
+    return list(CARD_FACES)
 
 
 class Card:
     """
-    Used to make cards for the game of blackjack
+    Used to make cards for the game of blackjack.
+    Only the 52 cards in CARD_FACES are ever needed, card-shoes store card codes and look the card up there.
 
     :attribute rank: The rank of the specific card
     :attribute suit: The suit of the specific card
+    :attribute code: The code card-shoes use to store this card (see card_code)
     """
 
+    __slots__ = ('rank', 'suit', 'code')
+
     def __init__(self, rank, suit):
         """
         Initializes the card object
@@ -33,6 +95,7 @@ class Card:
         """
         self.rank = rank
         self.suit = suit
+        self.code = card_code(rank, suit)
 
     def get_value(self):
         """
@@ -41,11 +104,7 @@ class Card:
 
         :return: The value of the card based on its rank
         """
-        if self.rank < 10:
-            return self.rank
-        if self.rank < 14:
-            return 10
-        return 11
+        return RANK_VALUES[self.rank]
 
     def get_count_HiLo(self):
         """
@@ -53,12 +112,7 @@ class Card:
 
         :return: The card-count value based on the cards rank and what that translates to in the Hi-Lo card-counting system
         """
-        if self.rank < 7:
-            return 1
-        elif self.rank < 10:
-            return 0
-        else:
-            return -1
+        return HILO_COUNTS[self.rank]
 
     def get_count_Halves(self):
         """
@@ -66,18 +120,7 @@ class Card:
 
         :return: The card-count value based on the cards rank and what that translates to in the Halves card-counting system
         """
-        if self.rank in [2, 7]:
-            return 0.5
-        elif self.rank == 9:
-            return -0.5
-        elif self.rank in [3, 4, 6]:
-            return 1
-        elif self.rank in [10, 11, 12, 13, 14]:
-            return -1
-        elif self.rank == 8:
-            return 0
-        else:
-            return 1.5
+        return HALVES_COUNTS[self.rank]
 
     def get_count_Zen(self):
         """
@@ -85,130 +128,677 @@ class Card:
 
         :return: The card-count value based on the cards rank and what that translates to in the Zen Count card-counting system
         """
-        if self.rank in [2, 3, 7]:
-            return 1
-        elif self.rank in [4, 5, 6]:
-            return 2
-        elif self.rank in [8, 9]:
-            return 0
-        elif self.rank in [10, 11, 12, 13]:
-            return -2
-        else:
-            return -1
+        return ZEN_COUNTS[self.rank]
 
 
-class CardShoe:
+CARD_FACES = tuple(Card(code // 4 + 2, SUITS[code % 4]) for code in range(52))  # The one instance of every card, by card code
+# The same tables as above but indexed by card code, so the card-shoe can skip working out the rank
+VALUE_BY_CODE = tuple(RANK_VALUES[code // 4 + 2] for code in range(52))
+HARD_VALUE_BY_CODE = tuple(min(value, 10) if value < 11 else 1 for value in VALUE_BY_CODE)  # Hand value with aces as 1
+ACE_CODE = card_code(14, SUITS[0])  # The lowest code of an ace, every code from here on is an ace
+
+
+def render_card(card):
+    """
+    Draws a single card in ASCII code as the nine lines that make up the card
+
+    :param card: The card to draw
+    :return: A tuple with the nine lines of the card
+    """
+    if card.rank == 10:
+        rank = "10"
+        space = ""
+    elif card.rank < 10:
+        rank = str(card.rank)
+        space = " "
+    else:
+        rank = RANK_LABELS[card.rank]
+        space = " "
+    return ('┌─────────┐',
+            '│{}{}       │'.format(rank, space),  # use two {} one for char, one for space or char
+            '│         │',
+            '│         │',
+            '│    {}    │'.format(card.suit),
+            '│         │',
+            '│         │',
+            '│       {}{}│'.format(space, rank),
+            '└─────────┘')
+
+
+RANK_LABELS = {11: "J", 12: "Q", 13: "K", 14: "A"}  # The letter shown on the face cards and the ace
+CARD_GLYPHS = tuple(render_card(card) for card in CARD_FACES)  # The drawing of every card, by card code
+CARD_BACK = ('┌─────────┐',) + ('│░░░░░░░░░│',) * 7 + ('└─────────┘',)  # The drawing of a hidden card
+
+
+@lru_cache(maxsize=1024)
+def render_hand(codes, hideFirst):
+    """
+    Draws a hand of cards next to each other from the drawings in CARD_GLYPHS.
+    The result is cached, the dealer's hand is drawn again for every player it is compared with and that costs nothing this way.
+
+    :param codes: The codes of the cards in the hand as bytes
+    :param hideFirst: True if the first card should be drawn face down, used for the dealer's hidden card
+    :return: The drawing of the hand as a single piece of text
+    """
+    glyphs = [CARD_GLYPHS[code] for code in codes]
+    if hideFirst:
+        glyphs[:1] = [CARD_BACK]
+    return "\n".join(["".join([glyph[line] for glyph in glyphs]) for line in range(9)])
+
+
+class HandState:
+    """
+    Keeps the value of a hand of cards up to date as cards are added to it, so it never has to go through the whole hand.
+    It keeps the hand's total with every ace counted as 1 and the amount of aces,
+    one ace can then be counted as 11 as long as that does not take the hand over 21.
+
+    :attribute hardTotal: The value of the hand with every ace counted as 1
+    :attribute aces: The amount of aces in the hand
+    """
+
+    __slots__ = ('hardTotal', 'aces')
+
+    def __init__(self):
+        """
+        Initializes the state of an empty hand
+        """
+        self.hardTotal = 0
+        self.aces = 0
+
+    def add(self, code):
+        """
+        Adds a single card to the hand
+
+        :param code: The code of the card that is added
+        """
+        self.hardTotal += HARD_VALUE_BY_CODE[code]
+        if code >= ACE_CODE:
+            self.aces += 1
+
+    def reset(self):
+        """
+        Empties the hand
+        """
+        self.hardTotal = 0
+        self.aces = 0
+
+    def value(self):
+        """
+        Gives the highest value of the hand that does not go over 21, if there is one.
+        Only one ace can ever be counted as 11 seeing as two would already make 22.
+
+        :return: The value of the hand
+        """
+        if self.aces and self.hardTotal <= 11:
+            return self.hardTotal + 10
+        return self.hardTotal
+
+    def is_soft(self):
+        """
+        Checks if the hand is soft, meaning one of its aces is counted as 11 so hitting can't make it go bust.
+
+        :return: True if the hand is soft, False if it is hard
+        """
+        return self.aces != 0 and self.hardTotal <= 11
+
+
+class SeatHandState:
     """
-    Used to store a list of type Card as well as all cards that have been discarded and the card count of the card-shoe
+    A HandState that keeps the value of an AI's hand in the arrays of an AISeats instead of in its own attributes,
+    so the hands of every AI at the table can be looked at in a single pass (see AISeats.stand_flags)
+
+    :attribute seats: The AISeats holding the hand's value
+    :attribute seat: The place of the AI in the arrays of seats
+    """
+
+    __slots__ = ('seats', 'seat')
+
+    def __init__(self, seats, seat):
+        """
+        :param seats: The AISeats holding the hand's value
+        :param seat: The place of the AI in the arrays of seats
+        """
+        self.seats = seats
+        self.seat = seat
+
+    @property
+    def hardTotal(self):
+        """
+        The value of the hand with every ace counted as 1
+        """
+        return self.seats.hardTotal[self.seat]
+
+    @property
+    def aces(self):
+        """
+        The amount of aces in the hand
+        """
+        return self.seats.aces[self.seat]
+
+    def add(self, code):
+        """
+        Adds a single card to the hand
+
+        :param code: The code of the card that is added
+        """
+        self.seats.hardTotal[self.seat] += HARD_VALUE_BY_CODE[code]
+        if code >= ACE_CODE:
+            self.seats.aces[self.seat] += 1
+
+    def reset(self):
+        """
+        Empties the hand
+        """
+        self.seats.hardTotal[self.seat] = 0
+        self.seats.aces[self.seat] = 0
+
+    def value(self):
+        """
+        :return: The value of the hand (see HandState.value)
+        """
+        hardTotal = self.seats.hardTotal[self.seat]
+        if self.seats.aces[self.seat] and hardTotal <= 11:
+            return hardTotal + 10
+        return hardTotal
 
-    :attribute cardShoe: A list meant to store cards within it, used for anything from players hands to the card-shoe that contains the decks blackjack will be played with
-    :attribute discardShoe: A list meant to store cards that formally resided in the card-shoe list
-    :attribute currentCardCount: The current card-count, dependent on what cards are in the discardShoe and what card count type was chosen by the player
+    def is_soft(self):
+        """
+        :return: True if the hand is soft (see HandState.is_soft)
+        """
+        return self.seats.aces[self.seat] != 0 and self.seats.hardTotal[self.seat] <= 11
+
+
+class AISeats:
+    """
+    The AI of a game stored as a struct of arrays: every attribute of the AI is an array with a place for every AI,
+    so the decisions of all AI at the table are made in a single pass over the arrays instead of through a method call per AI.
+    The AIPlayer objects keep their name, hand and pot, their other attributes are read from and written to these arrays.
+
+    :attribute accuracy: The accuracy of every AI (see AIPlayer)
+    :attribute risk: The risk of every AI
+    :attribute unit: The betting unit of every AI
+    :attribute leaveCounter: The leave counter of every AI
+    :attribute leaveCondition: The leave condition of every AI
+    :attribute perfectPlay: 1 for every AI that plays by expected value, 0 for the others
+    :attribute tablePlay: 1 for every AI that plays by the cached strategy tables, 0 for the others
+    :attribute hardTotal: The value of every AI's hand with every ace counted as 1
+    :attribute aces: The amount of aces in every AI's hand
     """
 
     def __init__(self):
+        """
+        Initializes the arrays without any AI
+        """
+        self.accuracy = array('d')  # Floats, so a roster can give an accuracy or risk like 0.85
+        self.risk = array('d')
+        self.unit = array('q')
+        self.leaveCounter = array('i')
+        self.leaveCondition = array('i')
+        self.perfectPlay = array('b')
+        self.tablePlay = array('b')
+        self.hardTotal = array('i')
+        self.aces = array('i')
+
+    def __len__(self):
+        return len(self.accuracy)
+
+    def add(self, accuracy, risk, unit, leaveCondition, perfectPlay=False, leaveCounter=0, tablePlay=False):
+        """
+        Gives a new AI a place in the arrays
+
+        :return: The place of the AI in the arrays
+        """
+        if unit != int(unit):
+            raise ValueError("the betting unit of an AI has to be a whole number, not " + str(unit))
+        self.accuracy.append(accuracy)
+        self.risk.append(risk)
+        self.unit.append(int(unit))
+        self.leaveCounter.append(leaveCounter)
+        self.leaveCondition.append(leaveCondition)
+        self.perfectPlay.append(int(perfectPlay))
+        self.tablePlay.append(int(tablePlay))
+        self.hardTotal.append(0)
+        self.aces.append(0)
+        return len(self.accuracy) - 1
+
+    def adopt(self, AI):
+        """
+        Moves an AI with its current values from the AISeats it was made with into these arrays
+
+        :param AI: The AIPlayer to move
+        :return: The new place of the AI in the arrays
+        """
+        if AI.seats is self:
+            return AI.seat
+        handState = AI.hand.handState
+        seat = self.add(AI.accuracy, AI.risk, AI.unit, AI.leaveCondition, AI.perfectPlay, AI.leaveCounter, AI.tablePlay)
+        self.hardTotal[seat] = handState.hardTotal
+        self.aces[seat] = handState.aces
+        AI.seats = self
+        AI.seat = seat
+        AI.hand.handState = SeatHandState(self, seat)
+        return seat
+
+    def bet_sizes(self, seats, cardShoe):
+        """
+        Works out the bets of the given AI in one pass (see AIPlayer.check_bet_size)
+
+        :param seats: The places of the AI in the arrays
+        :param cardShoe: The card-shoe used to determine the true count
+        :return: A list with the bet of every AI
+        """
+        decksRemaining = cardShoe.len_cardshoe() / 52
+        count = cardShoe.current_HiLo_count()
+        accuracy = self.accuracy
+        unit = self.unit
+        if count >= 0:
+            calculations = [count + accuracy[seat] for seat in seats]
+        else:
+            calculations = [count - accuracy[seat] for seat in seats]
+        return [unit[seat] if calculation <= 0 else int(decksRemaining / calculation * unit[seat])
+                for seat, calculation in zip(seats, calculations)]
+
+    def stand_flags(self, seats):
+        """
+        Checks for the given AI if they stand on the hand they have, by their risk (see AIPlayer.check_next_move)
+
+        :param seats: The places of the AI in the arrays
+        :return: A list with 1 for every AI that stands and 0 for every AI that hits
+        """
+        hardTotal = self.hardTotal
+        aces = self.aces
+        risk = self.risk
+        return [int((hardTotal[seat] + 10 if aces[seat] and hardTotal[seat] <= 11 else hardTotal[seat]) >= risk[seat] + 17)
+                for seat in seats]
+
+    def leave_flags(self, seats):
+        """
+        Checks for the given AI if they leave the table (see AIPlayer.check_leave)
+
+        :param seats: The places of the AI in the arrays
+        :return: A list with True for every AI that leaves and False for every AI that stays
+        """
+        leaveCounter = self.leaveCounter
+        leaveCondition = self.leaveCondition
+        return [leaveCounter[seat] >= leaveCondition[seat] for seat in seats]
+
+
+def drop_flagged(people, flags):
+    """
+    Removes the people whose flag is set from a list in a single pass, keeping the others in their order.
+    The phases of a round flag the seats that are done while going through them and drop those seats afterwards,
+    removing people one by one while going through the same list would skip the person after every removal.
+
+    :param people: The list of people, changed in place
+    :param flags: A flag for every place in the list, anything but 0 and False for the people to remove
+    :return: A list of the removed people
+    """
+    removed = [person for person, flag in zip(people, flags) if flag]
+    if removed:
+        people[:] = [person for person, flag in zip(people, flags) if not flag]
+    return removed
+
+
+def seat_attribute(name, doc):
+    """
+    Makes a property of AIPlayer that reads and writes the AI's place in one of the arrays of its AISeats
+
+    :param name: The name of the array
+    :param doc: The description of the attribute
+    :return: The property
+    """
+
+    def get(self):
+        return getattr(self.seats, name)[self.seat]
+
+    def set(self, value):
+        getattr(self.seats, name)[self.seat] = value
+    return property(get, set, doc=doc)
+
+
+class Hand:
+    """
+    The cards in a person's hand, only the card codes and the HandState without anything a card-shoe needs.
+    It can be used wherever a hand was a CardShoe before: add_cards, blank_shoe, len_cardshoe and value_hand work the same.
+
+    :attribute shoeCodes: A bytearray with the codes of the cards in the hand
+    :attribute handState: The HandState of the cards in the hand
+    """
+
+    __slots__ = ('shoeCodes', 'handState')
+
+    def __init__(self, handState=None):
+        """
+        Initializes an empty hand
+
+        :param handState: The HandState that keeps the value of the hand, a new one when not given
+        """
+        self.shoeCodes = bytearray()
+        self.handState = handState if handState is not None else HandState()
+
+    @property
+    def cardShoe(self):
+        """
+        The cards in the hand as a list of type Card
+
+        :return: A list of the cards in the hand
+        """
+        return [CARD_FACES[code] for code in self.shoeCodes]
+
+    def len_cardshoe(self):
+        """
+        :return: The amount of cards in the hand
+        """
+        return len(self.shoeCodes)
+
+    def add_cards(self, listOfCards):
+        """
+        Adds the given cards to the hand
+
+        :param listOfCards: The cards that will be added, either card codes (as returned by CardShoe.draw) or a list of type Card
+        """
+        if not isinstance(listOfCards, (bytes, bytearray, memoryview)):
+            listOfCards = bytes([card.code for card in listOfCards])
+        for code in listOfCards:
+            self.handState.add(code)
+        self.shoeCodes += listOfCards
+
+    def blank_shoe(self):
+        """
+        Empties the hand
+        """
+        self.shoeCodes = bytearray()
+        self.handState.reset()
+
+    def value_hand(self):
+        """
+        :return: The value of the hand, where aces count as 1 when 11 would go over 21
+        """
+        return self.handState.value()
+
+
+class CardShoe:
+    """
+    Used to store cards as well as all cards that have been discarded and the card count of the card-shoe.
+    The cards are stored by their code (see card_code) in a single bytearray with a moving draw index:
+    the cards before the draw index have been drawn and form the discard, the cards from the draw index on are still in the shoe.
+    Drawing a card therefore only moves the draw index forward instead of moving every card in the shoe.
+
+    :attribute shoeCodes: A bytearray with the codes of all cards, used for anything from players hands to the card-shoe that contains the decks blackjack will be played with
+    :attribute drawIndex: The position in shoeCodes of the next card to be drawn, everything before it is the discard
+    :attribute countTable: The compiled table of every count system (see the module counting), taken when the card-shoe is emptied
+    :attribute packedCount: The running card-counts of the discard in every count system packed into one number, kept up to date by draw
+    :attribute countedCards: The amount of cards in packedCount
+    :attribute handState: The HandState of the cards added with add_cards, used when the card-shoe is a player's hand
+    :attribute rankCounts: The amount of cards left in the card-shoe of every rank, rankCounts[rank - 2] belongs to rank
+    :attribute keepDiscard: False to only keep the card-counts and a tally of the discard instead of the drawn cards themselves
+    :attribute discardTally: The amount of cards of every rank dropped from the discard, only used when keepDiscard is False
+    :attribute randomStream: The random.Random the card-shoe is shuffled with
+    """
+
+    def __init__(self, keepDiscard=True, randomStream=None):
         """
         Initializes a card-shoe
+
+        :param keepDiscard: False to drop drawn cards and only keep the card-counts and a tally of them,
+        so the card-shoe never holds more than the cards still in it and the last few drawn
+        :param randomStream: The random.Random to shuffle with, a new stream with a fresh seed when not given
         """
-        self.cardShoe = []
-        self.discardShoe = []
-        self.currentCardCount = 0
+        self.shoeCodes = bytearray()
+        self.drawIndex = 0
+        self.countTable = counting.compiled()
+        self.packedCount = 0
+        self.countedCards = 0
+        self.handState = HandState()
+        self.rankCounts = [0] * 13
+        self.keepDiscard = keepDiscard
+        self.discardTally = [0] * 13
+        self.randomStream = randomStream if randomStream is not None else random.Random(new_seed())
+
+    @property
+    def cardShoe(self):
+        """
+        The cards that are still in the card-shoe as a list of type Card.
+        This builds a new list on every use, the game itself works with the card codes in shoeCodes instead.
+
+        :return: A list of the cards that have not been drawn yet
+        """
+        return [CARD_FACES[code] for code in self.shoeCodes[self.drawIndex:]]
+
+    @property
+    def discardShoe(self):
+        """
+        The cards that have been drawn from the card-shoe as a list of type Card.
+        This builds a new list on every use, the game itself works with the card codes in shoeCodes instead.
+        Without the attribute keepDiscard only the cards drawn since the discard was last dropped are left (see discard_counts).
+
+        :return: A list of the cards that have been drawn
+        """
+        return [CARD_FACES[code] for code in self.shoeCodes[:self.drawIndex]]
 
     def len_cardshoe(self):
         """
-        Calculates and returns the length of the attribute cardShoe.
+        Calculates and returns the amount of cards left in the card-shoe.
 
-        :return: The length of the attribute cardShoe
+        :return: The amount of cards that have not been drawn yet
         """
-        return len(self.cardShoe)
+        return len(self.shoeCodes) - self.drawIndex
 
     def add_cards(self, listOfCards):
         """
-        Adds the given list of cards to the attribute cardShoe
+        Adds the given cards to the end of the card-shoe and to the attribute handState
 
-        :param listOfCards: The list of cards that will be added to the attribute cardShoe
+        :param listOfCards: The cards that will be added, either card codes (as returned by draw) or a list of type Card
         """
-        self.cardShoe.extend(listOfCards)
+        if not isinstance(listOfCards, (bytes, bytearray, memoryview)):
+            listOfCards = bytes([card.code for card in listOfCards])
+        for code in listOfCards:
+            self.handState.add(code)
+            self.rankCounts[code >> 2] += 1
+        # A new bytearray is made instead of extending the old one, that way cards returned by draw are never invalidated
+        self.shoeCodes = self.shoeCodes + listOfCards
 
     def blank_shoe(self):
         """
-        Clears the cardShoe's attribute cardShoe and discardShoe of any cards.
-        This will automatically reset the card-count the next time it is calculated seeing as the discardShoe is now clear.
+        Clears the card-shoe of any cards, both the ones still in it and the discard.
+        Seeing as the discard is now clear the card-counts are reset to zero.
         """
-        self.cardShoe.clear()
-        self.discardShoe.clear()
+        self.shoeCodes = bytearray()
+        self.drawIndex = 0
+        self.countTable = counting.compiled()
+        self.packedCount = 0
+        self.countedCards = 0
+        self.handState.reset()
+        self.rankCounts = [0] * 13
+        self.discardTally = [0] * 13
 
     def draw(self, amount):
         """
-        Removes a certain amount of cards from the attribute cardShoe and both returning them and placing them in the attribute discardShoe
-        They are placed into the attribute discardShoe here so we don't have to deal with it later in the code.
+        Draws a certain amount of cards from the card-shoe by moving the draw index forward.
+        The drawn cards are now part of the discard so the running card-counts are updated here,
+        that way asking for the card-count never has to go through the discard.
+        Without the attribute keepDiscard the discard is dropped every DISCARD_TRIM cards, after adding it to the attribute discardTally.
 
         :param amount: The amount of cards to be drawn
-        :return: A list of cards from the attribute cardShoe
-        """
-        cardsDrawn = []
-        for i in range(amount):
-            cardsDrawn.append(self.cardShoe[0])
-            self.cardShoe.pop(0)
-        self.discardShoe.extend(cardsDrawn)
-        return cardsDrawn
+        :return: The codes of the drawn cards, a view on the card-shoe so nothing is copied
+        """
+        start = self.drawIndex
+        if start >= DISCARD_TRIM and not self.keepDiscard:
+            self.drop_discard()
+            start = 0
+        end = start + amount
+        if end > len(self.shoeCodes):
+            raise IndexError("draw from an empty card-shoe")
+        self.drawIndex = end
+        drawn = memoryview(self.shoeCodes)[start:end]
+        rankCounts = self.rankCounts
+        packedByCode = self.countTable.packedByCode
+        packedCount = self.packedCount
+        for code in drawn:
+            packedCount += packedByCode[code]
+            rankCounts[code >> 2] -= 1
+        self.packedCount = packedCount
+        self.countedCards += amount
+        return drawn
+
+    def drop_discard(self):
+        """
+        Adds the drawn cards to the attribute discardTally and removes them from the card-shoe.
+        Like add_cards this makes a new bytearray, so cards returned by draw stay valid.
+        """
+        discardTally = self.discardTally
+        for code in self.shoeCodes[:self.drawIndex]:
+            discardTally[code >> 2] += 1
+        self.shoeCodes = self.shoeCodes[self.drawIndex:]
+        self.drawIndex = 0
+
+    def discard_counts(self):
+        """
+        Gives the amount of cards of every rank in the discard, including the cards dropped from it
+
+        :return: A list with the amount of drawn cards of every rank, the first place belongs to the two
+        """
+        counts = list(self.discardTally)
+        for code in self.shoeCodes[:self.drawIndex]:
+            counts[code >> 2] += 1
+        return counts
 
     def create_shoe(self, length):
         """
-        Puts a certain amount of decks of cards into the attribute cardShoe and then shuffles the attribute.
+        Puts a certain amount of decks of cards into the card-shoe and then shuffles the cards that have not been drawn.
         This is used to create a shuffled card-shoe from which cards can be drawn to play the game of Blackjack.
 
-        :param length: The amount of decks that will be put into the attribute cardShoe
+        :param length: The amount of decks that will be put into the card-shoe
+        """
+        newCards = self.shoeCodes[self.drawIndex:] + FULL_DECK_CODES * length
+        self.randomStream.shuffle(newCards)
+        if not self.keepDiscard:
+            self.drop_discard()
+        self.shoeCodes = self.shoeCodes[:self.drawIndex] + newCards
+        self.rankCounts = [count + 4 * length for count in self.rankCounts]
+
+    def load_shoe(self, codes):
+        """
+        Replaces the card-shoe with an already shuffled one, such as one from a shuffle.ShoePool.
+        The card-counts are reset like blank_shoe does, without going through every card.
+
+        :param codes: The card codes of the shuffled card-shoe, a whole number of full decks
+        """
+        self.blank_shoe()
+        self.shoeCodes = bytearray(codes)
+        self.rankCounts = [len(codes) // 13] * 13
+
+    def composition(self):
+        """
+        Gives the cards left in the card-shoe by value, in the form used by the module analysis
+
+        :return: A tuple with the amount of cards left of every value, aces first and every ten and face card last
+        """
+        rankCounts = self.rankCounts
+        return (rankCounts[12],) + tuple(rankCounts[:8]) + (rankCounts[8] + rankCounts[9] + rankCounts[10] + rankCounts[11],)
+
+    def next_card_probability(self, rank):
+        """
+        Gives the chance that the next card drawn from the card-shoe has the given rank
+
+        :param rank: The rank of the card (2 up to and including 14 for the ace)
+        :return: The chance of drawing the rank, 0 when the card-shoe is empty
         """
-        for i in range(length):
-            self.cardShoe.extend(create_deck())
-        random.shuffle(self.cardShoe)
+        cardsLeft = len(self.shoeCodes) - self.drawIndex
+        if cardsLeft == 0:
+            return 0
+        return self.rankCounts[rank - 2] / cardsLeft
+
+    def tens_density(self):
+        """
+        Gives the part of the cards left in the card-shoe that are worth 10 (tens and face cards)
+
+        :return: The density of ten-valued cards, 0 when the card-shoe is empty
+        """
+        cardsLeft = len(self.shoeCodes) - self.drawIndex
+        if cardsLeft == 0:
+            return 0
+        rankCounts = self.rankCounts
+        return (rankCounts[8] + rankCounts[9] + rankCounts[10] + rankCounts[11]) / cardsLeft
+
+    def aces_remaining(self):
+        """
+        Gives the amount of aces left in the card-shoe
+
+        :return: The amount of aces left
+        """
+        return self.rankCounts[12]
 
     def value_hand(self):
         """
-        Calculates the value of the cards in the attribute cardShoe.
-        This value is not the card-count value but simply the hand value of the cardShoe.
+        Returns the value of the cards added to the card-shoe with add_cards, where aces count as 1 when 11 would go over 21.
+        This value is not the card-count value but simply the hand value of the cardShoe, it is only meaningful for a player's hand.
+
+        :return: The value of the hand
+        """
+        return self.handState.value()
+
+    def running_count(self, number):
+        """
+        Gives the running card-count of the discard in any registered count system
+
+        :param number: The number of the count system (see the module counting)
+        :return: The running card-count
+        """
+        return self.countTable.value(self.packedCount, self.countedCards, number)
+
+    def running_counts(self):
+        """
+        Gives the running card-count of the discard in every registered count system
+
+        :return: Dictionary from the name of every count system to its running card-count
+        """
+        return self.countTable.values(self.packedCount, self.countedCards)
 
-        :return: The cumulative value of all the cards in the attribute cardShoe
+    @property
+    def currentCardCount(self):
         """
-        num = 0
-        for card in self.cardShoe:
-            num += card.get_value()
-        return num
+        The running Hi-Lo card-count of the discard
+        """
+        return self.countTable.value(self.packedCount, self.countedCards, counting.HI_LO.number)
+
+    @property
+    def halvesCount(self):
+        """
+        The running Halves card-count of the discard
+        """
+        return self.countTable.value(self.packedCount, self.countedCards, counting.HALVES.number)
+
+    @property
+    def zenCount(self):
+        """
+        The running Zen Count card-count of the discard
+        """
+        return self.countTable.value(self.packedCount, self.countedCards, counting.ZEN_COUNT.number)
 
     def current_HiLo_count(self):
         """
-        Calculates and returns the total card count value in the players discardShoe (based on the Hi-Lo card-count System)
+        Returns the total card count value in the discard (based on the Hi-Lo card-count System)
 
-        :return: the cumulative card-count value of all the cards in the the discardShoe (based on the Hi-Lo card-count system)
+        :return: the cumulative card-count value of all the cards in the the discard (based on the Hi-Lo card-count system)
         """
-        num = 0
-        for card in self.discardShoe:
-            num += card.get_count_HiLo()
-        self.currentCardCount = num
-        return num
+        return self.currentCardCount
 
     def current_Halves_count(self):
         """
-        Calculates and returns the total card count value in the players discardShoe (based on the Halves card-count System)
+        Returns the total card count value in the discard (based on the Halves card-count System)
 
-        :return: the cumulative card-count value of all the cards in the the discardShoe (based on the Halves card-count system)
+        :return: the cumulative card-count value of all the cards in the the discard (based on the Halves card-count system)
         """
-        num = 0
-        for card in self.discardShoe:
-            num += card.get_count_Halves()
-        return num
+        return self.halvesCount
 
     def current_Zen_count(self):
         """
-        Calculates and returns the total card count value in the players discardShoe (based on the Zen Count System)
+        Returns the total card count value in the discard (based on the Zen Count System)
 
-        :return: the cumulative card-count value of all the cards in the the discardShoe (based on the Zen Count system)
+        :return: the cumulative card-count value of all the cards in the the discard (based on the Zen Count system)
         """
-        num = 0
-        for card in self.discardShoe:
-            num += card.get_count_Zen()
-        return num
+        return self.zenCount
 
 
 class Person:
@@ -222,6 +812,7 @@ class Person:
     :attribute hand: The player's hand of cards
     :attribute pot: The player's current bet
     :attribute count: The player's current hand value
+    :attribute stats: The statistics of every hand the player has played (see stats.HandStats)
     """
 
     def __init__(self, money, dealer, number, ):
@@ -235,9 +826,10 @@ class Person:
         self.money = money  # The amount of money a specific Person has
         self.dealer = dealer  # Boolean used to know who is the dealer
         self.number = number  # Player Number
-        self.hand = CardShoe()  # Player's hand of cards
+        self.hand = Hand()  # Player's hand of cards
         self.pot = 0  # The player's current bet
         self.count = 0  # THe player's current hand value
+        self.stats = stats.HandStats()  # The statistics of the player's hands
 
     def deal(self, cardShoe):
         """
@@ -280,103 +872,31 @@ class Person:
         """
         self.dealer = True
 
-    def show_hand(self):
+    def show_hand(self, output=None):
         """
         Prints the Person's hand in ASCII code, with the first card being hidden depending on if the attribute dealer is true or false.
         The ASCII code used came from https://codereview.stackexchange.com/questions/82103/ascii-fication-of-playing-cards.
         It has however been altered so it works with the code created by Maurits van 't Hag
+        The whole hand is written at once, see render_hand.
+
+        :param output: The output the hand is written to, the terminal when not given. Nothing is drawn for a disabled output.
         """
-        lines = [[] for i in range(9)]
-        if not self.dealer:
-            for card in self.hand.cardShoe:
-                suit = card.suit
-                rank = ""
-                space = " "
-                if card.rank == 10:
-                    space = ""
-                    rank = 10
-                elif card.rank < 10:
-                    rank = card.rank
-                elif card.rank == 11:
-                    rank = "J"
-                elif card.rank == 12:
-                    rank = "Q"
-                elif card.rank == 13:
-                    rank = "K"
-                elif card.rank == 14:
-                    rank = "A"
-                lines[0].append('┌─────────┐')
-                lines[1].append('│{}{}       │'.format(rank, space))  # use two {} one for char, one for space or char
-                lines[2].append('│         │')
-                lines[3].append('│         │')
-                lines[4].append('│    {}    │'.format(suit))
-                lines[5].append('│         │')
-                lines[6].append('│         │')
-                lines[7].append('│       {}{}│'.format(space, rank))
-                lines[8].append('└─────────┘')
-        else:
-            lines[0].append('┌─────────┐')
-            lines[1].append('│░░░░░░░░░│')
-            lines[2].append('│░░░░░░░░░│')
-            lines[3].append('│░░░░░░░░░│')
-            lines[4].append('│░░░░░░░░░│')
-            lines[5].append('│░░░░░░░░░│')
-            lines[6].append('│░░░░░░░░░│')
-            lines[7].append('│░░░░░░░░░│')
-            lines[8].append('└─────────┘')
-
-            for card in self.hand.cardShoe[1:len(self.hand.cardShoe)]:
-                suit = card.suit
-                rank = ""
-                space = " "
-                if card.rank == 10:
-                    space = ""
-                    rank = 10
-                elif card.rank < 10:
-                    rank = card.rank
-                elif card.rank == 11:
-                    rank = "J"
-                elif card.rank == 12:
-                    rank = "Q"
-                elif card.rank == 13:
-                    rank = "K"
-                elif card.rank == 14:
-                    rank = "A"
-                lines[0].append('┌─────────┐')
-                lines[1].append('│{}{}       │'.format(rank, space))  # use two {} one for char, one for space or char
-                lines[2].append('│         │')
-                lines[3].append('│         │')
-                lines[4].append('│    {}    │'.format(suit))
-                lines[5].append('│         │')
-                lines[6].append('│         │')
-                lines[7].append('│       {}{}│'.format(space, rank))
-                lines[8].append('└─────────┘')
-
-        result = []
-        for index, line in enumerate(lines):
-            result.append(''.join(lines[index]))
-            print(result[index])
+        if output is None:
+            output = CONSOLE_OUTPUT
+        if not output.enabled:
+            return
+        output.write(render_hand(bytes(self.hand.shoeCodes), self.dealer))
 
     def check_count(self):
         """
         Checks the Person's hand value then updates and returns it as their count attribute.
-        The code assumes that the player both wants the highest possible hand value and does not want to go bust.
-        It therefore stores the amount of aces in the player's hand and when going over a total of 21 checks if there are any in the person's hand.
-        If there is it sets the aces value from 11 to 1 and repeats this process until it's hand value no longer over 21 or is out of aces.
-        Finally returning the hand's value.
+        The code assumes that the player both wants the highest possible hand value and does not want to go bust,
+        so an ace is counted as 11 unless that takes the hand over 21.
+        The hand keeps this value up to date as cards are dealt (see HandState) so nothing has to be recalculated here.
 
         :return: The players newly set count attribute
         """
-        aces = 0
-        self.count = 0
-        for card in self.hand.cardShoe:
-            if card.get_value() == 11:
-                aces += 1
-            self.count += card.get_value()
-
-        while aces != 0 and self.count > 21:
-            aces -= 1
-            self.count -= 10
+        self.count = self.hand.handState.value()
         return self.count
 
     def reset_pot(self):
@@ -426,9 +946,21 @@ class AIPlayer(Person):
     :attribute risk: This is added to the number 17 to determine at what hand value the AI wil stop drawing cards.
     :attribute leaveCounter: The amount of times the AI has lost in total. The AI is programmed to leave after having lost to many times.
     :attribute leaveCondition: A threshold for which when passed causes the AI to leave the table out of tilt.
+    :attribute perfectPlay: When True the AI ignores risk and hits or stands based on the expected value of its hand (see Game.hit_stand_evs)
+    :attribute tablePlay: When True the AI ignores risk and plays by basic strategy with Hi-Lo deviations (see the module tables)
+    :attribute seats: The AISeats the attributes above are stored in, except for the name
+    :attribute seat: The place of the AI in the arrays of seats
     """
 
-    def __init__(self, name, accuracy, risk, unit, leaveCondition):
+    accuracy = seat_attribute('accuracy', "The amount that the AI's card count value is off using the Hi-Lo method")
+    risk = seat_attribute('risk', "This is added to the number 17 to determine at what amount the AI wil stop drawing cards")
+    unit = seat_attribute('unit', "The betting unit this AI bets in")
+    leaveCounter = seat_attribute('leaveCounter', "The amount of times the AI has lost in a row")
+    leaveCondition = seat_attribute('leaveCondition', "The amount of times the AI loses in a row before leaving the table")
+    perfectPlay = seat_attribute('perfectPlay', "Used to know if the AI plays by expected value instead of risk")
+    tablePlay = seat_attribute('tablePlay', "Used to know if the AI plays by the strategy tables instead of risk")
+
+    def __init__(self, name, accuracy, risk, unit, leaveCondition, perfectPlay=False, seats=None, tablePlay=False):
         """
         Initializes an instance of the class AIPLayer which is a child class for the class Person
 
@@ -437,14 +969,15 @@ class AIPlayer(Person):
         :param unit: The betting unit this AI bets in
         :param risk: Sets the risk the AI is willing to take, this amount is added to 17 and that result is when the AI will stop drawing cards.
         :param leaveCondition: Sets a threshold for when the AI leaves the table
+        :param perfectPlay: Set to True to let the AI play every hand the best way possible
+        :param seats: The AISeats to store the AI in, usually the one of the game (see Game.fill_with_ai), a new one when not given
+        :param tablePlay: Set to True to let the AI play by basic strategy and its deviations for the true count
         """
         super(AIPlayer, self).__init__(0, False, 0)
         self.name = name  # The AI's name
-        self.accuracy = accuracy  # The amount that the AI's card count value is off using the Hi-Lo method
-        self.unit = unit  # The betting unit this AI bets in
-        self.risk = risk  # This is added to the number 17 to determine at what amount the AI wil stop drawing cards
-        self.leaveCounter = 0  # The amount of times the AI has lost in a row
-        self.leaveCondition = leaveCondition  # The amount of times the AI loses in a row before leaving the table out of tilt
+        self.seats = seats if seats is not None else AISeats()  # Where the other attributes of the AI are stored
+        self.seat = self.seats.add(accuracy, risk, unit, leaveCondition, perfectPlay, 0, tablePlay)  # The AI's place in the arrays
+        self.hand.handState = SeatHandState(self.seats, self.seat)
 
     def check_bet_size(self, cardShoe):
         """
@@ -453,29 +986,26 @@ class AIPlayer(Person):
         :param cardShoe: the cardShoe used to determine what the true count is
         :return: the amount of money that the AI will bet
         """
-        decksRemaining = len(cardShoe.cardShoe) / 52
-        if cardShoe.current_HiLo_count() >= 0:
-            num = cardShoe.currentCardCount
-            calculation = num + self.accuracy
-        else:
-            num = cardShoe.currentCardCount
-            calculation = num - self.accuracy
-        if calculation <= 0:
-            return self.unit
-        trueCount = decksRemaining / calculation
-        return int(trueCount * self.unit)
+        return self.seats.bet_sizes((self.seat,), cardShoe)[0]
 
-    def check_next_move(self):
+    def check_next_move(self, game=None):
         """
-        Checks the AI's current hand and if they should draw another card based upon the risk attribute
+        Checks the AI's current hand and if they should draw another card based upon the risk attribute.
+        With the attribute perfectPlay set the AI instead stands when that is worth at least as much as hitting, which needs the game to see the cards.
+        With the attribute tablePlay set the AI looks its move up in the game's strategy tables (see Game.table_move).
 
+        :param game: The game being played, needed when the attribute perfectPlay or tablePlay is set
         :return: 1 for when the AI should stop drawing cards, 0 for when the AI should continue drawing cards
         """
-        num = self.hand.value_hand()
-        stopValue = self.risk + 17
-        if num >= stopValue:
-            return 1
-        return 0
+        if self.perfectPlay and game is not None:
+            stand, hit = game.hit_stand_evs(self)
+            if stand >= hit:
+                return 1
+            return 0
+        if self.tablePlay and game is not None:
+            return game.table_move(self)
+
+        return self.seats.stand_flags((self.seat,))[0]
 
     def check_leave(self):
         """
@@ -483,10 +1013,7 @@ class AIPlayer(Person):
 
         :return: False when the AI should stay in the game, True for when they should leave
         """
-        if self.leaveCounter < self.leaveCondition:
-            return False
-        else:
-            return True
+        return self.seats.leave_flags((self.seat,))[0]
 
 
 class Game:
@@ -496,24 +1023,45 @@ class Game:
     :attribute gameTrue: Attribute to determine if there is currently a game going on
     :attribute roundTrue: Attribute to determine if there is currently a round going on
     :attribute dealer: Creates a dealer of class Person with no money and number 0
-    :attribute cardShoe: Creates a card-shoe which holds all cards and discard from the current game
+    :attribute cardShoe: Creates a card-shoe which holds all cards of the current game and the card-counts of its discard
     :attribute startingDecks: The amount of Decks the player has specified are being used. (to be specified in initiate_game)
-    :attribute typeOfCount: The type of card-counting that will be used during this game of blackjack
+    :attribute typeOfCount: The number of the count system that will be used during this game of blackjack (see the module counting)
     :attribute listPlayers: List of players in the game
     :attribute artificialPlayers: List of artificial players
     :attribute artificialPlayersDiscard: List of artificial players that are no longer participating in a specific round
     :attribute listOfAI: List of AI not currently at the table
     :attribute showCount: Boolean specified by player to determine if the card-count is shown between rounds.
+    :attribute showDecks: Boolean specified by player to determine if the amount of decks remaining is shown between rounds.
+    :attribute strategy: The object that answers every decision the players make (bets, hit or stand, leaving the table)
+    :attribute output: The object every message and card of the game is written to
+    :attribute roundsPlayed: The amount of rounds that have been played in this game
+    :attribute eventSink: The sink every event of the game is emitted to (see the module events)
+    :attribute betBucket: The true count bucket of the card-shoe when the bets of the current round were placed
+    :attribute shoePool: The pool new card-shoes are taken from (see shuffle.ShoePool), None to shuffle them when needed
+    :attribute aiSeats: The AISeats every AI of the game is stored in, so the AI's decisions are made for all of them at once
+    :attribute seed: The seed of the game, the same seed with the same answers plays the same game again
+    :attribute randomStream: The random.Random deciding which AI join the table, derived from the attribute seed
+    :attribute maxAI: The most AI random_ai lets join the table
+    :attribute strategyTables: The tables.StrategyTables of the attribute startingDecks, None while no AI plays by them (see load_tables)
     """
 
-    def __init__(self):
+    def __init__(self, strategy=None, output=None, eventSink=None, shoePool=None, seed=None):
         """
         Initializes the class Game
+        When no strategy and output are given the game is played by the user at the terminal.
+
+        :param strategy: The object answering the players decisions, a ConsoleStrategy asking the user when not given
+        :param output: The object the game is written to, the terminal when not given
+        :param eventSink: The sink the events of the game are emitted to, they are thrown away when not given
+        :param shoePool: The pool new card-shoes are taken from, they are shuffled when needed when not given
+        :param seed: The seed of the game's random number streams (see derive_seed), a fresh seed when not given
         """
+        self.seed = seed if seed is not None else new_seed()  # Kept so the game can be played again
+        self.randomStream = random.Random(derive_seed(self.seed, "table"))  # Decides which AI join the table
         self.gameTrue = True  # Attribute to determine if there is currently a game going on
         self.roundTrue = True  # Attribute to determine if there is currently a round going on
         self.dealer = Person(0, True, 0)  # Creates a dealer of class Person with no money and number 0
-        self.cardShoe = CardShoe()  # Creates a card-shoe which holds all cards and discard from the current game
+        self.cardShoe = CardShoe(False, random.Random(derive_seed(self.seed, "shoe")))  # Creates a card-shoe which holds all cards and the card-counts of the discard from the current game
         self.startingDecks = 0  # The amount of Decks the player has specified are being used. (to be specified in initiate_game)
         self.typeOfCount = 0  # The type of card-counting that will be used during this game of blackjack
         self.listPlayers = []  # List of players in the game
@@ -522,6 +1070,15 @@ class Game:
         self.listOfAI = []  # List of AI not currently at the table
         self.showCount = False  # Boolean specified by player to determine if the card-count is shown between rounds.
         self.showDecks = False  # Boolean specified by player to determind if the amount of decks remaining is shown between rounds.
+        self.strategy = strategy if strategy is not None else ConsoleStrategy()  # Answers the decisions of the players
+        self.output = output if output is not None else CONSOLE_OUTPUT  # Where everything that happens is written to
+        self.roundsPlayed = 0  # The amount of rounds played so far
+        self.eventSink = eventSink if eventSink is not None else events.NullSink()  # Where the events of the game go
+        self.betBucket = 0  # The true count bucket the bets of this round were placed in
+        self.shoePool = shoePool  # Where shuffled card-shoes are taken from
+        self.aiSeats = AISeats()  # The attributes of every AI, stored as arrays
+        self.maxAI = MAX_AI  # The most AI that join the table on their own
+        self.strategyTables = None  # Loaded by load_tables once an AI plays by them
 
     def start_game(self):
         """
@@ -529,7 +1086,13 @@ class Game:
         """
         self.initiate_game()
         self.fill_with_ai()
+        self.run()
 
+    def run(self):
+        """
+        Keeps playing rounds until the attribute gameTrue is set to False.
+        Used by start_game, and on its own by headless games that were set up with the function setup.
+        """
         while self.gameTrue:
             self.round()
 
@@ -542,19 +1105,119 @@ class Game:
         3. Asks for the number of players
         4. Asks for the amount of money every player starts out with
         """
-        print("Hello Player. Welcome to blackjack.")
-        print("-" * 45)
+        self.output.write("Hello Player. Welcome to blackjack.")
+        self.output.write("-" * 45)
 
-        self.typeOfCount = ask_count_type()
+        typeOfCount = ask_count_type()
         self.ask_show_count()
         self.ask_show_decks()
 
         numPlayers = ask_num_players()
         startingMoney = ask_num_money()
-        self.startingDecks = ask_num_decks()
-        self.cardShoe.create_shoe(self.startingDecks)
+        startingDecks = ask_num_decks()
+        self.setup(typeOfCount, numPlayers, startingMoney, startingDecks, self.showCount, self.showDecks)
+
+    def setup(self, typeOfCount, numPlayers, startingMoney, startingDecks, showCount=False, showDecks=False):
+        """
+        Sets up the game without asking the user anything, initiate_game uses this after collecting the answers.
+        Headless games call this directly instead of initiate_game.
+
+        :param typeOfCount: The number of the count system, 2 for Hi-Lo, 1 for Halves and 0 for Zen Count (see the module counting)
+        :param numPlayers: The amount of players at the table
+        :param startingMoney: The amount of money every player starts out with
+        :param startingDecks: The amount of decks in the card-shoe
+        :param showCount: True if the card-count should be shown before every round
+        :param showDecks: True if the amount of decks remaining should be shown before every round
+        """
+        self.typeOfCount = typeOfCount
+        self.showCount = showCount
+        self.showDecks = showDecks
+        self.startingDecks = startingDecks
+        self.emit(events.GAME_SETUP, 0, startingMoney, struct.pack(events.SETUP_FORMAT, typeOfCount, startingDecks, numPlayers))
+        self.new_shoe()
         self.listPlayers = player_maker(numPlayers, startingMoney)
 
+    def new_shoe(self):
+        """
+        Replaces the card-shoe with a freshly shuffled one with the attribute startingDecks as its amount of decks.
+        The card-shoe is taken from the attribute shoePool when it has card-shoes with that amount of decks,
+        it is shuffled here when the pool has none ready and doesn't wait for one.
+        """
+        codes = None
+        if self.shoePool is not None and self.shoePool.decks == self.startingDecks:
+            codes = self.shoePool.get()
+        if codes is not None:
+            self.cardShoe.load_shoe(codes)
+        else:
+            self.cardShoe.blank_shoe()
+            self.cardShoe.create_shoe(self.startingDecks)
+        self.emit_reshuffle()
+        self.load_tables()
+
+    def load_tables(self):
+        """
+        Loads the strategy tables of the attribute startingDecks when any AI of the game plays by them (see the module tables),
+        so table_move never has to load them during a round.
+        The tables are built and written to the cache on disk first when they have not been built for these rules yet.
+        The game calls this when it is set up, when AI are added and when the amount of decks changes.
+        """
+        if any(self.aiSeats.tablePlay) and (self.strategyTables is None or self.strategyTables.decks != self.startingDecks):
+            self.strategyTables = tables.load(self.startingDecks)
+
+    def emit(self, kind, seat, value=0, data=None):
+        """
+        Emits an event of the current round to the attribute eventSink
+
+        :param kind: One of the event kinds in the module events
+        :param seat: The number of the player the event belongs to, 0 for the dealer
+        :param value: The number belonging to the event
+        :param data: Extra data belonging to the event
+        """
+        self.eventSink.emit(kind, self.roundsPlayed, seat, value, data)
+
+    def emit_cards(self, person, amount):
+        """
+        Emits a card dealt event for the last cards a person was given
+
+        :param person: The person that was given the cards
+        :param amount: The amount of cards they were given
+        """
+        if self.eventSink.enabled:
+            for code in person.hand.shoeCodes[-amount:]:
+                self.eventSink.emit(events.CARD_DEALT, self.roundsPlayed, person.number, code)
+
+    def emit_reshuffle(self):
+        """
+        Emits a reshuffle event with the order of every card in the freshly made card-shoe
+        """
+        if self.eventSink.enabled:
+            self.emit(events.RESHUFFLE, 0, self.startingDecks, bytes(self.cardShoe.shoeCodes))
+
+    def emit_roster(self, AIs, seated):
+        """
+        Emits a roster event with the settings of AI added to the attribute listOfAI, so a replay can add the same AI
+
+        :param AIs: The AI that were added
+        :param seated: The amount of them that were seated at the table at once
+        """
+        if self.eventSink.enabled:
+            roster = [{"name": AI.name, "accuracy": AI.accuracy, "risk": AI.risk, "unit": AI.unit,
+                       "leaveCondition": AI.leaveCondition, "perfectPlay": bool(AI.perfectPlay),
+                       "tablePlay": bool(AI.tablePlay)} for AI in AIs]
+            self.emit(events.AI_ROSTER, 0, seated, json.dumps(roster).encode())
+
+    def settle(self, person, result, blackjack=False):
+        """
+        Records the result of a person's hand in their statistics and emits it as a payout event.
+        Only records the result, paying out or taking the bet is left to the caller.
+
+        :param person: The person whose hand is settled
+        :param result: The amount won with the hand, negative when lost and 0 when the bet is given back
+        :param blackjack: True if the hand was won with blackjack
+        """
+        person.stats.add_hand(result, self.betBucket, blackjack)
+        self.emit(events.PAYOUT, person.number, result)
+
     def round(self):
         """
         Houses the format for a single round of blackjack in the following format:
@@ -572,8 +1235,21 @@ class Game:
         11. Asks the player's if they wish to leave
         12. Asks the user if they wish to stop playing Blackjack in general
         13. Checks if the players have enough money to continue
+
+        The round is split in begin_round, action_time, finish_round and end_round so a game that waits for its players' answers
+        elsewhere (see the module server) can play the same round one move at a time.
         """
+        changeableList = self.begin_round()
+        changeableList = self.action_time(changeableList)
+        self.finish_round(changeableList)
+        self.end_round()
 
+    def begin_round(self):
+        """
+        Plays a round up to the moment the players take their turns: the bets, dealing the cards and checking for blackjack
+
+        :return: a list of the players still playing the round
+        """
         self.check_shoe()
         self.random_ai()
 
@@ -582,38 +1258,53 @@ class Game:
 
         self.reset_ai()
 
-        print("Starting round:")
+        self.output.write("Starting round:")
+        self.roundsPlayed += 1
+        self.emit(events.ROUND_START, 0, len(self.listPlayers))
         self.roundTrue = True
         self.dealer.set_dealer_true()
-        collect_bets(self.listPlayers)
+        self.betBucket = stats.true_count_bucket(self.cardShoe)
+        self.collect_bets()
         self.ai_bet()
         changeableList = self.listPlayers.copy()
 
-        # This christmas tree structure is needed to be able to stop the round after every stage of said round
         self.deal_cards()
         if self.roundTrue:
             changeableList = self.first_check(changeableList)
+        return changeableList
+
+    def finish_round(self, changeableList):
+        """
+        Plays the rest of a round after the players took their turns: the AI, the dealer and the showdown
+
+        :param changeableList: a list of the players still playing the round
+        """
+        # This christmas tree structure is needed to be able to stop the round after every stage of said round
+        if self.roundTrue:
+            self.ai_play()
+            if len(self.listPlayers) == 0 and len(self.artificialPlayers) == 0:
+                self.roundTrue = False
             if self.roundTrue:
-                changeableList = self.action_time(changeableList)
-                self.ai_play()
-                if len(self.listPlayers) == 0 and len(self.artificialPlayers) == 0:
-                    self.roundTrue = False
+                changeableList = self.dealer_draws(changeableList)
                 if self.roundTrue:
-                    changeableList = self.dealer_draws(changeableList)
-                    if self.roundTrue:
-                        self.showdown(changeableList)
+                    self.showdown(changeableList)
 
         self.check_if_ai_leaves()
-        print("-" * 45)
+        self.output.write("-" * 45)
         self.show_money()
         self.reset_hands()
 
+    def end_round(self):
+        """
+        Asks the players if they leave or stop playing and removes the players that are broke, between two rounds
+        """
         if self.gameTrue:
             self.check_if_leave()
         if self.gameTrue:
             self.ask_game_true()
             if not self.gameTrue:
                 self.show_money()
+                self.show_stats()
 
         self.check_player_balance()
 
@@ -622,17 +1313,15 @@ class Game:
         Checks if there are player who would like to leave.
         If there are it asks each player one by one if they would like to leave and removes them
         """
-        print("Would any players like to leave the table?")
-        answer = ask_yes_no()
-        storage = []
+        self.output.write("Would any players like to leave the table?")
+        answer = self.strategy.anyone_leaving(self)
+        leaving = bytearray(len(self.listPlayers))
         if answer == 1:
-            for player in self.listPlayers:
-                print("Would player " + str(player.number) + ".")
-                remove = ask_yes_no()
-                if remove == 1:
-                    storage.append(player)
-        for player in storage:
-            self.listPlayers.remove(player)
+            for index, player in enumerate(self.listPlayers):
+                self.output.write("Would player " + str(player.number) + ".")
+                leaving[index] = self.strategy.wants_to_leave(self, player) == 1
+        for player in drop_flagged(self.listPlayers, leaving):
+            self.emit(events.PLAYER_LEAVE, player.number)
         if len(self.listPlayers) == 0:
             self.gameTrue = False
 
@@ -641,14 +1330,16 @@ class Game:
         Checks if there are players who are now broke, if there are it removes them from the game entirely
         and if there are no players left it closes the casino
         """
-        for player in self.listPlayers:
+        broke = bytearray(len(self.listPlayers))
+        for index, player in enumerate(self.listPlayers):
             if player.money == 0:
-                print("Player " + str(player.number) + " has no funds and will therefore be ejected from the Casino.")
-                print("-" * 45)
-                self.listPlayers.remove(player)
+                self.output.write("Player " + str(player.number) + " has no funds and will therefore be ejected from the Casino.")
+                self.output.write("-" * 45)
+                broke[index] = 1
+        drop_flagged(self.listPlayers, broke)
         if len(self.listPlayers) == 0:
-            print("There is no one left.")
-            print("The casino now closes.")
+            self.output.write("There is no one left.")
+            self.output.write("The casino now closes.")
             self.roundTrue = False
             self.gameTrue = False
 
@@ -659,21 +1350,24 @@ class Game:
         """
         self.dealer.player_hand_blank()
         self.dealer.deal(self.cardShoe)
-        print("Dealer's hand:")
-        self.dealer.show_hand()
+        self.emit_cards(self.dealer, 2)
+        self.output.write("Dealer's hand:")
+        self.dealer.show_hand(self.output)
 
         for player in self.listPlayers:
             player.player_hand_blank()
             player.deal(self.cardShoe)
-            print("Player " + str(player.number) + "'s hand:")
-            player.show_hand()
+            self.emit_cards(player, 2)
+            self.output.write("Player " + str(player.number) + "'s hand:")
+            player.show_hand(self.output)
 
         for AI in self.artificialPlayers:
             AI.player_hand_blank()
             AI.deal(self.cardShoe)
-            print(AI.name + " their hand")
-            AI.show_hand()
-        print("-" * 45)
+            self.emit_cards(AI, 2)
+            self.output.write(AI.name + " their hand")
+            AI.show_hand(self.output)
+        self.output.write("-" * 45)
 
     def first_check(self, givenList):
         """
@@ -685,67 +1379,76 @@ class Game:
         if self.dealer.check_count() == 21:
             self.dealer.set_dealer_false()
             for player in self.listPlayers:
-                if player.check_count != 21:
-                    print("The dealer has blackjack, player " + str(player.number) + " does not.")
-                    print("-" * 45)
-                    print("Dealer's Cards")
-                    self.dealer.show_hand()
-                    print("Player " + str(player.number) + "'s Cards")
-                    player.show_hand()
+                if player.check_count() != 21:
+                    self.output.write("The dealer has blackjack, player " + str(player.number) + " does not.")
+                    self.output.write("-" * 45)
+                    self.output.write("Dealer's Cards")
+                    self.dealer.show_hand(self.output)
+                    self.output.write("Player " + str(player.number) + "'s Cards")
+                    player.show_hand(self.output)
+                    self.settle(player, -player.pot)
                     player.reset_pot()
-                    print("Dealer takes your money, current balance player " + str(player.number) + ": " + str(
+                    self.output.write("Dealer takes your money, current balance player " + str(player.number) + ": " + str(
                         player.money))
-                    print("-" * 45)
+                    self.output.write("-" * 45)
                 else:
-                    print("Both player " + str(player.number) + " and the dealer have blackjack")
-                    print("Player will be given back their money.")
-                    print("-" * 45)
-                    print("Dealer's Cards")
-                    self.dealer.show_hand()
-                    print("Player " + str(player.number) + "'s Cards")
-                    player.show_hand()
+                    self.output.write("Both player " + str(player.number) + " and the dealer have blackjack")
+                    self.output.write("Player will be given back their money.")
+                    self.output.write("-" * 45)
+                    self.output.write("Dealer's Cards")
+                    self.dealer.show_hand(self.output)
+                    self.output.write("Player " + str(player.number) + "'s Cards")
+                    player.show_hand(self.output)
+                    self.settle(player, 0)
                     player.return_money()
-                    print("Player" + str(player.number) + "'s balance is currently: " + str(player.money))
+                    self.output.write("Player" + str(player.number) + "'s balance is currently: " + str(player.money))
                     player.hand.blank_shoe()
-                    print("-" * 45)
+                    self.output.write("-" * 45)
 
             for AI in self.artificialPlayers:
-                if AI.check_count != 21:
-                    print("The dealer has blackjack " + AI.name + " does not.")
-                    print("Their bet will be taken")
-                    print("-" * 45)
-                    print("Dealer's Cards")
-                    self.dealer.show_hand()
-                    print(AI.name + " their Cards")
-                    AI.show_hand()
+                if AI.check_count() != 21:
+                    self.output.write("The dealer has blackjack " + AI.name + " does not.")
+                    self.output.write("Their bet will be taken")
+                    self.output.write("-" * 45)
+                    self.output.write("Dealer's Cards")
+                    self.dealer.show_hand(self.output)
+                    self.output.write(AI.name + " their Cards")
+                    AI.show_hand(self.output)
+                    self.settle(AI, -AI.pot)
                     AI.leaveCounter += 1
-                    print("-" * 45)
-                elif AI.check_count == 21:
-                    print(AI.name + " and the dealer have blackjack")
-                    print(AI.name + " will be given back their money.")
-                    print("-" * 45)
-                    print("Dealer's Cards")
-                    self.dealer.show_hand()
-                    print(AI.name + "Cards")
-                    AI.show_hand()
+                    self.output.write("-" * 45)
+                elif AI.check_count() == 21:
+                    self.output.write(AI.name + " and the dealer have blackjack")
+                    self.output.write(AI.name + " will be given back their money.")
+                    self.output.write("-" * 45)
+                    self.output.write("Dealer's Cards")
+                    self.dealer.show_hand(self.output)
+                    self.output.write(AI.name + "Cards")
+                    AI.show_hand(self.output)
+                    self.settle(AI, 0)
                     AI.hand.blank_shoe()
-                    print("-" * 45)
+                    self.output.write("-" * 45)
             self.roundTrue = False
 
         else:
-            for player in givenList:
+            finished = bytearray(len(givenList))
+            for index, player in enumerate(givenList):
                 if player.check_count() == 21:
+                    self.settle(player, int(player.pot * 2.5) - player.pot, True)
                     player.pay_player(True)
-                    print("Player " + str(player.number) + " got Blackjack!")
-                    print("Your new balance is now: " + str(player.money))
-                    givenList.remove(player)
+                    self.output.write("Player " + str(player.number) + " got Blackjack!")
+                    self.output.write("Your new balance is now: " + str(player.money))
+                    finished[index] = 1
+            drop_flagged(givenList, finished)
 
-            for AI in self.artificialPlayers:
+            finished = bytearray(len(self.artificialPlayers))
+            for index, AI in enumerate(self.artificialPlayers):
                 if AI.check_count() == 21:
-                    print(AI.name + " has Blackjack.")
+                    self.output.write(AI.name + " has Blackjack.")
+                    self.settle(AI, int(AI.pot * 2.5) - AI.pot, True)
                     AI.leaveCounter += -1
-                    self.artificialPlayersDiscard.append(AI)
-                    self.artificialPlayers.remove(AI)
+                    finished[index] = 1
+            self.artificialPlayersDiscard.extend(drop_flagged(self.artificialPlayers, finished))
 
         if len(givenList) == 0 and len(self.artificialPlayers) == 0:
             self.roundTrue = False
@@ -759,38 +1462,60 @@ class Game:
         :param givenList: a list of all player still playing the game
         :return: a list containing all remaining players still in the game
         """
-        storage = []
-        for player in givenList:
+        busted = bytearray(len(givenList))
+        for index, player in enumerate(givenList):
             playing = True
             if self.roundTrue:
                 while playing:
-                    print("-" * 45)
-                    print("Player " + str(player.number) + " is playing")
-                    player.show_hand()
-                    answer = ask_player_move()
-                    if answer == 2:
-                        self.show_card_count()
-                    elif answer == 1:
-                        print("This is player " + str(player.number) + "'s final hand.")
-                        player.show_hand()
-                        player.check_count()
-                        print("-" * 45)
-                        playing = False
-                    elif answer == 0:
-                        player.hit(self.cardShoe)
-                        player.show_hand()
-                        if player.check_count() > 21:
-                            print("Player " + str(player.number) + " went bust.")
-                            print("Player " + str(player.number) + " has " + str(player.money) + " left")
-                            player.reset_pot()
-                            player.hand.blank_shoe()
-                            storage.append(player)
-                            print("-" * 45)
-                            playing = False
-        for player in storage:
-            givenList.remove(player)
+                    self.show_turn(player)
+                    result = self.player_move(player, self.strategy.next_move(self, player))
+                    busted[index] = result == 2
+                    playing = result == 0
+        drop_flagged(givenList, busted)
         return givenList
 
+    def show_turn(self, player):
+        """
+        Shows whose turn it is and their hand, before every move they make
+
+        :param player: The player whose turn it is
+        """
+        self.output.write("-" * 45)
+        self.output.write("Player " + str(player.number) + " is playing")
+        player.show_hand(self.output)
+
+    def player_move(self, player, answer):
+        """
+        Makes a single move for a player
+
+        :param player: The player making the move
+        :param answer: 0 to hit, 1 to stand and 2 to show the card-count (see ask_player_move)
+        :return: 0 when the player is still playing, 1 when they stood and 2 when they went bust
+        """
+        if answer == 2:
+            self.show_card_count()
+        elif answer == 1:
+            self.output.write("This is player " + str(player.number) + "'s final hand.")
+            player.show_hand(self.output)
+            self.emit(events.STAND, player.number, player.check_count())
+            self.output.write("-" * 45)
+            return 1
+        elif answer == 0:
+            self.emit(events.HIT, player.number)
+            player.hit(self.cardShoe)
+            self.emit_cards(player, 1)
+            player.show_hand(self.output)
+            if player.check_count() > 21:
+                self.emit(events.BUST, player.number, player.count)
+                self.settle(player, -player.pot)
+                self.output.write("Player " + str(player.number) + " went bust.")
+                self.output.write("Player " + str(player.number) + " has " + str(player.money) + " left")
+                player.reset_pot()
+                player.hand.blank_shoe()
+                self.output.write("-" * 45)
+                return 2
+        return 0
+
     def dealer_draws(self, givenList):
         """
         The dealer draws their cards up to card value 17
@@ -798,25 +1523,28 @@ class Game:
         :param givenList: a list of all player still playing the game
         :return: a list containing all remaining players still in the game
         """
-        print("The dealer will now draw cards:")
-        print("-" * 45)
+        self.output.write("The dealer will now draw cards:")
+        self.output.write("-" * 45)
         self.dealer.set_dealer_false()
-        print("Dealer's current hand:")
-        self.dealer.show_hand()
+        self.output.write("Dealer's current hand:")
+        self.dealer.show_hand(self.output)
         self.dealer.check_count()
 
-        if self.dealer.check_count() > 17:
+        if self.dealer.check_count() >= analysis.DEALER_STANDS_ON:
             playing = False
         else:
             playing = True
         while playing:
-            print("Dealer pulls a card:")
+            self.output.write("Dealer pulls a card:")
+            self.emit(events.HIT, self.dealer.number)
             self.dealer.hit(self.cardShoe)
-            self.dealer.show_hand()
-            if self.dealer.check_count() >= 17:
+            self.emit_cards(self.dealer, 1)
+            self.dealer.show_hand(self.output)
+            if self.dealer.check_count() >= analysis.DEALER_STANDS_ON:
                 playing = False
-        print("-" * 45)
-        print("Dealer has enough Cards")
+        self.emit(events.STAND, self.dealer.number, self.dealer.count)
+        self.output.write("-" * 45)
+        self.output.write("Dealer has enough Cards")
 
         return givenList
 
@@ -830,12 +1558,10 @@ class Game:
             player.player_hand_blank()
         self.roundTrue = False
 
-        storage = []
         for AI in self.artificialPlayersDiscard:
-            storage.append(AI)
             AI.player_hand_blank()
-            self.artificialPlayersDiscard.remove(AI)
-        self.artificialPlayers.extend(storage)
+        self.artificialPlayers.extend(self.artificialPlayersDiscard)
+        self.artificialPlayersDiscard.clear()
 
     def showdown(self, givenList):
         """
@@ -843,62 +1569,70 @@ class Game:
 
         :param givenList: a list of all players still playing the game
         """
-        print("Dealer and players compare hands.")
-        print("-" * 45)
+        self.output.write("Dealer and players compare hands.")
+        self.output.write("-" * 45)
 
         if self.dealer.check_count() > 21:
             self.dealer.set_dealer_false()
-            print("-" * 45)
-            print("The dealer went bust.")
-            print("-" * 45)
-            self.dealer.show_hand()
-            print("-" * 45)
+            self.output.write("-" * 45)
+            self.output.write("The dealer went bust.")
+            self.output.write("-" * 45)
+            self.dealer.show_hand(self.output)
+            self.output.write("-" * 45)
             for player in givenList:
-                print("Player " + str(player.number) + " is paid " + str(player.pot))
+                self.output.write("Player " + str(player.number) + " is paid " + str(player.pot))
+                self.settle(player, player.pot)
                 player.pay_player(False)
-                print("Player " + str(player.number) + " current balance is: " + str(player.money))
+                self.output.write("Player " + str(player.number) + " current balance is: " + str(player.money))
             for AI in self.artificialPlayers:
-                print(AI.name + " is paid.")
+                self.output.write(AI.name + " is paid.")
+                self.settle(AI, AI.pot)
             self.roundTrue = False
 
         else:
             for player in givenList:
-                print("Dealer's Hand:")
-                self.dealer.show_hand()
-                print("Player " + str(player.number) + "'s hand:")
-                player.show_hand()
+                self.output.write("Dealer's Hand:")
+                self.dealer.show_hand(self.output)
+                self.output.write("Player " + str(player.number) + "'s hand:")
+                player.show_hand(self.output)
                 player.check_count()
                 self.dealer.check_count()
 
                 if player.count > self.dealer.count:
-                    print("Player wins by " + str(player.count - self.dealer.count) + ".")
+                    self.output.write("Player wins by " + str(player.count - self.dealer.count) + ".")
+                    self.settle(player, player.pot)
                     player.pay_player(False)
-                    print("Player's current balance is: " + str(player.money))
+                    self.output.write("Player's current balance is: " + str(player.money))
                 elif player.count == self.dealer.count:
-                    print("Player loses by tie.")
+                    self.output.write("Player loses by tie.")
+                    self.settle(player, -player.pot)
                     player.reset_pot()
-                    print("Player's current balance is: " + str(player.money))
+                    self.output.write("Player's current balance is: " + str(player.money))
                 elif player.count < self.dealer.count:
-                    print("Player loses by " + str(self.dealer.count - player.count) + ".")
+                    self.output.write("Player loses by " + str(self.dealer.count - player.count) + ".")
+                    self.settle(player, -player.pot)
                     player.reset_pot()
-                    print("Player's current balance is: " + str(player.money))
+                    self.output.write("Player's current balance is: " + str(player.money))
 
             for AI in self.artificialPlayers:
-                print("Dealer's Hand:")
-                self.dealer.show_hand()
-                print(AI.name + " their hand:")
-                AI.show_hand()
+                self.output.write("Dealer's Hand:")
+                self.dealer.show_hand(self.output)
+                self.output.write(AI.name + " their hand:")
+                AI.show_hand(self.output)
 
                 if AI.check_count() > self.dealer.count:
-                    print(AI.name + " wins by " + str(AI.count - self.dealer.count) + ".")
-                    print(AI.name + " is paid. ")
+                    self.output.write(AI.name + " wins by " + str(AI.count - self.dealer.count) + ".")
+                    self.output.write(AI.name + " is paid. ")
+                    self.settle(AI, AI.pot)
                     if AI.leaveCounter > 0:
                         AI.leaveCounter += -1
                 elif AI.check_count() == self.dealer.count:
-                    print(AI.name + " loses by tie.")
+                    self.output.write(AI.name + " loses by tie.")
+                    self.settle(AI, -AI.pot)
                     AI.leaveCounter += 1
                 elif AI.check_count() < self.dealer.count:
-                    print(AI.name + " loses by " + str(self.dealer.count - AI.count) + ".")
+                    self.output.write(AI.name + " loses by " + str(self.dealer.count - AI.count) + ".")
+                    self.settle(AI, -AI.pot)
                     AI.leaveCounter += 1
 
             self.roundTrue = False
@@ -907,7 +1641,7 @@ class Game:
         """
         Asks the user if they want to continue playing
         """
-        answer = ask_game_stop()
+        answer = self.strategy.stop_game(self)
         if answer == 1:
             self.gameTrue = False
 
@@ -915,48 +1649,123 @@ class Game:
         """
         Prints every player's balance
         """
-        print("These are the players scores")
-        print("-" * 45)
+        self.output.write("These are the players scores")
+        self.output.write("-" * 45)
+        for player in self.listPlayers:
+            self.output.write("Player " + str(player.number) + "'s balance: " + str(player.money))
+
+    def show_stats(self):
+        """
+        Prints the statistics of every player's hands
+        """
         for player in self.listPlayers:
-            print("Player " + str(player.number) + "'s balance: " + str(player.money))
+            self.output.write("-" * 45)
+            self.output.write("Player " + str(player.number) + "'s statistics:")
+            for line in player.stats.summary():
+                self.output.write(line)
 
     def check_shoe(self):
         """
         Checks the length of the card-shoe, if the card-shoe is less than half a deck of cards long it generates a new card-shoe.
-        """
-        if self.cardShoe.len_cardshoe() < (((len(self.listPlayers) + len(self.artificialPlayers)) * 5) + 5):
-            print("The card-shoe is becoming to low to continue playing with.")
-            print("We will therefore replace it, this will reset the card count.")
-            print("-" * 45)
-            print("Would you like the original amount of decks in the card-shoe?")
-            answer = ask_yes_no()
+        The new card-shoe never has fewer decks than decks_needed, whatever amount of decks is asked for.
+        """
+        if self.shoe_needs_replacing():
+            self.output.write("The card-shoe is becoming to low to continue playing with.")
+            self.output.write("We will therefore replace it, this will reset the card count.")
+            self.output.write("-" * 45)
+            self.output.write("Would you like the original amount of decks in the card-shoe?")
+            answer = self.strategy.keep_decks(self)
             if answer == 0:
-                self.startingDecks = ask_num_decks()
-            self.cardShoe.blank_shoe()
-            self.cardShoe.create_shoe(self.startingDecks)
-            print("Card-shoe changed")
+                self.startingDecks = self.strategy.num_decks(self)
+            if self.startingDecks < self.decks_needed():
+                self.startingDecks = self.decks_needed()
+                self.output.write("That is too few decks for everyone at the table, the card-shoe gets " +
+                                  str(self.startingDecks) + " decks.")
+            self.new_shoe()
+            self.output.write("Card-shoe changed")
+
+    def dealer_upcard(self):
+        """
+        Gives the value of the dealer's visible card, the second card they were dealt
+
+        :return: The value of the dealer's visible card (1 for an ace)
+        """
+        return HARD_VALUE_BY_CODE[self.dealer.hand.shoeCodes[1]]
+
+    def unseen_composition(self):
+        """
+        Counts the cards the players have not seen by value: the cards left in the card-shoe and the dealer's hidden card
+
+        :return: The composition of the unseen cards (see CardShoe.composition)
+        """
+        composition = list(self.cardShoe.composition())
+        composition[HARD_VALUE_BY_CODE[self.dealer.hand.shoeCodes[0]] - 1] += 1
+        return tuple(composition)
+
+    def dealer_outcomes(self):
+        """
+        Gives the chance of every final total of the dealer given their visible card and the unseen cards.
+        Meant to be used while the players are playing, by then the dealer is known not to have blackjack.
+        The results are cached by the module analysis, so asking again for the same cards costs next to nothing.
+
+        :return: A tuple with the chance of the dealer ending on 17, 18, 19, 20, 21 and going bust
+        """
+        return analysis.dealer_outcomes(self.dealer_upcard(), self.unseen_composition(), True)
+
+    def hit_stand_evs(self, person):
+        """
+        Gives the expected value of standing and of hitting for a person's hand, given the dealer's visible card and every card not yet seen.
+        The next card is followed exactly and the rest of the hand with the approximate analysis.upcard_table
+        (see analysis.PERFECT_PLAY_DEPTH), following every card exactly takes up to a second for a single decision.
+        Results are cached by the module analysis, so players at the same table asking about the same cards share the work.
+
+        :param person: The player or AI whose hand it is
+        :return: A tuple with the expected value of standing and of hitting, in bets won or lost
+        """
+        handState = person.hand.handState
+        return analysis.hand_evs(handState.hardTotal, handState.aces != 0, self.dealer_upcard(),
+                                 self.unseen_composition(), True, analysis.PERFECT_PLAY_DEPTH)
+
+    def table_move(self, person):
+        """
+        Looks up the move for a person's hand in the strategy tables of the game's amount of decks, for the current Hi-Lo true count.
+        The tables are loaded beforehand by load_tables, so a move is a single lookup in the memory-mapped file.
+
+        :param person: The player or AI whose hand it is
+        :return: 1 to stand and 0 to hit
+        """
+        strategyTables = self.strategyTables
+        if strategyTables is None or strategyTables.decks != self.startingDecks:
+            raise RuntimeError("the strategy tables of " + str(self.startingDecks) + " decks are not loaded, see Game.load_tables")
+        handState = person.hand.handState
+        return strategyTables.move(handState.hardTotal, handState.aces != 0, self.dealer_upcard(),
+                                   stats.true_count_bucket(self.cardShoe))
+
+    def shoe_needs_replacing(self):
+        """
+        Checks if there are too few cards left in the card-shoe to safely play another round, five cards for everyone at the table and the dealer.
+
+        :return: True if the card-shoe should be replaced before the next round, False if not
+        """
+        return self.cardShoe.len_cardshoe() < (((len(self.listPlayers) + len(self.artificialPlayers)) * 5) + 5)
 
     def show_card_count(self):
         """
         If the boolean showCount has been set to true.
         Shows the card-count, dependent on the type of card count that has been specified.
         """
-        print("-" * 45)
-        print("Current card count value is:")
+        self.output.write("-" * 45)
+        self.output.write("Current card count value is:")
         if self.showCount:
-            if self.typeOfCount == 2:
-                print("Hi-Lo system: " + str(self.cardShoe.current_HiLo_count()))
-            elif self.typeOfCount == 1:
-                print("Halves system: " + str(self.cardShoe.current_Halves_count()))
-            elif self.typeOfCount == 0:
-                print("Zen Count system: " + str(self.cardShoe.current_Zen_count()))
-            print("-" * 45)
+            system = counting.SYSTEMS[self.typeOfCount]
+            self.output.write(system.name + " system: " + str(self.cardShoe.running_count(system.number)))
+            self.output.write("-" * 45)
 
     def ask_show_count(self):
         """
         Asks the user if they would like the card-count shown before they bet at the beginning of every round.
         """
-        print("Would you like us to show you the card-count before betting every round?")
+        self.output.write("Would you like us to show you the card-count before betting every round?")
         answer = ask_yes_no()
         if answer == 1:
             self.showCount = True
@@ -968,7 +1777,7 @@ class Game:
         Asks the player if they would like the amount of decks shown before every round.
         This is done because the amount of decks left is important to the true count, which can be used to adjust your bet size while counting cards.
         """
-        print("Would you like us to show you the amount of decks left before betting every round?")
+        self.output.write("Would you like us to show you the amount of decks left before betting every round?")
         answer = ask_yes_no()
         if answer == 1:
             self.showDecks = True
@@ -981,88 +1790,119 @@ class Game:
         If someone does join the table an AI is plucked from a pre-generated list with preset values determining the way they will play and how quickly they will leave.
         Then printing a random message to announce the AI has joined the table.
         """
-        ran = random.randint(1, 10)
+        ran = self.randomStream.randint(1, 10)
         if ran <= 8:
-            print("No one new joins the table.")
+            self.output.write("No one new joins the table.")
         else:
-            if len(self.listOfAI) > 0 and len(self.artificialPlayers) < 3:
-                num = random.randint(0, len(self.listOfAI) - 1)
-                AI = self.listOfAI[num]
-                self.listOfAI.pop(num)
-                self.artificialPlayers.append(AI)
-                ran = random.randint(1, 8)
+            if len(self.listOfAI) > 0 and len(self.artificialPlayers) < self.maxAI:
+                num = self.randomStream.randint(0, len(self.listOfAI) - 1)
+                AI = self.ai_joins(num)
+                ran = self.randomStream.randint(1, 8)
                 if ran == 1:
-                    print("Someone meanders around the casino floor before wandering in your direction.")
+                    self.output.write("Someone meanders around the casino floor before wandering in your direction.")
                 if ran == 2:
-                    print("The dealer looks up as someone wanders towards you.")
+                    self.output.write("The dealer looks up as someone wanders towards you.")
                 if ran == 3:
-                    print("Terry Cruise carries someone over.")
+                    self.output.write("Terry Cruise carries someone over.")
                 if ran == 4:
-                    print("Your phone rings...")
-                    print("It's your mom...")
-                    print(
+                    self.output.write("Your phone rings...")
+                    self.output.write("It's your mom...")
+                    self.output.write(
                         "She tells you that she's set you up on a playdate and that they should join your game night any moment now.")
-                    print("You notice someone beside you.")
+                    self.output.write("You notice someone beside you.")
                 if ran == 5:
-                    print("You pass out, waking up in a dark room with a new player.")
+                    self.output.write("You pass out, waking up in a dark room with a new player.")
                 if ran == 6:
-                    print(
+                    self.output.write(
                         "Knowing you are not doing well, the power of a random number generator gifts you a new player.")
                 if ran == 7:
-                    print("Your let your thoughts wander.")
-                    print("You are woken up by someone shaking your arm.")
+                    self.output.write("Your let your thoughts wander.")
+                    self.output.write("You are woken up by someone shaking your arm.")
                 if ran == 8:
-                    print("As you stare at an attractive person sitting at a nearby table.")
-                    print(
+                    self.output.write("As you stare at an attractive person sitting at a nearby table.")
+                    self.output.write(
                         "You lose focus, only waking when a new presence at the Blackjack table shakes you out of your trance.")
-                print(AI.name + " has joined the table.")
+                self.output.write(AI.name + " has joined the table.")
             else:
-                print("No one new joins the table.")
+                self.output.write("No one new joins the table.")
+
+    def ai_joins(self, num):
+        """
+        Moves an AI from the attribute listOfAI to the table
+
+        :param num: The place of the AI in the attribute listOfAI
+        :return: The AI that joined
+        """
+        AI = self.listOfAI.pop(num)
+        self.aiSeats.adopt(AI)
+        self.artificialPlayers.append(AI)
+        self.emit(events.AI_JOIN, AI.number, num)
+        return AI
 
     def check_if_ai_leaves(self):
         """
         Checks if the AI players want to leave the table based upon their leaveCondition attribute.
         """
-        removers = []
-        for AI in self.artificialPlayers:
-            answer = AI.check_leave()
-            if answer:
-                print("Tilted out of their mind, " + AI.name + " leaves.")
-                removers.append(AI)
-        for AI in removers:
-            self.artificialPlayers.remove(AI)
+        leaving = self.aiSeats.leave_flags(self.seats_of(self.artificialPlayers))
+        for AI in drop_flagged(self.artificialPlayers, leaving):
+            self.output.write("Tilted out of their mind, " + AI.name + " leaves.")
+            self.emit(events.AI_LEAVE, AI.number)
 
     def ai_play(self):
         """
         Simulates all the AI playing the game and taking their turn in the round.
         This function could be expanded upon to include the player's card count,
         using it to determine if they will or won't draw more cards.
+        The first decision of every AI is made for all of them at once, the AI's own cards are all it depends on.
         """
-        storage = []
-        for AI in self.artificialPlayers:
-            print(AI.name + " is playing:")
-            AI.show_hand()
+        standing = self.aiSeats.stand_flags(self.seats_of(self.artificialPlayers))
+        busted = bytearray(len(standing))
+        for index, (AI, answer) in enumerate(zip(self.artificialPlayers, standing)):
+            self.output.write(AI.name + " is playing:")
+            AI.show_hand(self.output)
             playing = True
+            if AI.perfectPlay or AI.tablePlay:
+                answer = AI.check_next_move(self)
             while playing:
-                answer = AI.check_next_move()
                 if answer == 1:
-                    print(AI.name + " stood.")
-                    print("-" * 45)
+                    self.emit(events.STAND, AI.number, AI.check_count())
+                    self.output.write(AI.name + " stood.")
+                    self.output.write("-" * 45)
                     playing = False
                 elif answer == 0:
+                    self.emit(events.HIT, AI.number)
                     AI.hit(self.cardShoe)
-                    print(AI.name + " hit.")
-                    AI.show_hand()
+                    self.emit_cards(AI, 1)
+                    self.output.write(AI.name + " hit.")
+                    AI.show_hand(self.output)
                     if AI.check_count() > 21:
-                        storage.append(AI)
-                        print(AI.name + " went bust.")
-                        print("Their money is returned.")
+                        self.emit(events.BUST, AI.number, AI.count)
+                        self.settle(AI, -AI.pot)
+                        busted[index] = 1
+                        self.output.write(AI.name + " went bust.")
+                        self.output.write("Their money is returned.")
                         AI.leaveCounter += 1
                         playing = False
+                    else:
+                        answer = AI.check_next_move(self)
+
+        self.artificialPlayersDiscard.extend(drop_flagged(self.artificialPlayers, busted))
 
-        self.artificialPlayersDiscard.extend(storage)
-        for AI in storage:
-            self.artificialPlayers.remove(AI)
+    def collect_bets(self):
+        """
+        Collects the bets of all players from the attribute strategy.
+        A bet that is invalid or larger than the player's balance is not placed, letting the player play with 0 as their bet.
+        """
+        for player in self.listPlayers:
+            self.output.write("-" * 45)
+            bet = self.strategy.bet_amount(self, player)
+            if bet is None:
+                continue
+            if bet < 0 or bet > player.money:
+                self.output.write("Invalid bet, player " + str(player.number) + " plays this round without betting.")
+                continue
+            player.bet(bet)
+            self.emit(events.BET_PLACED, player.number, bet)
 
     def ai_bet(self):
         """
@@ -1071,27 +1911,102 @@ class Game:
         An observant player can however take note of how much the AI's bet varies compared to previous bets
         seeing as the AI are also keeping track of the card-count and adjusting their bets accordingly.
         Some however do this better than others.
+        The bet is kept in the AI's pot attribute so the events of the round can tell what they won or lost.
+        The bets of all AI are worked out at once from the arrays of the attribute aiSeats.
         """
-        for AI in self.artificialPlayers:
-            print("-" * 45)
-            print(AI.name + " bets " + str(AI.check_bet_size(self.cardShoe)))
-            print("-" * 45)
+        bets = self.aiSeats.bet_sizes(self.seats_of(self.artificialPlayers), self.cardShoe)
+        for AI, bet in zip(self.artificialPlayers, bets):
+            AI.pot = bet
+            self.emit(events.BET_PLACED, AI.number, AI.pot)
+            self.output.write("-" * 45)
+            self.output.write(AI.name + " bets " + str(AI.pot))
+            self.output.write("-" * 45)
 
     def fill_with_ai(self):
         """
-        Fills the attribute listOfAI with pre-mades
-        """
-        self.listOfAI.append(AIPlayer("Cercei Lannister", 5, -1, 50, 5))
-        self.listOfAI.append(AIPlayer("Margaery Tyrell", 5, -4, 25, 5))
-        self.listOfAI.append(AIPlayer("Tyrion Lannister", 5, -2, 10, 5))
-        self.listOfAI.append(AIPlayer("Tywin Lannister", 10, -2, 50, 6))
-        self.listOfAI.append(AIPlayer("Joffrey Baratheon", -30, 3, 1000, 1))
-        self.listOfAI.append(AIPlayer("Littlefinger", 5, -5, 10, 4))
-        self.listOfAI.append(AIPlayer("Renley Baratheon", 10, -2, 420, 3))
-        self.listOfAI.append(AIPlayer("Obyeryn Martell", 15, 1, 5, 3))
-        self.listOfAI.append(AIPlayer("Varys", 1, -5, 10, 4))
-        self.listOfAI.append(AIPlayer("John Snow", 20, 0, 1, 10))
-        self.listOfAI.append(AIPlayer("Sansa Stark", -5, -1, 10, 4))
+        Fills the attribute listOfAI with pre-mades.
+        Every AI gets a negative player number so they can be told apart from the players and the dealer.
+        """
+        seats = self.aiSeats
+        self.listOfAI.append(AIPlayer("Cercei Lannister", 5, -1, 50, 5, seats=seats))
+        self.listOfAI.append(AIPlayer("Margaery Tyrell", 5, -4, 25, 5, seats=seats))
+        self.listOfAI.append(AIPlayer("Tyrion Lannister", 5, -2, 10, 5, seats=seats))
+        self.listOfAI.append(AIPlayer("Tywin Lannister", 10, -2, 50, 6, seats=seats))
+        self.listOfAI.append(AIPlayer("Joffrey Baratheon", -30, 3, 1000, 1, seats=seats))
+        self.listOfAI.append(AIPlayer("Littlefinger", 5, -5, 10, 4, seats=seats))
+        self.listOfAI.append(AIPlayer("Renley Baratheon", 10, -2, 420, 3, seats=seats))
+        self.listOfAI.append(AIPlayer("Obyeryn Martell", 15, 1, 5, 3, seats=seats))
+        self.listOfAI.append(AIPlayer("Varys", 1, -5, 10, 4, seats=seats))
+        self.listOfAI.append(AIPlayer("John Snow", 20, 0, 1, 10, seats=seats))
+        self.listOfAI.append(AIPlayer("Sansa Stark", -5, -1, 10, 4, seats=seats))
+        for index, AI in enumerate(self.listOfAI):
+            AI.number = -(index + 1)
+        self.emit_roster(self.listOfAI, 0)
+
+    def fill_with_roster(self, roster, seat=False):
+        """
+        Fills the attribute listOfAI with the given AI instead of the pre-mades, numbered like fill_with_ai numbers them
+
+        :param roster: A list of dictionaries with the arguments of AIPlayer for every AI: name, accuracy, risk, unit,
+        leaveCondition and optionally perfectPlay and tablePlay
+        :param seat: True to seat every AI of the roster at the table at once, lifting the limit on AI at the table to make room,
+        instead of letting them join at random
+        """
+        seats = self.aiSeats
+        first = len(seats)
+        start = len(self.listOfAI)
+        for index, settings in enumerate(roster):
+            AI = AIPlayer(settings["name"], settings["accuracy"], settings["risk"], settings["unit"],
+                          settings["leaveCondition"], settings.get("perfectPlay", False), seats,
+                          settings.get("tablePlay", False))
+            AI.number = -(first + index + 1)
+            self.listOfAI.append(AI)
+        self.emit_roster(self.listOfAI[start:], len(roster) if seat else 0)
+        self.load_tables()
+        if seat:
+            self.maxAI = max(self.maxAI, len(self.artificialPlayers) + len(roster))
+            for _ in roster:
+                self.ai_joins(start)
+
+    def fill_large_table(self, amount):
+        """
+        Seats the given amount of generated AI at the table at once, for load testing with far more seats than a real table has.
+        Their settings are drawn from the attribute randomStream, so the same seed seats the same AI,
+        and they are seated through fill_with_roster, which lifts the limit on AI joining the table to make room for them.
+        The AI never leave (see NEVER_LEAVES), so the amount of seats stays the same for the whole test.
+        The attribute startingDecks is raised to a deck more than decks_needed when a full card-shoe would not last a round
+        at the larger table, the card-shoe is then replaced at the start of the next round (see check_shoe).
+
+        :param amount: The amount of AI to seat
+        """
+        first = len(self.aiSeats)  # Every AI of the game has a place in the arrays, so the numbers stay unique
+        randomStream = self.randomStream
+        roster = [{"name": "Guest " + str(index + 1), "accuracy": randomStream.randint(-5, 20),
+                   "risk": randomStream.randint(-5, 3), "unit": randomStream.choice((1, 5, 10, 25, 50)),
+                   "leaveCondition": NEVER_LEAVES} for index in range(first, first + amount)]
+        self.fill_with_roster(roster, True)
+        self.startingDecks = max(self.startingDecks, self.decks_needed() + 1)  # A deck to spare, so it lasts more rounds
+        self.load_tables()
+
+    def decks_needed(self):
+        """
+        Gives the least amount of decks a full card-shoe needs so it never runs out during a round,
+        counting 5 cards for every seat and the dealer (see shoe_needs_replacing)
+
+        :return: The amount of decks
+        """
+        seated = len(self.listPlayers) + len(self.artificialPlayers) + len(self.artificialPlayersDiscard)
+        return -(-((seated * 5) + 5) // 52)
+
+    def seats_of(self, AIs):
+        """
+        Gives the places of the given AI in the attribute aiSeats, moving any AI that was made with its own AISeats into it
+
+        :param AIs: The AI
+        :return: A list with the place of every AI
+        """
+        seats = self.aiSeats
+        return [AI.seat if AI.seats is seats else seats.adopt(AI) for AI in AIs]
 
     def reset_ai(self):
         """
@@ -1105,7 +2020,7 @@ class Game:
         Prints the amount of decks remaining rounded to one decimal point, if the boolean showDecks is set to True.
         """
         if self.showDecks:
-            print("The amount of decks remaining is approximately: " + str(round(self.cardShoe.len_cardshoe() / 52, 1)))
+            self.output.write("The amount of decks remaining is approximately: " + str(round(self.cardShoe.len_cardshoe() / 52, 1)))
 
 
 def player_maker(numOfPlayers, money):
@@ -1122,29 +2037,232 @@ def player_maker(numOfPlayers, money):
     return listOfPlayers
 
 
+class ConsoleOutput:
+    """
+    Output that prints everything the game writes to the terminal, used when a user is playing the game
+
+    :attribute enabled: Always True, drawing the cards is worth the effort when someone is watching
+    """
+
+    enabled = True
+
+    def write(self, text):
+        """
+        Prints text to the terminal with a single write, the text can be several lines long
+
+        :param text: The text to print
+        """
+        sys.stdout.write(text + "\n")
+
+
+class SilentOutput:
+    """
+    Output that throws away everything the game writes, used by headless games so no time is spent printing
+
+    :attribute enabled: Always False, so the game knows it can skip drawing the cards
+    """
+
+    enabled = False
+
+    def write(self, text):
+        """
+        Does nothing with the given text
+
+        :param text: The line that would have been written
+        """
+
+
+CONSOLE_OUTPUT = ConsoleOutput()
+
+
+class ConsoleStrategy:
+    """
+    Answers every decision in the game by asking the user at the terminal.
+    This is the default strategy of class Game, it simply forwards to the ask functions underneath.
+    """
+
+    def bet_amount(self, game, player):
+        """
+        Asks the player how much they would like to bet
+
+        :param game: The game that is being played
+        :param player: The player that is betting
+        :return: The amount the player bets, None when no valid bet was given
+        """
+        return ask_bet(player)
+
+    def next_move(self, game, player):
+        """
+        Asks the player if they would like to hit or stand
+
+        :param game: The game that is being played
+        :param player: The player whose turn it is
+        :return: 2 for the card-count, 1 to stand and 0 to hit (see ask_player_move)
+        """
+        return ask_player_move()
+
+    def anyone_leaving(self, game):
+        """
+        Asks if any of the players would like to leave the table
+
+        :param game: The game that is being played
+        :return: 1 if any of the players would like to leave, 0 if not
+        """
+        return ask_yes_no()
+
+    def wants_to_leave(self, game, player):
+        """
+        Asks a single player if they would like to leave the table
+
+        :param game: The game that is being played
+        :param player: The player that is asked
+        :return: 1 if the given player leaves the table, 0 if not
+        """
+        return ask_yes_no()
+
+    def stop_game(self, game):
+        """
+        Asks the user if they would like to stop the game in its entirety
+
+        :param game: The game that is being played
+        :return: 1 if the game should end, 0 if it should continue
+        """
+        return ask_game_stop()
+
+    def keep_decks(self, game):
+        """
+        Asks if a new card-shoe should have the original amount of decks
+
+        :param game: The game that is being played
+        :return: 1 if a new card-shoe gets the same amount of decks as the last one, 0 if not
+        """
+        return ask_yes_no()
+
+    def num_decks(self, game):
+        """
+        Asks the amount of decks for a new card-shoe
+
+        :param game: The game that is being played
+        :return: The amount of decks for a new card-shoe
+        """
+        return ask_num_decks()
+
+
+class AutoStrategy:
+    """
+    Answers every decision in the game without asking anyone, used to play headless games for simulation and load testing.
+    The players all bet the same amount, play like the dealer up to a given hand value, never leave
+    and the game stops after a given amount of rounds.
+
+    :attribute betSize: The amount every player bets each round (or what is left of their balance)
+    :attribute standOn: The hand value at which the players stop drawing cards
+    :attribute maxRounds: The amount of rounds after which the game stops, None to play until everyone is broke
+    """
+
+    def __init__(self, betSize=1, standOn=17, maxRounds=None):
+        """
+        Initializes an instance of class AutoStrategy
+
+        :param betSize: The amount every player bets each round
+        :param standOn: The hand value at which the players stand
+        :param maxRounds: The amount of rounds after which the game stops, None to never stop
+        """
+        self.betSize = betSize
+        self.standOn = standOn
+        self.maxRounds = maxRounds
+
+    def bet_amount(self, game, player):
+        """
+        Bets the same amount every round
+
+        :param game: The game that is being played
+        :param player: The player that is betting
+        :return: The attribute betSize, or the player's balance if that is smaller
+        """
+        return min(self.betSize, player.money)
+
+    def next_move(self, game, player):
+        """
+        Hits until the hand is worth at least the attribute standOn
+
+        :param game: The game that is being played
+        :param player: The player whose turn it is
+        :return: 1 to stand once the hand is worth at least standOn, 0 to hit
+        """
+        if player.check_count() >= self.standOn:
+            return 1
+        return 0
+
+    def anyone_leaving(self, game):
+        """
+        Nobody leaves the table on their own
+
+        :param game: The game that is being played
+        :return: Always 0, the players stay until they are broke
+        """
+        return 0
+
+    def wants_to_leave(self, game, player):
+        """
+        Nobody leaves the table on their own
+
+        :param game: The game that is being played
+        :param player: The player that is asked
+        :return: Always 0, the players stay until they are broke
+        """
+        return 0
+
+    def stop_game(self, game):
+        """
+        Stops the game once the attribute maxRounds is reached
+
+        :param game: The game that is being played
+        :return: 1 once maxRounds rounds have been played, 0 otherwise
+        """
+        if self.maxRounds is not None and game.roundsPlayed >= self.maxRounds:
+            return 1
+        return 0
+
+    def keep_decks(self, game):
+        """
+        New card-shoes always get the same amount of decks
+
+        :param game: The game that is being played
+        :return: Always 1, new card-shoes get the same amount of decks
+        """
+        return 1
+
+    def num_decks(self, game):
+        """
+        Never asked seeing as keep_decks always keeps the decks, returns the starting amount to be safe
+
+        :param game: The game that is being played
+        :return: The amount of decks the game started out with
+        """
+        return game.startingDecks
+
+
 # Underneath here are all the functions used to ask the user for input
 
-def collect_bets(givenList):
+def ask_bet(player):
     """
-    Used to collect the bets from the players in the list givenList
-    Players can choose to give no input or an incorrect input, when given an incorrect or empty input the game will let the player play with 0 as their bet.
-    This is done because the goal is not to have a player win or lose money but to let them learn how to card-count.
+    Used to ask a single player how much they would like to bet.
+    An incorrect input or a bet larger than the player's balance is not accepted.
 
-    :param givenList: The list of players that will be betting
+    :param player: The player that will be betting
+    :return: The amount the player bets, None when the input was incorrect
     """
-    for players in givenList:
-        print("-" * 45)
-        try:
-            print("How much would player " + str(players.number) + " like to bet?")
-            bet = int(input("Amount:"))
-            if players.money < bet:
-                print("You do not have enough money to bet that much")
-                print("Your current balance is: " + str(players.money))
-                raise ValueError
-        except ValueError:
-            print("Invalid input, try again.")
-            continue
-        players.bet(bet)
+    try:
+        print("How much would player " + str(player.number) + " like to bet?")
+        bet = int(input("Amount:"))
+        if player.money < bet:
+            print("You do not have enough money to bet that much")
+            print("Your current balance is: " + str(player.money))
+            raise ValueError
+    except ValueError:
+        print("Invalid input, try again.")
+        return None
+    return bet
 
 
 def ask_num_decks():
@@ -1201,7 +2319,7 @@ def ask_num_money():
 
 def ask_num_players():
     """
-    Used to ask the user for the amount of players that will participate in the game (maximum of five)
+    Used to ask the user for the amount of players that will participate in the game (maximum of MAX_PLAYERS)
 
     :return: The number of players that will be starting the game of blackjack
     """
@@ -1209,9 +2327,9 @@ def ask_num_players():
     numOfPlayers = 0
     while condition:
         try:
-            print("Give a number between 1 and 5 to determine the amount of players.")
+            print("Give a number between 1 and " + str(MAX_PLAYERS) + " to determine the amount of players.")
             numOfPlayers = int(input("Amount of players:"))
-            if numOfPlayers > 5 or numOfPlayers < 0:
+            if numOfPlayers > MAX_PLAYERS or numOfPlayers < 0:
                 raise ValueError
         except ValueError:
             print("Input not correct, try again.")
@@ -1266,8 +2384,10 @@ def ask_game_stop():
 def ask_count_type():
     """
     Used to ask the user what card-counting method should be used, gives the choice of Hi-Lo, Halves and Zen count
+    or any other registered count system by its name
 
-    :return: 2 for Hi-Lo card counting system, 1 for the Halves card counting system and 0 for the Zen count card-counting system
+    :return: 2 for Hi-Lo card counting system, 1 for the Halves card counting system and 0 for the Zen count card-counting system,
+    the number of the count system for the others (see the module counting)
     """
     condition = True
     while condition:
@@ -1275,6 +2395,7 @@ def ask_count_type():
             print("What type of card counting would you like to use?")
             print("You have the choice of Hi-lo, Halves and Zen Count.")
             print("The commands for which are, Hi, Half and Zen respectively.")
+            print("Other systems are chosen by their name: " + ", ".join(system.name for system in counting.SYSTEMS[3:]))
             answer = input("Answer: ")
             if answer.upper() == "HI":
                 answer = 2
@@ -1283,7 +2404,10 @@ def ask_count_type():
             elif answer.upper() == "ZEN":
                 answer = 0
             else:
-                raise ValueError
+                try:
+                    answer = counting.system_named(answer).number
+                except KeyError:
+                    raise ValueError
         except ValueError:
             print("Input not viable, try again.")
             print("-" * 45)
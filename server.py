@@ -0,0 +1,512 @@
+"""
+Hosts many tables of blackjack in a single asyncio event loop.
+Players connect over a local TCP or UNIX socket and talk to the server in lines of text:
+
+    join <table>      sit down at a table, the table is opened when no one is sitting at it yet
+    bet <amount>      answer to "? bet", "no" sits the round out
+    hit, stand        answer to "? move", "count" shows the card-count
+    yes, no           answer to "? leave", asked after every round
+    tables            list the open tables
+    quit              close the connection
+
+Everything a table writes is sent to every player at it, lines asking for an answer start with "? ".
+A table only uses the event loop while someone is playing at it, a table waiting on an answer costs nothing,
+and a player that doesn't answer in time stands, sits the round out or stays, so a slow player can only hold up their own table.
+"""
+import argparse
+import asyncio
+import sys
+
+import events
+from run import Game, Person, derive_seed, new_seed
+from shuffle import ShoePool
+
+PROMPT_TIMEOUT = 60  # Seconds a player gets to answer before the default answer is used
+MAX_BUFFER = 1 << 20  # Bytes that may wait to be sent to a player before they are disconnected for reading too slowly
+STARTING_MONEY = 1000  # The money every player sits down with
+DECKS = 6  # The amount of decks in every table's card-shoe
+TYPE_OF_COUNT = 2  # The type of card-counting of every table (see ask_count_type)
+MOVES = {"hit": 0, "stand": 1, "count": 2}  # The answers to "? move" and the answer Game.player_move expects
+
+
+class Seat:
+    """
+    A single connection to the server, and the player it controls once it joined a table
+
+    :attribute writer: The stream the lines to the player are written to
+    :attribute table: The table the seat is at, None when it hasn't joined one
+    :attribute player: The Person playing for this seat, None until the table seats it
+    :attribute question: The question the seat is asked right now, None when it is not asked anything
+    :attribute answer: The future the answer to the question is given to
+    :attribute default: The answer to the question when the player doesn't give one
+    :attribute connected: False once the connection is closed
+    """
+
+    def __init__(self, writer):
+        """
+        Initializes a seat that has not joined a table yet
+
+        :param writer: The stream the lines to the player are written to
+        """
+        self.writer = writer
+        self.table = None
+        self.player = None
+        self.question = None
+        self.answer = None
+        self.default = None
+        self.connected = True
+
+    def send(self, text):
+        """
+        Sends text to the player without waiting for it to be sent.
+        A player that lets too much text pile up is disconnected, so they can't make the server keep everything for them.
+
+        :param text: The text to send, can be several lines long
+        """
+        if not self.connected:
+            return
+        if self.writer.transport.get_write_buffer_size() > MAX_BUFFER:
+            self.disconnect()
+            return
+        self.writer.write((text + "\n").encode())
+
+    async def ask(self, question, default, timeout=PROMPT_TIMEOUT):
+        """
+        Asks the player a question and waits for their answer
+
+        :param question: One of "bet", "move" or "leave"
+        :param default: The answer given when the player doesn't answer in time or is disconnected
+        :param timeout: The seconds the player gets to answer
+        :return: The answer
+        """
+        if not self.connected:
+            return default
+        self.question = question
+        self.default = default
+        self.answer = asyncio.get_running_loop().create_future()
+        self.send("? " + question)
+        try:
+            return await asyncio.wait_for(self.answer, timeout)
+        except asyncio.TimeoutError:
+            self.send("Too late, the table goes on without you.")
+            return default
+        finally:
+            self.question = None
+            self.answer = None
+            self.default = None
+
+    def give_answer(self, words):
+        """
+        Answers the question the seat is asked with a line the player sent
+
+        :param words: The words of the line
+        :return: True if the line answered the question
+        """
+        if self.question is None or self.answer.done():
+            return False
+        if self.question == "bet":
+            if words[0] == "no":
+                self.answer.set_result(None)
+                return True
+            amount = words[-1]
+            if amount.isdigit() and (len(words) == 1 or words[0] == "bet"):
+                self.answer.set_result(int(amount))
+                return True
+        elif self.question == "move" and words[0] in MOVES:
+            self.answer.set_result(MOVES[words[0]])
+            return True
+        elif self.question == "leave" and words[0] in ("yes", "no"):
+            self.answer.set_result(int(words[0] == "yes"))
+            return True
+        return False
+
+    def disconnect(self):
+        """
+        Closes the connection, a question the seat is asked gets the default answer
+        """
+        if not self.connected:
+            return
+        self.connected = False
+        if self.answer is not None and not self.answer.done():
+            self.answer.set_result(self.default)
+        self.writer.close()
+
+
+class TableOutput:
+    """
+    Output that sends everything the game writes to every player at the table
+
+    :attribute enabled: Always True, the players want to see the cards
+    """
+
+    enabled = True
+
+    def __init__(self, table):
+        """
+        :param table: The table the game is played at
+        """
+        self.table = table
+
+    def write(self, text):
+        """
+        Sends text to every player at the table
+
+        :param text: The text to send, can be several lines long
+        """
+        self.table.broadcast(text)
+
+
+class TableStrategy:
+    """
+    Answers the game's decisions with the answers the table collected from its players before the game needed them
+
+    :attribute table: The table the game is played at
+    """
+
+    def __init__(self, table):
+        """
+        :param table: The table the game is played at
+        """
+        self.table = table
+
+    def bet_amount(self, game, player):
+        """
+        :return: The bet the player gave, None when they sit the round out
+        """
+        return self.table.bets.get(player.number)
+
+    def next_move(self, game, player):
+        """
+        The table plays the moves itself with Game.player_move, so this is only used if the game asks anyway
+
+        :return: Always 1, standing
+        """
+        return 1
+
+    def anyone_leaving(self, game):
+        """
+        :return: 1 if any player at the table wants to leave, 0 if not
+        """
+        return int(bool(self.table.leaving))
+
+    def wants_to_leave(self, game, player):
+        """
+        :return: 1 if the player wants to leave, 0 if not
+        """
+        return int(player.number in self.table.leaving)
+
+    def stop_game(self, game):
+        """
+        The table keeps playing as long as anyone sits at it
+
+        :return: Always 0
+        """
+        return 0
+
+    def keep_decks(self, game):
+        """
+        :return: Always 1, every table keeps its amount of decks
+        """
+        return 1
+
+    def num_decks(self, game):
+        """
+        :return: The amount of decks of the table
+        """
+        return game.startingDecks
+
+
+class Table:
+    """
+    A single table of blackjack, the game is played as a task in the event loop while there are players at the table
+
+    :attribute name: The name players join the table with
+    :attribute seats: Dictionary from player number to the Seat of every seated player
+    :attribute waiting: The seats that joined and are seated when the next round starts
+    :attribute bets: Dictionary from player number to the bet of the current round
+    :attribute leaving: Set of the player numbers that want to leave after the current round
+    :attribute nextNumber: The player number the next seated player gets
+    :attribute game: The game being played, None while nobody sits at the table
+    :attribute task: The task playing the game, None while nobody sits at the table
+    """
+
+    def __init__(self, name, server):
+        """
+        Initializes an empty table
+
+        :param name: The name of the table
+        :param server: The server hosting the table
+        """
+        self.name = name
+        self.server = server
+        self.seats = {}
+        self.waiting = []
+        self.bets = {}
+        self.leaving = set()
+        self.nextNumber = 1
+        self.game = None
+        self.task = None
+
+    def broadcast(self, text):
+        """
+        Sends text to every seat at the table
+
+        :param text: The text to send
+        """
+        for seat in self.seats.values():
+            seat.send(text)
+        for seat in self.waiting:
+            seat.send(text)
+
+    def join(self, seat):
+        """
+        Lets a seat join the table, starting the game when the table was empty
+
+        :param seat: The seat joining
+        """
+        seat.table = self
+        self.waiting.append(seat)
+        seat.send("You join table " + self.name + ", you are dealt in from the next round.")
+        if self.task is None:
+            self.task = asyncio.ensure_future(self.play())
+
+    def seat_waiting(self):
+        """
+        Gives every seat that is waiting a player at the game
+        """
+        for seat in self.waiting:
+            if seat.connected:
+                seat.player = Person(self.server.startingMoney, False, self.nextNumber)
+                self.nextNumber += 1
+                self.seats[seat.player.number] = seat
+                self.game.listPlayers.append(seat.player)
+                seat.send("You are player " + str(seat.player.number) + ".")
+        self.waiting.clear()
+
+    def unseat_gone(self):
+        """
+        Removes the seats whose player is no longer in the game, because they left, went broke or disconnected
+        """
+        for seat in self.seats.values():
+            if not seat.connected and seat.player in self.game.listPlayers:
+                self.game.emit(events.PLAYER_LEAVE, seat.player.number)
+                self.game.listPlayers.remove(seat.player)
+        for number, seat in list(self.seats.items()):
+            if seat.player not in self.game.listPlayers:
+                del self.seats[number]
+                seat.send("You have left table " + self.name + ".")
+                seat.table = None
+                seat.player = None
+
+    async def play(self):
+        """
+        Plays rounds as long as anyone sits at the table, asking the players for their answers as the game needs them
+        """
+        try:
+            self.server.gamesStarted += 1
+            self.game = Game(TableStrategy(self), TableOutput(self), shoePool=self.server.shoePool,
+                             seed=derive_seed(self.server.seed, "game", self.server.gamesStarted))
+            self.game.setup(TYPE_OF_COUNT, 0, self.server.startingMoney, self.server.decks)
+            self.game.fill_with_ai()
+            while True:
+                self.seat_waiting()
+                self.unseat_gone()
+                if not self.seats:
+                    break
+                self.game.gameTrue = True
+                await self.play_round()
+        finally:
+            self.game = None
+            self.task = None
+            self.server.close_table(self)
+
+    async def play_round(self):
+        """
+        Plays a single round, in the same steps as Game.round
+        """
+        game = self.game
+        seats = list(self.seats.values())
+        answers = await asyncio.gather(*(seat.ask("bet", None, self.server.timeout) for seat in seats))
+        self.bets = {seat.player.number: bet for seat, bet in zip(seats, answers)}
+        if all(bet is None for bet in answers):
+            return  # Nobody bets, so the table waits for the next bets without dealing
+
+        changeableList = game.begin_round()
+        for player in list(changeableList):
+            seat = self.seats[player.number]
+            result = 0
+            while game.roundTrue and result == 0:
+                game.show_turn(player)
+                result = game.player_move(player, await seat.ask("move", 1, self.server.timeout))
+            if result == 2:
+                changeableList.remove(player)
+        game.finish_round(changeableList)
+
+        answers = await asyncio.gather(*(seat.ask("leave", 0, self.server.timeout) for seat in seats))
+        self.leaving = {seat.player.number for seat, answer in zip(seats, answers) if answer == 1 or not seat.connected}
+        game.end_round()
+        self.leaving = set()
+
+
+class BlackjackServer:
+    """
+    Hosts the tables and handles the connections of the players
+
+    :attribute tables: Dictionary from name to every open Table
+    :attribute startingMoney: The money every player sits down with
+    :attribute decks: The amount of decks in every table's card-shoe
+    :attribute timeout: The seconds a player gets to answer a question
+    :attribute shoePool: The pool of shuffled card-shoes every table takes its card-shoes from, a table shuffles its own
+    card-shoe when the pool has none ready
+    :attribute seed: The master seed the random number streams of the pool and of every game are derived from
+    :attribute gamesStarted: The amount of games the tables have started, so every game gets its own stream
+    :attribute clients: The tasks handling the open connections
+    """
+
+    def __init__(self, startingMoney=STARTING_MONEY, decks=DECKS, timeout=PROMPT_TIMEOUT, seed=None):
+        """
+        Initializes a server without any tables
+
+        :param startingMoney: The money every player sits down with
+        :param decks: The amount of decks in every table's card-shoe
+        :param timeout: The seconds a player gets to answer a question
+        :param seed: The master seed, a fresh seed when not given
+        """
+        self.tables = {}
+        self.startingMoney = startingMoney
+        self.decks = decks
+        self.timeout = timeout
+        self.seed = seed if seed is not None else new_seed()
+        self.gamesStarted = 0
+        self.clients = set()
+        self.shoePool = ShoePool(decks, seed=derive_seed(self.seed, "pool"), wait=False)  # Never blocks the event loop
+
+    def close_table(self, table):
+        """
+        Forgets a table nobody sits at anymore, it is opened again when someone joins it
+
+        :param table: The table to close
+        """
+        if self.tables.get(table.name) is table:
+            del self.tables[table.name]
+
+    def table_for(self, name):
+        """
+        :param name: The name of the table
+        :return: The table with the given name, opened when it wasn't open yet
+        """
+        if name not in self.tables:
+            self.tables[name] = Table(name, self)
+        return self.tables[name]
+
+    async def handle(self, reader, writer):
+        """
+        Handles a single connection until it is closed, reading the player's lines
+
+        :param reader: The stream the player's lines are read from
+        :param writer: The stream the lines to the player are written to
+        """
+        task = asyncio.current_task()
+        self.clients.add(task)
+        seat = Seat(writer)
+        seat.send("Welcome to blackjack. Type 'join <table>' to sit down, 'tables' to see the open tables.")
+        try:
+            while seat.connected:
+                line = await reader.readline()
+                if not line:
+                    break
+                words = line.decode(errors="replace").lower().split()
+                if not words:
+                    continue
+                if seat.give_answer(words):
+                    continue
+                if words[0] == "quit":
+                    break
+                elif words[0] == "tables":
+                    for table in self.tables.values():
+                        seat.send(table.name + ": " + str(len(table.seats) + len(table.waiting)) + " player(s)")
+                elif words[0] == "join" and len(words) == 2:
+                    if seat.table is None:
+                        self.table_for(words[1]).join(seat)
+                    else:
+                        seat.send("You are already at table " + seat.table.name + ".")
+                else:
+                    seat.send("! Not understood: " + " ".join(words))
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # Cancelled when the server shuts down, the connection is closed like any other
+        finally:
+            seat.disconnect()
+            if seat.table is not None and seat in seat.table.waiting:
+                seat.table.waiting.remove(seat)
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.clients.discard(task)
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """
+        Starts listening for connections
+
+        :param host: The address to listen on
+        :param port: The TCP port to listen on
+        :param path: The path of a UNIX socket to listen on instead of TCP
+        :return: The asyncio server
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path)
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def serve(self, host="127.0.0.1", port=8765, path=None):
+        """
+        Listens for connections until the task is cancelled
+
+        :param host: The address to listen on
+        :param port: The TCP port to listen on
+        :param path: The path of a UNIX socket to listen on instead of TCP
+        """
+        server = await self.start(host, port, path)
+        try:
+            async with server:
+                try:
+                    await server.serve_forever()
+                finally:
+                    await self.close_connections()
+        finally:
+            self.shoePool.close()
+
+    async def close_connections(self):
+        """
+        Closes every connection and stops every table, waiting until they are done
+        """
+        tasks = list(self.clients) + [table.task for table in self.tables.values() if table.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main(arguments=None):
+    """
+    Runs the server from the command line
+
+    :param arguments: The command line arguments, sys.argv when not given
+    """
+    parser = argparse.ArgumentParser(description="Host tables of blackjack over a local socket")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", help="listen on this UNIX socket instead of TCP")
+    parser.add_argument("--money", type=int, default=STARTING_MONEY, help="money every player sits down with")
+    parser.add_argument("--decks", type=int, default=DECKS, help="amount of decks in every card-shoe")
+    parser.add_argument("--timeout", type=float, default=PROMPT_TIMEOUT, help="seconds a player gets to answer")
+    parser.add_argument("--seed", type=int, help="master seed of the shuffles and AI, a fresh seed when not given")
+    options = parser.parse_args(arguments)
+    server = BlackjackServer(options.money, options.decks, options.timeout, options.seed)
+    print("Serving with seed " + str(server.seed), file=sys.stderr)
+    try:
+        asyncio.run(server.serve(options.host, options.port, options.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Shuffling of whole card-shoes ahead of time.
+A ShuffleEngine shuffles the card codes of a card-shoe in one call, with NumPy when it is installed and the random module when it is not.
+A ShoePool keeps a few shuffled card-shoes ready, made by a background thread, so a game that needs a new card-shoe
+only has to take one (see Game.new_shoe and CardShoe.load_shoe).
+"""
+import queue
+import random
+import threading
+
+from run import FULL_DECK_CODES
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the random module is used without it
+    numpy = None
+
+POOL_SIZE = 4  # The amount of shuffled card-shoes a ShoePool keeps ready
+
+
+class ShuffleEngine:
+    """
+    Shuffles card-shoes, every engine has its own random number stream so the same seed always gives the same card-shoes
+
+    :attribute generator: The NumPy random generator, None without NumPy
+    :attribute random: The random number generator used without NumPy
+    :attribute unshuffled: Dictionary from an amount of decks to the card codes of that many unshuffled decks
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializes an engine
+
+        :param seed: The seed of the random number stream, a random seed when not given
+        """
+        if numpy is not None:
+            self.generator = numpy.random.default_rng(seed)
+            self.random = None
+        else:
+            self.generator = None
+            self.random = random.Random(seed)
+        self.unshuffled = {}
+
+    def shuffled(self, decks):
+        """
+        Shuffles the given amount of full decks, with a single permutation of all the card codes
+
+        :param decks: The amount of decks
+        :return: The shuffled card codes
+        """
+        if decks not in self.unshuffled:
+            codes = FULL_DECK_CODES * decks
+            self.unshuffled[decks] = numpy.frombuffer(codes, dtype=numpy.uint8) if numpy is not None else codes
+        if self.generator is not None:
+            return self.generator.permutation(self.unshuffled[decks]).tobytes()
+        codes = bytearray(self.unshuffled[decks])
+        self.random.shuffle(codes)
+        return bytes(codes)
+
+
+class ShoePool:
+    """
+    A bounded pool of shuffled card-shoes that a background thread keeps full.
+    The card-shoes come out in the order they were shuffled in, so a pool with a seed always hands out the same card-shoes.
+
+    :attribute decks: The amount of decks in every card-shoe of the pool
+    :attribute engine: The ShuffleEngine shuffling the card-shoes
+    :attribute shoes: The queue of shuffled card-shoes
+    :attribute closed: True once the pool is closed and the thread stops
+    :attribute thread: The background thread, None when the pool shuffles when asked instead
+    :attribute wait: False when get gives None instead of waiting for the thread
+    """
+
+    def __init__(self, decks, size=POOL_SIZE, seed=None, background=True, wait=True):
+        """
+        Initializes a pool and starts its thread
+
+        :param decks: The amount of decks in every card-shoe
+        :param size: The most card-shoes kept ready at once
+        :param seed: The seed of the engine's random number stream
+        :param background: False to shuffle a card-shoe when asked instead of keeping them ready in a thread
+        :param wait: False to never wait for the thread, for callers that can't block such as an event loop
+        """
+        self.decks = decks
+        self.engine = ShuffleEngine(seed)
+        self.shoes = queue.Queue(maxsize=size)
+        self.closed = False
+        self.thread = None
+        self.wait = wait
+        if background:
+            self.thread = threading.Thread(target=self.fill, name="ShoePool", daemon=True)
+            self.thread.start()
+
+    def fill(self):
+        """
+        Keeps shuffling card-shoes while the pool is open, waiting whenever the pool is full
+        """
+        while not self.closed:
+            self.shoes.put(self.engine.shuffled(self.decks))
+
+    def get(self):
+        """
+        Takes a shuffled card-shoe from the pool, only waiting when the thread hasn't kept up and the attribute wait is True
+
+        :return: The card codes of a shuffled card-shoe, None when none is ready and the pool doesn't wait
+        """
+        if self.thread is None:
+            return self.engine.shuffled(self.decks)
+        try:
+            return self.shoes.get(self.wait)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """
+        Stops the background thread and throws away the card-shoes that were kept ready
+        """
+        self.closed = True
+        while True:
+            try:
+                self.shoes.get_nowait()  # Making room lets a thread waiting to put a card-shoe see the pool is closed
+            except queue.Empty:
+                break
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,257 @@
+"""
+Plays headless games of blackjack over many card-shoes to measure how the players do.
+The work is split by card-shoe over a pool of processes, every card-shoe gets its own random number stream
+so the results are the same no matter how many processes are used.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import counting
+import tables
+from run import AutoStrategy, Game, SilentOutput, derive_seed
+from stats import HandStats, true_count_bucket
+
+BANKROLL = 10 ** 12  # Starting money of every simulated player, large enough that nobody ever goes broke
+DEFAULT_BET = 2  # The smallest bet whose blackjack pays exactly 3:2 (see Person.pay_player)
+
+
+class SimulationConfig:
+    """
+    The settings of a simulation, every card-shoe is played as a new game with these settings
+
+    :attribute decks: The amount of decks in the card-shoe
+    :attribute seats: The amount of players at the table
+    :attribute betSize: The amount every player bets each round, results are given in multiples of this.
+    Keep it even: Person.pay_player pays a blackjack int(pot * 2.5), so an odd bet loses part of the 3:2 payout
+    :attribute standOn: The hand value at which the players stand
+    :attribute typeOfCount: The type of card-counting used by the game (see ask_count_type)
+    :attribute withAI: True if AI can join the table like in the interactive game
+    :attribute seed: The master seed every card-shoe's random number stream is derived from
+    :attribute compareSystems: True to also bucket every hand by the true count of every registered count system
+    :attribute roster: The AI that can join the table instead of the pre-mades (see Game.fill_with_roster), None for the pre-mades
+    """
+
+    def __init__(self, decks=6, seats=1, betSize=DEFAULT_BET, standOn=17, typeOfCount=2, withAI=True, seed=0, compareSystems=False,
+                 roster=None):
+        """
+        Initializes an instance of class SimulationConfig
+
+        :param decks: The amount of decks in the card-shoe
+        :param seats: The amount of players at the table
+        :param betSize: The amount every player bets each round, an even amount so blackjacks pay exactly 3:2
+        :param standOn: The hand value at which the players stand
+        :param typeOfCount: The type of card-counting used by the game
+        :param withAI: True if AI can join the table
+        :param seed: The master seed of the simulation
+        :param compareSystems: True to bucket every hand by every count system, to compare them on the same cards
+        :param roster: A list of AI settings to fill the table with instead of the pre-mades
+        """
+        self.decks = decks
+        self.seats = seats
+        self.betSize = betSize
+        self.standOn = standOn
+        self.typeOfCount = typeOfCount
+        self.withAI = withAI
+        self.seed = seed
+        self.compareSystems = compareSystems
+        self.roster = roster
+
+
+class SimulationResult:
+    """
+    The combined results of the simulated card-shoes, results of separate processes are combined with merge
+
+    :attribute shoesPlayed: The amount of card-shoes played
+    :attribute roundsPlayed: The amount of rounds played
+    :attribute handsPlayed: The amount of hands the players played
+    :attribute netUnits: The total amount of betting units the players won (negative when they lost)
+    :attribute countBuckets: Dictionary from the Hi-Lo true count (rounded down) at the time of betting to [hands, netUnits]
+    :attribute systemBuckets: Dictionary from count system name to its countBuckets, only filled with SimulationConfig.compareSystems
+    :attribute stats: The HandStats of every player's hands, in money rather than betting units
+    :attribute seconds: The wall time the simulation took
+    :attribute seed: The master seed the card-shoes were played with, None until simulate sets it
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty result
+        """
+        self.shoesPlayed = 0
+        self.roundsPlayed = 0
+        self.handsPlayed = 0
+        self.netUnits = 0
+        self.countBuckets = {}
+        self.systemBuckets = {}
+        self.stats = HandStats()
+        self.seconds = 0
+        self.seed = None
+
+    def add_hand(self, netUnits, bucket):
+        """
+        Adds the result of a single hand
+
+        :param netUnits: The amount of betting units won or lost with the hand
+        :param bucket: The true count bucket the hand was bet in
+        """
+        self.handsPlayed += 1
+        self.netUnits += netUnits
+        if bucket in self.countBuckets:
+            self.countBuckets[bucket][0] += 1
+            self.countBuckets[bucket][1] += netUnits
+        else:
+            self.countBuckets[bucket] = [1, netUnits]
+
+    def add_system_hands(self, buckets, netUnits):
+        """
+        Adds the result of a single hand to the buckets of every count system
+
+        :param buckets: Dictionary from count system name to the true count bucket the hand was bet in
+        :param netUnits: The amount of betting units won or lost with the hand
+        """
+        for name, bucket in buckets.items():
+            countBuckets = self.systemBuckets.setdefault(name, {})
+            if bucket in countBuckets:
+                countBuckets[bucket][0] += 1
+                countBuckets[bucket][1] += netUnits
+            else:
+                countBuckets[bucket] = [1, netUnits]
+
+    def merge(self, other):
+        """
+        Adds the results of another SimulationResult to this one
+
+        :param other: The results to add
+        """
+        self.shoesPlayed += other.shoesPlayed
+        self.roundsPlayed += other.roundsPlayed
+        self.handsPlayed += other.handsPlayed
+        self.netUnits += other.netUnits
+        for bucket, (hands, netUnits) in other.countBuckets.items():
+            if bucket in self.countBuckets:
+                self.countBuckets[bucket][0] += hands
+                self.countBuckets[bucket][1] += netUnits
+            else:
+                self.countBuckets[bucket] = [hands, netUnits]
+        for name, otherBuckets in other.systemBuckets.items():
+            countBuckets = self.systemBuckets.setdefault(name, {})
+            for bucket, (hands, netUnits) in otherBuckets.items():
+                if bucket in countBuckets:
+                    countBuckets[bucket][0] += hands
+                    countBuckets[bucket][1] += netUnits
+                else:
+                    countBuckets[bucket] = [hands, netUnits]
+        self.stats.merge(other.stats)
+
+    def ev(self):
+        """
+        :return: The average amount of betting units won per hand
+        """
+        if self.handsPlayed == 0:
+            return 0
+        return self.netUnits / self.handsPlayed
+
+    def bucket_ev(self):
+        """
+        :return: Dictionary from true count bucket to the average amount of betting units won per hand in that bucket
+        """
+        return {bucket: netUnits / hands for bucket, (hands, netUnits) in sorted(self.countBuckets.items())}
+
+    def hands_per_second(self):
+        """
+        :return: The amount of hands simulated per second of wall time
+        """
+        if self.seconds == 0:
+            return 0
+        return self.handsPlayed / self.seconds
+
+
+def shoe_seed(seed, shoeIndex):
+    """
+    Gives the seed of a single card-shoe's random number stream.
+    The seed only depends on the master seed and the card-shoe's number, not on the process that plays it.
+
+    :param seed: The master seed of the simulation
+    :param shoeIndex: The number of the card-shoe
+    :return: The seed of the card-shoe's game
+    """
+    return derive_seed(seed, "simulation", shoeIndex)
+
+
+def play_shoe(config, shoeIndex, result):
+    """
+    Plays a single card-shoe as a new headless game until the card-shoe would have to be replaced
+
+    :param config: The SimulationConfig to play with
+    :param shoeIndex: The number of the card-shoe, which determines its random number stream
+    :param result: The SimulationResult the hands are added to
+    """
+    game = Game(AutoStrategy(config.betSize, config.standOn), SilentOutput(), seed=shoe_seed(config.seed, shoeIndex))
+    game.setup(config.typeOfCount, config.seats, BANKROLL, config.decks)
+    if config.withAI:
+        if config.roster is not None:
+            game.fill_with_roster(config.roster)
+        else:
+            game.fill_with_ai()
+
+    while game.gameTrue and not game.shoe_needs_replacing():
+        bucket = true_count_bucket(game.cardShoe)
+        if config.compareSystems:
+            systemBuckets = {system.name: true_count_bucket(game.cardShoe, system.number) for system in counting.SYSTEMS}
+        players = list(game.listPlayers)
+        before = [player.money for player in players]
+        game.round()
+        for player, money in zip(players, before):
+            result.add_hand((player.money - money) / config.betSize, bucket)
+            if config.compareSystems:
+                result.add_system_hands(systemBuckets, (player.money - money) / config.betSize)
+    for player in game.listPlayers:
+        result.stats.merge(player.stats)
+    result.roundsPlayed += game.roundsPlayed
+    result.shoesPlayed += 1
+
+
+def simulate_shoes(config, firstShoe, lastShoe):
+    """
+    Plays a range of card-shoes, this is the work a single process does
+
+    :param config: The SimulationConfig to play with
+    :param firstShoe: The number of the first card-shoe to play
+    :param lastShoe: The number after the last card-shoe to play
+    :return: The SimulationResult of these card-shoes
+    """
+    result = SimulationResult()
+    for shoeIndex in range(firstShoe, lastShoe):
+        play_shoe(config, shoeIndex, result)
+    return result
+
+
+def simulate(config, n_shoes, workers=None):
+    """
+    Plays n_shoes card-shoes split over a pool of worker processes and combines their results.
+    The card-shoes are handed out in a few chunks per worker so workers that finish early pick up more work.
+
+    :param config: The SimulationConfig to play with
+    :param n_shoes: The amount of card-shoes to play
+    :param workers: The amount of processes, the amount of cores when not given. With 1 everything runs in this process.
+    :return: The combined SimulationResult
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if config.withAI and config.roster is not None and any(settings.get("tablePlay") for settings in config.roster):
+        tables.load(config.decks)  # Built here once, so the workers only have to map the file
+    start = time.perf_counter()
+    result = SimulationResult()
+
+    if workers <= 1 or n_shoes <= 1:
+        result.merge(simulate_shoes(config, 0, n_shoes))
+    else:
+        chunks = min(n_shoes, workers * 4)
+        bounds = [n_shoes * i // chunks for i in range(chunks + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for part in executor.map(simulate_shoes, [config] * chunks, bounds[:-1], bounds[1:]):
+                result.merge(part)
+
+    result.seconds = time.perf_counter() - start
+    result.seed = config.seed
+    return result
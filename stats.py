@@ -0,0 +1,174 @@
+"""
+Running statistics of the hands a player plays, kept in a fixed amount of memory however many hands are played.
+Every hand updates the statistics in constant time, and the statistics of separate games or processes can be combined with merge.
+"""
+import math
+
+import counting
+
+MAX_BUCKET = 10  # True counts further from zero than this are put in the outermost bucket
+
+
+def true_count_bucket(cardShoe, number=counting.HI_LO.number):
+    """
+    Gives the true count of a card-shoe rounded down, limited to MAX_BUCKET either way
+
+    :param cardShoe: The card-shoe of the game
+    :param number: The number of the count system (see the module counting), Hi-Lo when not given
+    :return: The true count bucket
+    """
+    decksRemaining = cardShoe.len_cardshoe() / 52
+    if decksRemaining == 0:
+        return 0
+    bucket = math.floor(cardShoe.running_count(number) / decksRemaining)
+    return max(-MAX_BUCKET, min(MAX_BUCKET, bucket))
+
+
+class HandStats:
+    """
+    The statistics of every hand a player has played.
+    The mean and variance of the result of a hand are kept with Welford's method, so they stay accurate over millions of hands.
+    The drawdown is the largest drop of the player's winnings from their highest point,
+    the highest and lowest point are kept relative to the start so statistics of hands played one after another can be merged.
+
+    :attribute hands: The amount of hands played
+    :attribute wins: The amount of hands won, blackjacks included
+    :attribute losses: The amount of hands lost, ties included seeing as a tie loses (see Game.showdown)
+    :attribute pushes: The amount of hands where the bet was given back
+    :attribute blackjacks: The amount of hands won with blackjack
+    :attribute mean: The average result of a hand
+    :attribute squares: The sum of the squared differences from the mean, the variance is this divided by the amount of hands minus one
+    :attribute net: The total amount won (negative when lost)
+    :attribute peak: The highest the total amount won has been, 0 at the start
+    :attribute trough: The lowest the total amount won has been, 0 at the start
+    :attribute maxDrawdown: The largest drop of the total amount won from a previous high
+    :attribute countBuckets: Dictionary from the true count bucket at the time of betting to [hands, net]
+    """
+
+    def __init__(self):
+        """
+        Initializes statistics without any hands
+        """
+        self.hands = 0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.blackjacks = 0
+        self.mean = 0.0
+        self.squares = 0.0
+        self.net = 0
+        self.peak = 0
+        self.trough = 0
+        self.maxDrawdown = 0
+        self.countBuckets = {}
+
+    def add_hand(self, result, bucket=0, blackjack=False):
+        """
+        Adds the result of a single hand
+
+        :param result: The amount won with the hand, negative when lost and 0 when the bet was given back
+        :param bucket: The true count bucket the hand was bet in (see true_count_bucket)
+        :param blackjack: True if the hand was won with blackjack
+        """
+        self.hands += 1
+        delta = result - self.mean
+        self.mean += delta / self.hands
+        self.squares += delta * (result - self.mean)
+
+        if result > 0:
+            self.wins += 1
+            if blackjack:
+                self.blackjacks += 1
+        elif result < 0:
+            self.losses += 1
+        else:
+            self.pushes += 1
+
+        self.net += result
+        if self.net > self.peak:
+            self.peak = self.net
+        elif self.net < self.trough:
+            self.trough = self.net
+        if self.peak - self.net > self.maxDrawdown:
+            self.maxDrawdown = self.peak - self.net
+
+        if bucket in self.countBuckets:
+            self.countBuckets[bucket][0] += 1
+            self.countBuckets[bucket][1] += result
+        else:
+            self.countBuckets[bucket] = [1, result]
+
+    def merge(self, other):
+        """
+        Adds the statistics of another HandStats to these, as if its hands were played after these hands.
+        The mean and variance are combined with Chan's formula for parallel variance.
+
+        :param other: The statistics to add
+        """
+        if other.hands == 0:
+            return
+        hands = self.hands + other.hands
+        delta = other.mean - self.mean
+        self.squares += other.squares + delta * delta * self.hands * other.hands / hands
+        self.mean += delta * other.hands / hands
+        self.hands = hands
+
+        self.wins += other.wins
+        self.losses += other.losses
+        self.pushes += other.pushes
+        self.blackjacks += other.blackjacks
+
+        self.maxDrawdown = max(self.maxDrawdown, other.maxDrawdown, self.peak - (self.net + other.trough))
+        self.peak = max(self.peak, self.net + other.peak)
+        self.trough = min(self.trough, self.net + other.trough)
+        self.net += other.net
+
+        for bucket, (bucketHands, net) in other.countBuckets.items():
+            if bucket in self.countBuckets:
+                self.countBuckets[bucket][0] += bucketHands
+                self.countBuckets[bucket][1] += net
+            else:
+                self.countBuckets[bucket] = [bucketHands, net]
+
+    def variance(self):
+        """
+        :return: The variance of the result of a hand
+        """
+        if self.hands < 2:
+            return 0.0
+        return self.squares / (self.hands - 1)
+
+    def standard_deviation(self):
+        """
+        :return: The standard deviation of the result of a hand
+        """
+        return math.sqrt(self.variance())
+
+    def rate(self, amount):
+        """
+        :param amount: One of the attributes wins, losses, pushes or blackjacks
+        :return: The share of hands the amount makes up
+        """
+        if self.hands == 0:
+            return 0.0
+        return amount / self.hands
+
+    def bucket_ev(self):
+        """
+        :return: Dictionary from true count bucket to the average result of a hand in that bucket
+        """
+        return {bucket: net / hands for bucket, (hands, net) in sorted(self.countBuckets.items())}
+
+    def summary(self):
+        """
+        Describes the statistics in a few lines of text
+
+        :return: A list of lines
+        """
+        return ["Hands played: " + str(self.hands) + ", won: " + str(self.net),
+                "Average per hand: " + format(self.mean, '.3f') + " (standard deviation " +
+                format(self.standard_deviation(), '.3f') + ")",
+                "Wins: " + format(self.rate(self.wins), '.1%') + ", losses: " + format(self.rate(self.losses), '.1%') +
+                ", pushes: " + format(self.rate(self.pushes), '.1%') + ", blackjacks: " +
+                format(self.rate(self.blackjacks), '.1%'),
+                "Largest drawdown: " + str(self.maxDrawdown)]
@@ -0,0 +1,209 @@
+"""
+Basic strategy and Hi-Lo deviation tables for the rules class Game plays by, built once and kept on disk.
+
+A table file holds the move for every hand (hard total and whether it holds an ace) against every dealer upcard,
+once for every true count bucket (see stats.true_count_bucket), bucket 0 being basic strategy.
+The moves are worked out with analysis.strategy_table on a card-shoe tilted to each true count.
+Every file is named after a hash of the rules and the amount of decks, so a change to the rules never reads an old table,
+and it is memory-mapped when loaded, so a lookup is a single index into the mapped file and loading costs no computation.
+
+Build every table for the amounts of decks ask_num_decks allows ahead of time with:
+    python tables.py
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import analysis
+from stats import MAX_BUCKET
+
+RULES = {
+    "dealerStandsOn": analysis.DEALER_STANDS_ON,  # The dealer stands on any 17, soft 17 included (see Game.dealer_draws)
+    "blackjackPays": "3:2",  # See Person.pay_player
+    "tiesLose": True,  # See Game.showdown
+    "dealerPeeks": True,  # The round ends at once when the dealer has blackjack (see Game.first_check)
+    "countSystem": "Hi-Lo",  # The count the deviations are for
+}
+VERSION = 1  # Raised when the way the tables are built changes, so old files are built again
+MIN_DECKS = 1  # The amounts of decks main builds tables for, the ones ask_num_decks allows
+MAX_DECKS = 15
+MAGIC = b'BJTABL01'
+HEADER = struct.Struct('<8s16sBB')  # MAGIC, the rules key, the amount of decks, MAX_BUCKET
+BUCKETS = 2 * MAX_BUCKET + 1  # The true count buckets, from -MAX_BUCKET up to and including MAX_BUCKET
+CELLS = 20 * 2 * 10  # Hard totals 2 up to and including 21, with and without an ace, against the 10 upcards
+STAND = 1  # The moves in a table, the answers AIPlayer.check_next_move gives
+HIT = 0
+LOW_VALUES = (2, 3, 4, 5, 6)  # The values Hi-Lo counts as +1
+HIGH_VALUES = (10, 10, 10, 10, 1)  # The values Hi-Lo counts as -1, a ten four times as often as an ace like in a deck
+CACHE_DIR = os.environ.get("BLACKJACK_TABLES", os.path.join(os.path.expanduser("~"), ".cache", "blackjack-tables"))
+
+loaded = {}  # Dictionary from the path of a table file to its StrategyTables, so every game shares one mapping
+
+
+def rules_key(decks):
+    """
+    :param decks: The amount of decks in the card-shoe
+    :return: The 16 byte hash of the rules, the amount of decks and VERSION
+    """
+    rules = dict(RULES, decks=decks, version=VERSION)
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).digest()[:16]
+
+
+def cell(hardTotal, hasAce, upcard):
+    """
+    :param hardTotal: The player's total with every ace counted as 1, 2 up to and including 21
+    :param hasAce: True if the player has an ace
+    :param upcard: The value of the dealer's visible card (1 for an ace)
+    :return: The place of the hand in a row of a table
+    """
+    return ((hardTotal - 2) * 2 + hasAce) * 10 + upcard - 1
+
+
+def count_composition(decks, bucket):
+    """
+    Gives a full card-shoe tilted to a Hi-Lo true count, by taking out low cards for a positive count and high cards for a negative one.
+    The cards are taken out spread over the values, so the rest of the card-shoe stays like a full one.
+
+    :param decks: The amount of decks
+    :param bucket: The true count
+    :return: The composition (see the module analysis)
+    """
+    counts = list(analysis.full_composition(decks))
+    values = LOW_VALUES if bucket > 0 else HIGH_VALUES
+    taken = 0
+    index = 0
+    while taken < abs(bucket) * decks and any(counts[value - 1] for value in values):
+        value = values[index % len(values)]
+        if counts[value - 1]:
+            counts[value - 1] -= 1
+            taken += 1
+        index += 1
+    return tuple(counts)
+
+
+def build(decks):
+    """
+    Works out the moves of every true count bucket for the given amount of decks
+
+    :param decks: The amount of decks
+    :return: The moves, a row of CELLS bytes for every bucket from -MAX_BUCKET up
+    """
+    moves = bytearray([STAND]) * (BUCKETS * CELLS)
+    for row, bucket in enumerate(range(-MAX_BUCKET, MAX_BUCKET + 1)):
+        offset = row * CELLS
+        for (hardTotal, hasAce, upcard), (stand, hit) in analysis.strategy_table(count_composition(decks, bucket)).items():
+            moves[offset + cell(hardTotal, hasAce, upcard)] = HIT if hit > stand else STAND
+    return bytes(moves)
+
+
+class StrategyTables:
+    """
+    The tables of one amount of decks, read straight from the memory-mapped table file
+
+    :attribute decks: The amount of decks the tables are for
+    :attribute path: The path of the table file
+    :attribute mapped: The memory-mapped file
+    """
+
+    def __init__(self, path, decks):
+        """
+        Maps a table file
+
+        :param path: The path of the table file
+        :param decks: The amount of decks the file has to be for
+        """
+        with open(path, 'rb') as file:
+            self.mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mapped) != HEADER.size + BUCKETS * CELLS or \
+                HEADER.unpack_from(self.mapped) != (MAGIC, rules_key(decks), decks, MAX_BUCKET):
+            self.mapped.close()
+            raise ValueError(path + " does not hold the strategy tables of " + str(decks) + " decks")
+        self.decks = decks
+        self.path = path
+
+    def move(self, hardTotal, hasAce, upcard, bucket=0):
+        """
+        Looks up the move for a hand
+
+        :param hardTotal: The player's total with every ace counted as 1
+        :param hasAce: True if the player has an ace
+        :param upcard: The value of the dealer's visible card (1 for an ace)
+        :param bucket: The Hi-Lo true count bucket, 0 for basic strategy
+        :return: STAND or HIT
+        """
+        return self.mapped[HEADER.size + (bucket + MAX_BUCKET) * CELLS + ((hardTotal - 2) * 2 + hasAce) * 10 + upcard - 1]
+
+    def close(self):
+        """
+        Unmaps the file
+        """
+        loaded.pop(self.path, None)
+        self.mapped.close()
+
+
+def path_of(decks, cacheDir=None):
+    """
+    :param decks: The amount of decks
+    :param cacheDir: The directory of the table files, CACHE_DIR when not given
+    :return: The path of the table file of the current rules and the given amount of decks
+    """
+    return os.path.join(cacheDir or CACHE_DIR, "strategy-" + str(decks) + "-" + rules_key(decks).hex() + ".bin")
+
+
+def save(decks, cacheDir=None):
+    """
+    Builds the tables of the given amount of decks and writes them to their table file.
+    The file is written next to its place first and then put there, so two processes building it at once never read half a file.
+
+    :param decks: The amount of decks
+    :param cacheDir: The directory of the table files, CACHE_DIR when not given
+    :return: The path of the table file
+    """
+    path = path_of(decks, cacheDir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = path + "." + str(os.getpid()) + ".tmp"
+    with open(temporary, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, rules_key(decks), decks, MAX_BUCKET))
+        file.write(build(decks))
+    os.replace(temporary, path)
+    return path
+
+
+def load(decks, cacheDir=None):
+    """
+    Gives the tables of the given amount of decks, building them only when there is no table file for the current rules yet.
+    Games call this through Game.load_tables before they play, never in the middle of a round.
+
+    :param decks: The amount of decks
+    :param cacheDir: The directory of the table files, CACHE_DIR when not given
+    :return: The StrategyTables
+    """
+    path = path_of(decks, cacheDir)
+    if path not in loaded:
+        try:
+            loaded[path] = StrategyTables(path, decks)
+        except (OSError, ValueError):
+            loaded[path] = StrategyTables(save(decks, cacheDir), decks)
+    return loaded[path]
+
+
+def main(arguments=None):
+    """
+    Builds the table files from the command line
+
+    :param arguments: The command line arguments, sys.argv when not given
+    """
+    parser = argparse.ArgumentParser(description="Build the cached strategy and deviation tables")
+    parser.add_argument("--decks", type=int, nargs="+", default=range(MIN_DECKS, MAX_DECKS + 1),
+                        help="amounts of decks to build tables for, all that ask_num_decks allows when not given")
+    parser.add_argument("--cache-dir", help="directory of the table files, " + CACHE_DIR + " when not given")
+    options = parser.parse_args(arguments)
+    for decks in options.decks:
+        print(save(decks, options.cache_dir))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+
+import run
+
+
+class AISeatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.game = run.Game(run.AutoStrategy(), run.SilentOutput())
+        self.game.setup(2, 0, 1000, 8)
+        randomStream = random.Random(5)
+        self.AIs = [run.AIPlayer(str(number), randomStream.uniform(-5, 20), randomStream.randint(-5, 3),
+                                 randomStream.choice((1, 5, 25)), randomStream.randint(0, 3), seats=self.game.aiSeats)
+                    for number in range(50)]
+        cardShoe = self.game.cardShoe
+        cardShoe.draw(randomStream.randint(0, 200))
+        for AI in self.AIs:
+            AI.hand.add_cards(cardShoe.draw(randomStream.randint(2, 3)))
+            AI.leaveCounter = randomStream.randint(0, 3)
+
+    def test_batched_decisions_match_single_decisions(self):
+        aiSeats = self.game.aiSeats
+        seats = self.game.seats_of(self.AIs)
+        cardShoe = self.game.cardShoe
+        self.assertEqual(aiSeats.bet_sizes(seats, cardShoe), [AI.check_bet_size(cardShoe) for AI in self.AIs])
+        self.assertEqual(aiSeats.stand_flags(seats), [AI.check_next_move() for AI in self.AIs])
+        self.assertEqual(aiSeats.leave_flags(seats), [AI.check_leave() for AI in self.AIs])
+        self.assertEqual(aiSeats.stand_flags(seats),
+                         [int(AI.check_count() >= AI.risk + 17) for AI in self.AIs])
+
+    def test_fractional_accuracy_and_risk(self):
+        AI = run.AIPlayer("Bronn", 0.85, -1.5, 25, 4, seats=self.game.aiSeats)
+        self.assertEqual((AI.accuracy, AI.risk), (0.85, -1.5))
+
+    def test_unit_has_to_be_whole(self):
+        self.assertEqual(run.AIPlayer("Bronn", 0, 0, 25.0, 4).unit, 25)
+        with self.assertRaises(ValueError):
+            run.AIPlayer("Bronn", 0, 0, 2.5, 4)
+
+    def test_adopt_keeps_the_values(self):
+        AI = run.AIPlayer("Bronn", 3, -1, 10, 4)
+        AI.hand.add_cards(self.game.cardShoe.draw(2))
+        value = AI.check_count()
+        self.game.aiSeats.adopt(AI)
+        self.assertIs(AI.seats, self.game.aiSeats)
+        self.assertEqual((AI.accuracy, AI.risk, AI.unit, AI.check_count()), (3, -1, 10, value))
+
+
+if __name__ == '__main__':
+    unittest.main()
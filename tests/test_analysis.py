@@ -0,0 +1,111 @@
+import unittest
+
+import analysis
+
+SMALL = (2, 1, 1, 1, 1, 1, 1, 1, 1, 4)  # A few cards of every value, small enough to follow every order of drawing
+
+
+def total(cards):
+    value = sum(cards)
+    return value + 10 if 1 in cards and value <= 11 else value
+
+
+def brute_dealer(cards, composition, peeked=False):
+    """
+    Follows every card the dealer can draw without any caching, the hidden card first
+    """
+    outcomes = [0.0] * 6
+    value = total(cards)
+    if value > 21 or (value < 17 and sum(composition) == 0):
+        outcomes[analysis.BUST] = 1.0
+        return outcomes
+    if value >= 17:
+        outcomes[value - 17] = 1.0
+        return outcomes
+    candidates = [index for index, count in enumerate(composition) if count]
+    if peeked and len(cards) == 1:
+        candidates = [index for index in candidates if total(cards + [index + 1]) != 21] or candidates
+    remaining = sum(composition[index] for index in candidates)
+    for index in candidates:
+        rest = list(composition)
+        rest[index] -= 1
+        for outcome, chance in enumerate(brute_dealer(cards + [index + 1], tuple(rest))):
+            outcomes[outcome] += composition[index] / remaining * chance
+    return outcomes
+
+
+def brute_hand(cards, upcard, composition):
+    """
+    The best expected value of a hand when every card the player can draw is followed, like hand_evs without a depth
+    """
+    value = total(cards)
+    if value > 21:
+        return -1.0, -1.0
+    dealer = brute_dealer([upcard], composition, True)
+    win = dealer[analysis.BUST] + sum(dealer[:max(min(value - 17, 5), 0)])
+    stand = 2 * win - 1
+    remaining = sum(composition)
+    if remaining == 0:
+        return stand, stand
+    hit = 0.0
+    for index, count in enumerate(composition):
+        if count:
+            rest = list(composition)
+            rest[index] -= 1
+            hit += count / remaining * max(brute_hand(cards + [index + 1], upcard, tuple(rest)))
+    return stand, hit
+
+
+class DealerOutcomesTest(unittest.TestCase):
+
+    def test_chances_add_up_to_one(self):
+        for decks in (1, 6):
+            composition = analysis.full_composition(decks)
+            for upcard in range(1, 11):
+                for peeked in (False, True):
+                    outcomes = analysis.dealer_outcomes(upcard, analysis.remove_cards(composition, upcard), peeked)
+                    self.assertAlmostEqual(sum(outcomes), 1.0, 12)
+
+    def test_matches_enumeration(self):
+        for upcard in range(1, 11):
+            for peeked in (False, True):
+                composition = analysis.remove_cards(SMALL, upcard)
+                expected = brute_dealer([upcard], composition, peeked)
+                for outcome, chance in zip(analysis.dealer_outcomes(upcard, composition, peeked), expected):
+                    self.assertAlmostEqual(outcome, chance, 12)
+
+    def test_dealer_stands_on_soft_17(self):
+        outcomes = analysis.dealer_draw(7, True, analysis.full_composition(1))
+        self.assertEqual(outcomes, (1.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+
+
+class HandEvsTest(unittest.TestCase):
+
+    def test_exact_evs_match_enumeration(self):
+        for cards, upcard in (([10, 2], 4), ([1, 5], 10), ([9, 7], 10), ([3, 2], 6)):
+            composition = analysis.remove_cards(SMALL, upcard, *cards)
+            stand, hit = analysis.hand_evs(sum(cards), 1 in cards, upcard, composition, True)
+            expectedStand, expectedHit = brute_hand(cards, upcard, composition)
+            self.assertAlmostEqual(stand, expectedStand, 12)
+            self.assertAlmostEqual(hit, expectedHit, 12)
+
+    def test_depth(self):
+        composition = analysis.remove_cards(analysis.full_composition(1), 10, 6, 10)
+        table = analysis.upcard_table(10, composition)
+        self.assertEqual(analysis.hand_evs(16, False, 10, composition, True, 0), table[(16, False)])
+        exact = analysis.hand_evs(16, False, 10, SMALL, True)
+        self.assertEqual(analysis.hand_evs(16, False, 10, SMALL, True, sum(SMALL)), exact)
+        stand, hit = analysis.hand_evs(16, False, 10, composition, True, analysis.PERFECT_PLAY_DEPTH)
+        self.assertEqual(stand, table[(16, False)][0])  # Standing never depends on the depth
+        self.assertAlmostEqual(hit, table[(16, False)][1], 1)
+
+    def test_basic_strategy(self):
+        composition = analysis.full_composition(6)
+        for hardTotal, hasAce, upcard, hit in ((11, False, 6, True), (20, False, 10, False), (12, False, 5, False),
+                                               (13, False, 10, True), (10, True, 6, False), (5, True, 6, True)):
+            cards = analysis.remove_cards(composition, upcard)
+            self.assertEqual(analysis.should_hit(hardTotal, hasAce, upcard, cards), hit, (hardTotal, hasAce, upcard))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import random
+import unittest
+
+import run
+
+
+def recount(codes):
+    counts = [0] * 13
+    for code in codes:
+        counts[code >> 2] += 1
+    return counts
+
+
+class RankCountsTest(unittest.TestCase):
+
+    def test_rank_counts_match_a_recount(self):
+        for keepDiscard in (True, False):
+            cardShoe = run.CardShoe(keepDiscard, random.Random(1))
+            cardShoe.create_shoe(4)
+            randomStream = random.Random(2)
+            while cardShoe.len_cardshoe() > 10:
+                cardShoe.draw(randomStream.randint(1, 10))
+                left = cardShoe.shoeCodes[cardShoe.drawIndex:]
+                self.assertEqual(cardShoe.rankCounts, recount(left))
+                self.assertEqual(sum(cardShoe.rankCounts), cardShoe.len_cardshoe())
+                self.assertAlmostEqual(cardShoe.tens_density(), sum(recount(left)[8:12]) / len(left))
+                self.assertEqual(cardShoe.aces_remaining(), recount(left)[12])
+
+    def test_rank_counts_after_loading_and_adding(self):
+        cardShoe = run.CardShoe(True, random.Random(3))
+        cardShoe.load_shoe(run.FULL_DECK_CODES * 2)
+        cardShoe.draw(30)
+        cardShoe.create_shoe(1)
+        self.assertEqual(cardShoe.rankCounts, recount(cardShoe.shoeCodes[cardShoe.drawIndex:]))
+        self.assertEqual(cardShoe.composition(), (8 + 4 - recount(cardShoe.shoeCodes[:30])[12],) +
+                         tuple(cardShoe.rankCounts[:8]) + (sum(cardShoe.rankCounts[8:12]),))
+
+
+class DiscardTest(unittest.TestCase):
+
+    def test_counts_only_equals_full_tracking(self):
+        full = run.CardShoe(True, random.Random(4))
+        counted = run.CardShoe(False, random.Random(4))
+        randomStream = random.Random(5)
+        for decks in (6, 2):
+            full.create_shoe(decks)
+            counted.create_shoe(decks)
+            while full.len_cardshoe() > 10:
+                amount = randomStream.randint(1, 10)
+                self.assertEqual(bytes(full.draw(amount)), bytes(counted.draw(amount)))
+                self.assertEqual(counted.discard_counts(), recount(full.shoeCodes[:full.drawIndex]))
+                self.assertEqual(counted.rankCounts, full.rankCounts)
+                self.assertEqual(counted.running_counts(), full.running_counts())
+                self.assertEqual(counted.len_cardshoe(), full.len_cardshoe())
+                self.assertLessEqual(counted.drawIndex, run.DISCARD_TRIM + 10)
+        self.assertEqual(full.discard_counts(), counted.discard_counts())
+
+    def test_blank_shoe_clears_the_tally(self):
+        cardShoe = run.CardShoe(False, random.Random(6))
+        cardShoe.create_shoe(2)
+        cardShoe.draw(80)
+        cardShoe.blank_shoe()
+        self.assertEqual(cardShoe.discard_counts(), [0] * 13)
+
+    def test_games_play_the_same_either_way(self):
+        outcomes = []
+        for keepDiscard in (True, False):
+            game = run.Game(run.AutoStrategy(maxRounds=100), run.SilentOutput(), seed=9)
+            game.cardShoe.keepDiscard = keepDiscard
+            game.setup(2, 3, 1000, 2)
+            game.fill_with_ai()
+            for _ in range(100):
+                game.round()
+            outcomes.append(([player.money for player in game.listPlayers], game.cardShoe.running_counts()))
+        self.assertEqual(outcomes[0], outcomes[1])
+
+
+class SeedTest(unittest.TestCase):
+
+    def test_derive_seed_is_stable(self):
+        self.assertEqual(run.derive_seed(1, "shoe"), run.derive_seed(1, "shoe"))
+        self.assertEqual(run.derive_seed(0, "table"), 3638479510019431291)
+        self.assertNotEqual(run.derive_seed(1, "shoe"), run.derive_seed(1, "table"))
+        self.assertNotEqual(run.derive_seed(1, "shoe"), run.derive_seed(2, "shoe"))
+        self.assertLess(run.derive_seed(1, "shoe", 3), 2 ** 64)
+
+    def test_same_seed_same_game(self):
+        results = []
+        for seed in (21, 21, 22):
+            game = run.Game(run.AutoStrategy(maxRounds=100), run.SilentOutput(), seed=seed)
+            game.setup(2, 2, 1000, 4)
+            game.fill_with_ai()
+            for _ in range(100):
+                game.round()
+            self.assertEqual(game.roundsPlayed, 100)
+            results.append(([player.money for player in game.listPlayers],
+                            [(AI.name, AI.money) for AI in game.artificialPlayers], bytes(game.cardShoe.shoeCodes)))
+        self.assertEqual(results[0], results[1])
+        self.assertNotEqual(results[0], results[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import checkpoint
+import counting
+import events
+import run
+
+
+def new_game(fill, money=10 ** 6):
+    game = run.Game(run.AutoStrategy(maxRounds=300), run.SilentOutput(), events.RingBufferSink(), seed=11)
+    game.setup(2, 2, money, 6)
+    fill(game)
+    return game
+
+
+def play(game, rounds):
+    for _ in range(rounds):
+        game.round()
+
+
+def state(game):
+    return ([(player.number, player.money, player.stats.net) for player in game.listPlayers],
+            [(AI.number, AI.money, AI.stats.net) for AI in game.artificialPlayers + game.listOfAI],
+            game.cardShoe.running_counts(), game.roundsPlayed)
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def assertContinuesIdentically(self, game, rounds=150):
+        restored = checkpoint.restore(checkpoint.snapshot(game), game.strategy, run.SilentOutput(),
+                                      events.RingBufferSink())
+        self.assertEqual(state(restored), state(game))
+        game.eventSink.buffer.clear()
+        play(game, rounds)
+        play(restored, rounds)
+        self.assertEqual(state(restored), state(game))
+        self.assertEqual(restored.eventSink.events(), game.eventSink.events())
+
+    def test_round_trip_continues_identically(self):
+        game = new_game(lambda game: game.fill_with_ai())
+        play(game, 150)
+        self.assertContinuesIdentically(game)
+
+    def test_round_trip_of_roster(self):
+        game = new_game(lambda game: game.fill_with_roster([
+            {"name": "Bronn", "accuracy": 0.85, "risk": -1.5, "unit": 25, "leaveCondition": 40}]))
+        play(game, 100)
+        self.assertContinuesIdentically(game)
+
+    def test_round_trip_of_large_table(self):
+        game = new_game(lambda game: game.fill_large_table(300), 10 ** 9)
+        play(game, 5)
+        self.assertContinuesIdentically(game, 20)
+
+    def test_save_and_load(self):
+        game = new_game(lambda game: game.fill_with_ai())
+        play(game, 50)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.bjc")
+            checkpoint.save(game, path)
+            loaded = checkpoint.load(path)
+        self.assertEqual(state(loaded), state(game))
+
+    def test_ai_outside_the_game_seats(self):
+        game = new_game(lambda game: game.fill_with_ai())
+        game.listOfAI.append(run.AIPlayer("Stranger", 1, 1, 10, 3))
+        with self.assertRaises(ValueError):
+            checkpoint.snapshot(game)
+        game.seats_of(game.listOfAI)
+        self.assertEqual(state(checkpoint.restore(checkpoint.snapshot(game))), state(game))
+
+    def test_other_count_systems(self):
+        game = new_game(lambda game: None)
+        play(game, 3)
+        data = checkpoint.snapshot(game)
+        with mock.patch.object(counting, "compiled", lambda: counting.CountTable((counting.HI_LO,))):
+            with self.assertRaisesRegex(ValueError, "registered, not Hi-Lo$"):
+                checkpoint.restore(data)
+
+    def test_not_a_checkpoint(self):
+        with self.assertRaises(ValueError):
+            checkpoint.restore(b'BJHIST01' + bytes(64))
+
+
+if __name__ == '__main__':
+    unittest.main()
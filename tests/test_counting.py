@@ -0,0 +1,57 @@
+import random
+import unittest
+
+import counting
+import run
+
+
+def naive_count(system, codes):
+    return sum(system.tag((code >> 2) + 2) for code in codes)
+
+
+class CountTableTest(unittest.TestCase):
+
+    def test_packed_counts_match_naive_counts(self):
+        for keepDiscard in (True, False):
+            cardShoe = run.CardShoe(keepDiscard, random.Random(5))
+            cardShoe.create_shoe(6)
+            drawn = []
+            randomStream = random.Random(6)
+            while cardShoe.len_cardshoe() > 10:
+                drawn.extend(cardShoe.draw(randomStream.randint(1, 10)))
+                for system in counting.SYSTEMS:
+                    self.assertEqual(cardShoe.running_count(system.number), naive_count(system, drawn), system.name)
+            self.assertEqual(cardShoe.running_counts(),
+                             {system.name: naive_count(system, drawn) for system in counting.SYSTEMS})
+
+    def test_large_and_negative_tags_stay_in_their_field(self):
+        low = counting.CountSystem("Low", (-255,) * 13)
+        high = counting.CountSystem("High", (255,) * 12 + (-255,))
+        table = counting.CountTable((low, counting.HALVES, high))
+        codes = [random.Random(8).randrange(52) for _ in range(5000)]
+        packed = sum(table.packedByCode[code] for code in codes)
+        for number, system in enumerate(table.systems):
+            self.assertEqual(table.value(packed, len(codes), number), naive_count(system, codes), system.name)
+
+    def test_halves_keep_their_half(self):
+        table = counting.CountTable((counting.HALVES,))
+        two = 0  # The code of a two
+        self.assertEqual(table.value(table.packedByCode[two], 1, 0), 0.5)
+        self.assertEqual(table.value(table.packedByCode[two] * 2, 2, 0), 1)
+
+    def test_invalid_systems(self):
+        with self.assertRaises(ValueError):
+            counting.CountSystem("Short", (1,) * 12)
+        with self.assertRaises(ValueError):
+            counting.CountSystem("Thirds", (1 / 3,) * 13, scale=2)
+        with self.assertRaises(ValueError):
+            counting.CountSystem("Huge", (256,) * 13)
+
+    def test_system_named(self):
+        self.assertIs(counting.system_named("hi-lo"), counting.HI_LO)
+        with self.assertRaises(KeyError):
+            counting.system_named("Nonexistent")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+import events
+import history
+import run
+
+ROSTER = [{"name": "Bronn", "accuracy": 0.85, "risk": -1, "unit": 25, "leaveCondition": 4},
+          {"name": "Podrick", "accuracy": 3, "risk": 0, "unit": 10, "leaveCondition": 2}]
+
+
+class ReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "game.bjh")
+
+    def record(self, fill, rounds=200, money=1000):
+        game = run.Game(run.AutoStrategy(maxRounds=rounds), run.SilentOutput(), history.HistorySink(self.path), seed=4)
+        game.setup(2, 2, money, 6)
+        fill(game)
+        game.run()
+        game.eventSink.close()
+        return game
+
+    def test_replay_of_premades(self):
+        self.record(lambda game: game.fill_with_ai())
+        self.assertTrue(history.replay(self.path))
+
+    def test_replay_without_ai(self):
+        self.record(lambda game: None)
+        self.assertTrue(history.replay(self.path))
+
+    def test_replay_of_roster(self):
+        self.record(lambda game: game.fill_with_roster(ROSTER))
+        self.assertTrue(history.replay(self.path))
+
+    def test_replay_of_large_table(self):
+        game = self.record(lambda game: game.fill_large_table(100), 20, 10 ** 9)
+        self.assertGreater(game.startingDecks, 6)
+        self.assertTrue(history.replay(self.path))
+
+    def test_records_read_back(self):
+        self.record(lambda game: game.fill_large_table(40000), 1, 10 ** 9)
+        with history.HistoryReader(self.path) as reader:
+            seats = [event.seat for event in reader if event.kind == events.AI_JOIN]
+        self.assertEqual(len(seats), 40000)
+        self.assertEqual(min(seats), -40000)
+
+    def test_seats_beyond_16_bits(self):
+        sink = history.HistorySink(self.path)
+        sink.emit(events.AI_JOIN, 1, -40000, 7)
+        sink.close()
+        with history.HistoryReader(self.path) as reader:
+            self.assertEqual([(event.seat, event.value) for event in reader], [(-40000, 7)])
+
+    def test_close_during_iteration(self):
+        self.record(lambda game: game.fill_with_ai(), 5)
+        reader = history.HistoryReader(self.path)
+        records = iter(reader)
+        shuffled = next(event for event in records if event.kind == events.RESHUFFLE)
+        reader.close()
+        self.assertEqual(len(shuffled.data), 6 * 52)
+
+    def test_changed_history_does_not_match(self):
+        self.record(lambda game: game.fill_with_ai())
+        with open(self.path, 'r+b') as file:
+            data = bytearray(file.read())
+            data[-1] ^= 1
+            file.seek(0)
+            file.write(data)
+        self.assertFalse(history.replay(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
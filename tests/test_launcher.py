@@ -0,0 +1,58 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import counting
+import launcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def output_of(arguments):
+    """
+    :param arguments: The command line arguments of the launcher
+    :return: What the launcher printed and its exit code
+    """
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        code = launcher.main(arguments)
+    return printed.getvalue(), code
+
+
+class LauncherTest(unittest.TestCase):
+
+    def test_simulate_compares_every_system(self):
+        printed, code = output_of(["simulate", "--shoes", "4", "--workers", "1", "--seed", "1", "--compare-systems"])
+        self.assertEqual(code, 0)
+        for system in counting.SYSTEMS:
+            self.assertIn("\n" + system.name + ":\n", printed)
+
+    def test_simulate_without_comparing(self):
+        printed, code = output_of(["simulate", "--shoes", "4", "--workers", "1", "--seed", "1"])
+        self.assertEqual(code, 0)
+        self.assertNotIn("Zen Count:", printed)
+        self.assertIn("Seed: 1\n", printed)
+
+    def test_config_and_flags(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"decks": 2, "seats": 3, "count": "KO"}, file)
+            options = launcher.parser_of().parse_args(["play", "--config", path, "--seats", "2"])
+            settings = launcher.settings_of(options)
+        self.assertEqual((settings["decks"], settings["seats"]), (2, 2))
+        self.assertEqual(settings["typeOfCount"], counting.KO.number)
+        self.assertEqual(settings["betSize"] % 2, 0)
+
+    def test_play_as_script(self):
+        played = subprocess.run([sys.executable, "launcher.py", "play", "--auto", "--rounds", "5", "--seed", "2",
+                                 "--quiet"], cwd=ROOT, check=True, capture_output=True, text=True)
+        self.assertIn("Played 5 rounds with seed 2", played.stdout)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+import run
+
+TEN, SIX, SEVEN, KING, ACE = 8, 4, 5, 11, 12  # Places of ranks in the card codes (see CARD_FACES)
+
+
+def stacked_shoe(decks, top):
+    """
+    :param decks: The amount of decks
+    :param top: The card codes that are drawn first, in order
+    :return: The codes of a card-shoe of full decks starting with the given codes
+    """
+    rest = bytearray(run.FULL_DECK_CODES * decks)
+    for code in top:
+        rest.remove(code)
+    return bytes(top) + bytes(rest)
+
+
+class FewerDecks(run.AutoStrategy):
+    """
+    Asks for a new card-shoe of a single deck whenever the card-shoe is replaced
+    """
+
+    def keep_decks(self, game):
+        return 0
+
+    def num_decks(self, game):
+        return 1
+
+
+class RoundTest(unittest.TestCase):
+
+    def test_every_blackjack_paid_and_every_broke_player_ejected(self):
+        game = run.Game(run.AutoStrategy(betSize=2, maxRounds=1), run.SilentOutput(), seed=1)
+        game.setup(2, 4, 1000, 6)
+        first, second, third, fourth = game.listPlayers
+        third.money = fourth.money = 2
+        game.cardShoe.load_shoe(stacked_shoe(6, [
+            TEN * 4, SEVEN * 4,  # The dealer stands on 17
+            ACE * 4, KING * 4, ACE * 4 + 1, KING * 4 + 1,  # Two blackjacks
+            TEN * 4 + 1, SIX * 4, TEN * 4 + 2, SIX * 4 + 1,  # Two sixteens that hit
+            TEN * 4 + 3, KING * 4 + 2]))  # and go bust
+        game.round()
+        self.assertEqual((first.money, second.money), (1003, 1003))
+        self.assertEqual((first.stats.blackjacks, second.stats.blackjacks), (1, 1))
+        self.assertEqual(game.listPlayers, [first, second])
+
+    def test_new_card_shoe_is_never_too_small(self):
+        game = run.Game(FewerDecks(maxRounds=40), run.SilentOutput(), seed=3)
+        game.setup(2, 1, 10 ** 9, 1)
+        game.fill_large_table(60)
+        game.run()
+        self.assertEqual(game.roundsPlayed, 40)
+        self.assertGreaterEqual(game.startingDecks, game.decks_needed())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+import server
+
+
+class ServerTest(unittest.TestCase):
+
+    def test_shutdown_closes_connections(self):
+        blackjack = server.BlackjackServer(timeout=1, seed=1)
+
+        async def scenario(path):
+            serving = asyncio.ensure_future(blackjack.serve(path=path))
+            while not os.path.exists(path):
+                await asyncio.sleep(0.01)
+            connections = [await asyncio.open_unix_connection(path) for _ in range(4)]
+            for number, (reader, writer) in enumerate(connections):
+                writer.write(b"join table" + str(number % 2).encode() + b"\n")
+            await asyncio.sleep(0.2)
+            serving.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await serving
+            for reader, writer in connections:
+                self.assertTrue((await asyncio.wait_for(reader.read(), 5)).startswith(b"Welcome"))
+                writer.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(scenario(os.path.join(directory, "blackjack.sock")))
+        self.assertEqual(blackjack.clients, set())
+        self.assertEqual(blackjack.tables, {})
+        self.assertTrue(blackjack.shoePool.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import queue
+import unittest
+
+import run
+from shuffle import ShoePool, ShuffleEngine
+
+
+class EmptyPool:
+    """
+    A pool that never has a card-shoe ready
+    """
+
+    decks = 6
+
+    def get(self):
+        return None
+
+
+class ShoePoolTest(unittest.TestCase):
+
+    def test_seeded_pool_gives_the_same_shoes(self):
+        with ShoePool(2, seed=3) as first, ShoePool(2, seed=3) as second:
+            self.assertEqual([first.get() for _ in range(6)], [second.get() for _ in range(6)])
+
+    def test_shoes_hold_full_decks(self):
+        codes = ShuffleEngine(1).shuffled(3)
+        self.assertEqual(sorted(codes), sorted(run.FULL_DECK_CODES * 3))
+
+    def test_pool_that_does_not_wait(self):
+        pool = ShoePool(1, size=1, wait=False)
+        pool.closed = True  # Stops the thread like close does, but keeps the pool from shuffling in get
+        while pool.thread.is_alive():
+            try:
+                pool.shoes.get_nowait()
+            except queue.Empty:
+                pass
+        while not pool.shoes.empty():
+            pool.shoes.get_nowait()
+        self.assertIsNone(pool.get())
+
+    def test_game_shuffles_when_pool_has_no_shoe(self):
+        game = run.Game(run.AutoStrategy(maxRounds=5), run.SilentOutput(), shoePool=EmptyPool())
+        game.setup(2, 1, 1000, 6)
+        game.new_shoe()
+        self.assertEqual(game.cardShoe.len_cardshoe(), 6 * 52)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+import simulation
+
+
+class SimulateTest(unittest.TestCase):
+
+    def test_workers_do_not_change_the_results(self):
+        config = simulation.SimulationConfig(seed=7)
+        single = simulation.simulate(config, 24, workers=1)
+        pooled = simulation.simulate(config, 24, workers=3)
+        self.assertEqual(single.shoesPlayed, pooled.shoesPlayed)
+        self.assertEqual(single.roundsPlayed, pooled.roundsPlayed)
+        self.assertEqual(single.handsPlayed, pooled.handsPlayed)
+        self.assertEqual(single.netUnits, pooled.netUnits)
+        self.assertEqual(single.countBuckets, pooled.countBuckets)
+        self.assertEqual(single.stats.net, pooled.stats.net)
+        self.assertAlmostEqual(single.stats.variance(), pooled.stats.variance())
+
+    def test_same_seed_same_results(self):
+        config = simulation.SimulationConfig(seed=3)
+        self.assertEqual(simulation.simulate(config, 10, workers=1).netUnits,
+                         simulation.simulate(config, 10, workers=1).netUnits)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from stats import HandStats
+
+INTEGER_FIELDS = ('hands', 'wins', 'losses', 'pushes', 'blackjacks', 'net', 'peak', 'trough', 'maxDrawdown')
+
+
+def hands(seed, amount):
+    randomStream = random.Random(seed)
+    return [(randomStream.choice((-20, -10, -10, 0, 10, 10, 25)), randomStream.randint(-3, 3), randomStream.random() < 0.05)
+            for _ in range(amount)]
+
+
+class HandStatsTest(unittest.TestCase):
+
+    def assertSameStats(self, merged, sequential):
+        for name in INTEGER_FIELDS:
+            self.assertEqual(getattr(merged, name), getattr(sequential, name), name)
+        self.assertAlmostEqual(merged.mean, sequential.mean)
+        self.assertAlmostEqual(merged.variance(), sequential.variance())
+        self.assertEqual(merged.countBuckets, sequential.countBuckets)
+
+    def test_merge_equals_adding_every_hand(self):
+        parts = [hands(seed, amount) for seed, amount in ((1, 300), (2, 1), (3, 0), (4, 700))]
+        sequential = HandStats()
+        merged = HandStats()
+        for part in parts:
+            partStats = HandStats()
+            for hand in part:
+                sequential.add_hand(*hand)
+                partStats.add_hand(*hand)
+            merged.merge(partStats)
+        self.assertSameStats(merged, sequential)
+
+    def test_drawdown_across_parts(self):
+        first = HandStats()
+        second = HandStats()
+        for result in (50, -10):
+            first.add_hand(result)
+        for result in (-30, 5):
+            second.add_hand(result)
+        first.merge(second)
+        self.assertEqual(first.peak, 50)
+        self.assertEqual(first.trough, 0)
+        self.assertEqual(first.maxDrawdown, 40)
+
+    def test_variance_of_sample(self):
+        handStats = HandStats()
+        for result in (10, -10, 10, -10):
+            handStats.add_hand(result)
+        self.assertAlmostEqual(handStats.variance(), 400 / 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import run
+import simulation
+import tables
+
+ROSTER = [{"name": "Table " + str(index), "accuracy": 10, "risk": 0, "unit": 2, "leaveCondition": run.NEVER_LEAVES,
+           "tablePlay": True} for index in range(3)]
+
+
+def play(game, rounds):
+    for _ in range(rounds):
+        game.round()
+
+
+class TablesTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patch = mock.patch.object(tables, "CACHE_DIR", directory.name)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(self.unload)
+        self.directory = directory.name
+
+    def unload(self):
+        for strategyTables in list(tables.loaded.values()):
+            strategyTables.close()
+
+    def new_game(self, decks=2):
+        game = run.Game(run.AutoStrategy(maxRounds=50), run.SilentOutput(), seed=3)
+        game.setup(2, 1, 10 ** 6, decks)
+        return game
+
+    def test_no_tables_without_table_play(self):
+        game = self.new_game()
+        game.fill_with_ai()
+        play(game, 50)
+        self.assertIsNone(game.strategyTables)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_loaded_before_play(self):
+        game = self.new_game()
+        game.fill_with_roster(ROSTER, True)
+        self.assertEqual(game.strategyTables.decks, 2)
+        with mock.patch.object(tables, "save", side_effect=AssertionError("built during play")):
+            play(game, 50)
+        self.assertEqual(game.roundsPlayed, 50)
+
+    def test_loaded_again_when_the_decks_change(self):
+        game = self.new_game(1)
+        game.fill_with_roster(ROSTER, True)
+        game.startingDecks = 3
+        game.new_shoe()
+        self.assertEqual(game.strategyTables.decks, 3)
+
+    def test_move_without_tables(self):
+        game = self.new_game()
+        AI = run.AIPlayer("Unloaded", 10, 0, 2, 4, seats=game.aiSeats, tablePlay=True)
+        game.artificialPlayers.append(AI)
+        game.begin_round()
+        with self.assertRaises(RuntimeError):
+            game.table_move(AI)
+
+    def test_table_file_is_reused(self):
+        path = tables.save(1)
+        self.assertEqual(tables.load(1).path, path)
+        with mock.patch.object(tables, "save", side_effect=AssertionError("built again")):
+            self.assertEqual(tables.load(1).move(11, False, 6), tables.HIT)
+            self.assertEqual(tables.load(1).move(20, False, 10), tables.STAND)
+
+    def test_simulation_builds_before_the_workers(self):
+        config = simulation.SimulationConfig(decks=2, seed=5, roster=ROSTER)
+        with mock.patch.object(simulation, "ProcessPoolExecutor", side_effect=AssertionError("no tables yet")):
+            with self.assertRaises(AssertionError):
+                simulation.simulate(config, 4, 2)
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(tables.path_of(2))])
+
+
+if __name__ == '__main__':
+    unittest.main()
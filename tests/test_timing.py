@@ -0,0 +1,30 @@
+import unittest
+
+import run
+import timing
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def test_summary_before_any_round(self):
+        self.assertEqual(len(timing.Profiler().summary()), 1)
+
+    def test_summary_without_round(self):
+        game = run.Game(run.AutoStrategy(maxRounds=10), run.SilentOutput())
+        game.setup(2, 1, 1000, 6)
+        profiler = timing.Profiler(((run.CardShoe, "draw"),))
+        with profiler:
+            game.run()
+        lines = profiler.summary()
+        self.assertNotIn("share", lines[0])
+        self.assertTrue(lines[1].startswith("CardShoe.draw"))
+
+    def test_methods_are_put_back(self):
+        draw = run.CardShoe.__dict__["draw"]
+        with timing.Profiler():
+            self.assertIsNot(run.CardShoe.__dict__["draw"], draw)
+        self.assertIs(run.CardShoe.__dict__["draw"], draw)
+
+
+if __name__ == '__main__':
+    unittest.main()
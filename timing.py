@@ -0,0 +1,193 @@
+"""
+Opt-in timing of the phases of Game.round and of the methods called most often.
+A Profiler replaces the timed methods with timing wrappers while it is installed and puts the originals back afterwards,
+so nothing is timed and nothing costs extra while no Profiler is installed.
+
+    profiler = Profiler()
+    with profiler:
+        game.run()
+    for line in profiler.summary():
+        print(line)
+"""
+import json
+import math
+import time
+
+import run
+
+# The timed methods: (class, method name), in the order they show up in the summary
+PHASES = ((run.Game, "round"), (run.Game, "check_shoe"), (run.Game, "random_ai"), (run.Game, "collect_bets"),
+          (run.Game, "ai_bet"), (run.Game, "deal_cards"), (run.Game, "first_check"), (run.Game, "action_time"),
+          (run.Game, "ai_play"), (run.Game, "dealer_draws"), (run.Game, "showdown"), (run.Game, "check_if_ai_leaves"),
+          (run.Game, "reset_hands"))
+HOT_METHODS = ((run.CardShoe, "draw"), (run.Person, "check_count"), (run.Person, "show_hand"),
+               (run.AISeats, "bet_sizes"), (run.AISeats, "stand_flags"))
+PERCENTILES = (50, 90, 99)  # The percentiles given in the summary
+BUCKET_RATIO = 1.05  # The durations are counted in buckets that are 5 percent apart, which is how exact the percentiles are
+LOG_RATIO = math.log(BUCKET_RATIO)
+
+
+class Timings:
+    """
+    The timings of a single method, kept in a fixed amount of memory.
+    The durations are counted in buckets growing by BUCKET_RATIO instead of being kept one by one, which is enough for percentiles.
+
+    :attribute calls: The amount of times the method was called
+    :attribute total: The total amount of nanoseconds spent in the method, including the methods it called
+    :attribute longest: The longest call in nanoseconds
+    :attribute buckets: Dictionary from bucket number to the amount of calls that took that long
+    """
+
+    def __init__(self):
+        """
+        Initializes timings without any calls
+        """
+        self.calls = 0
+        self.total = 0
+        self.longest = 0
+        self.buckets = {}
+
+    def add(self, nanoseconds):
+        """
+        Adds the duration of a single call
+
+        :param nanoseconds: How long the call took
+        """
+        self.calls += 1
+        self.total += nanoseconds
+        if nanoseconds > self.longest:
+            self.longest = nanoseconds
+        bucket = int(math.log(nanoseconds) / LOG_RATIO) if nanoseconds > 0 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, percent):
+        """
+        :param percent: The percentile, 50 for the median
+        :return: The duration in nanoseconds that the given percentage of the calls took at most, accurate to within BUCKET_RATIO
+        """
+        if self.calls == 0:
+            return 0
+        needed = self.calls * percent / 100
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= needed:
+                return min(BUCKET_RATIO ** (bucket + 1), self.longest)
+        return self.longest
+
+    def mean(self):
+        """
+        :return: The average call in nanoseconds
+        """
+        if self.calls == 0:
+            return 0
+        return self.total / self.calls
+
+
+class Profiler:
+    """
+    Times the phases of a round and the hot methods while it is installed, for every game at once
+
+    :attribute timings: Dictionary from "Class.method" to its Timings
+    :attribute originals: The (class, method name, original method) of every method replaced while installed
+    """
+
+    def __init__(self, methods=PHASES + HOT_METHODS):
+        """
+        Initializes a profiler that is not installed yet
+
+        :param methods: The (class, method name) of every method to time
+        """
+        self.methods = methods
+        self.timings = {cls.__name__ + "." + name: Timings() for cls, name in methods}
+        self.originals = []
+
+    def install(self):
+        """
+        Replaces every timed method with a wrapper that times it
+        """
+        if self.originals:
+            return
+        for cls, name in self.methods:
+            original = cls.__dict__[name]
+            self.originals.append((cls, name, original))
+            setattr(cls, name, self.wrap(original, self.timings[cls.__name__ + "." + name]))
+
+    def uninstall(self):
+        """
+        Puts the original methods back
+        """
+        for cls, name, original in reversed(self.originals):
+            setattr(cls, name, original)
+        self.originals = []
+
+    @staticmethod
+    def wrap(method, timings):
+        """
+        :param method: The method to time
+        :param timings: The Timings the durations are added to
+        :return: A method doing the same as the given one that adds how long every call took to timings
+        """
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timings.add(clock() - start)
+        timed.__name__ = method.__name__
+        timed.__doc__ = method.__doc__
+        return timed
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+    def to_dict(self):
+        """
+        :return: Dictionary from "Class.method" to its calls, total, mean, percentiles and longest call, durations in seconds
+        """
+        result = {}
+        for name, timings in self.timings.items():
+            entry = {"calls": timings.calls, "total": timings.total / 1e9, "mean": timings.mean() / 1e9}
+            for percent in PERCENTILES:
+                entry["p" + str(percent)] = timings.percentile(percent) / 1e9
+            entry["longest"] = timings.longest / 1e9
+            result[name] = entry
+        return result
+
+    def dump(self, path):
+        """
+        Writes the timings to a JSON file (see to_dict)
+
+        :param path: The path of the file
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def summary(self):
+        """
+        Describes the timings as a table, every time in microseconds.
+        The share is the part of the time spent in Game.round, phases include the hot methods they call.
+        It is left out when Game.round is not timed or has not been called yet.
+
+        :return: A list of lines
+        """
+        roundTimings = self.timings.get("Game.round")
+        roundTotal = roundTimings.total if roundTimings is not None else 0
+        lines = [format("method", "<24") + format("calls", ">10") + format("total ms", ">11") +
+                 (format("share", ">7") if roundTotal else "") + format("mean", ">9") +
+                 "".join(format("p" + str(percent), ">9") for percent in PERCENTILES) + format("max", ">9")]
+        for name, timings in self.timings.items():
+            if timings.calls == 0:
+                continue
+            lines.append(format(name, "<24") + format(timings.calls, ">10") + format(timings.total / 1e6, ">11.1f") +
+                         (format(timings.total / roundTotal, ">7.1%") if roundTotal else "") +
+                         format(timings.mean() / 1e3, ">9.1f") +
+                         "".join(format(timings.percentile(percent) / 1e3, ">9.1f") for percent in PERCENTILES) +
+                         format(timings.longest / 1e3, ">9.1f"))
+        return lines